@@ -0,0 +1,53 @@
+"""Test setup: make the Content/Python modules importable outside the editor.
+
+uat_scene_spec and uat_traffic are pure Python. uat_one_click and
+uat_scheduler import `unreal`, which only exists inside the editor; when it
+is missing a permissive stand-in module is installed so their pure helpers
+can be tested. Tests that need real engine behaviour patch what they call.
+
+Install tests/requirements.txt before running: numpy is optional for the
+editor, but the numpy/python backend parity tests skip without it, so CI
+must have it installed.
+"""
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Anything:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+
+class _Vector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+    def __add__(self, other):
+        return _Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __mul__(self, k):
+        return _Vector(self.x * k, self.y * k, self.z * k)
+
+
+class _LinearColor:
+    def __init__(self, r=0.0, g=0.0, b=0.0, a=1.0):
+        self.r, self.g, self.b, self.a = r, g, b, a
+
+
+try:
+    import unreal  # noqa: F401
+except ImportError:
+    fake = types.ModuleType("unreal")
+    fake.Vector = _Vector
+    fake.LinearColor = _LinearColor
+    fake.__getattr__ = lambda name: _Anything()
+    sys.modules["unreal"] = fake
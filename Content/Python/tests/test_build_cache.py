@@ -0,0 +1,60 @@
+import os
+
+import uat_one_click as uoc
+
+
+def test_code_hash_reads_only_the_spec_compiler(monkeypatch):
+    opened = []
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.path.basename(path))
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(uoc, "open", tracking_open, raising=False)
+    uoc._build_code_hash()
+    assert opened == ["uat_scene_spec.py"]
+
+
+def test_code_version_bump_changes_the_build_key(monkeypatch):
+    spec = {"name": "Codex_Cache", "seed": 5}
+    before = uoc._level_build_record(spec, uoc._build_code_hash())
+    monkeypatch.setattr(uoc, "BUILD_CODE_VERSION", uoc.BUILD_CODE_VERSION + 1)
+    after = uoc._level_build_record(spec, uoc._build_code_hash())
+    assert before["spec_hash"] == after["spec_hash"]
+    assert before["build_key"] != after["build_key"]
+
+
+def test_tiled_build_computes_tiles_once(monkeypatch):
+    import uat_scene_spec
+
+    plan = {
+        "name": "Codex_Tiled",
+        "tiles": {"size": 1000.0, "stream_distance": 500.0},
+        "items": [
+            {"id": "props/0", "type": "mesh", "loc": [100.0, 100.0, 0.0], "scale": [1.0, 1.0, 1.0]},
+            {"id": "props/1", "type": "mesh", "loc": [1500.0, 100.0, 0.0], "scale": [1.0, 1.0, 1.0]},
+        ],
+    }
+    calls = []
+    real_plan_tiles = uat_scene_spec.plan_tiles
+    monkeypatch.setattr(uat_scene_spec, "plan_tiles", lambda p: calls.append(p["name"]) or real_plan_tiles(p))
+    received = []
+
+    def fake_create(name, plan, slot=(0.0, 1.0), tiles=None):
+        received.append(tiles)
+        return True
+        yield
+
+    level_library = type("EditorLevelLibrary", (), {"get_all_level_actors": staticmethod(lambda: [])})
+    monkeypatch.setattr(uoc.unreal, "EditorLevelLibrary", level_library, raising=False)
+    monkeypatch.setattr(uoc, "_create_level_steps", fake_create)
+    monkeypatch.setattr(uoc, "_save_build_manifest", lambda manifest: None)
+    manifest = {"levels": {}, "batches": {}}
+    steps = uoc._build_plan_tracked_steps(manifest, plan, {"build_key": "k"})
+    try:
+        next(steps)
+    except StopIteration as stop:
+        assert stop.value is True
+    assert calls == ["Codex_Tiled"]
+    assert received[0] is not None
+    assert set(manifest["levels"]["Codex_Tiled"]["tiles"]) == {tile["key"] for tile in received[0]}
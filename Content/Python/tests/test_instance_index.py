@@ -0,0 +1,19 @@
+import uat_one_click as uoc
+
+
+def test_version_1_index_is_upgraded_to_records():
+    old = {"/Game/Codex_levels/L.L": {"HISM_Cube_Base": ["ScifiTower_0", "ScifiTower_1"]}}
+    levels = uoc._upgrade_instance_index(old)
+    assert levels == {
+        "/Game/Codex_levels/L.L": {"HISM_Cube_Base": [{"label": "ScifiTower_0"}, {"label": "ScifiTower_1"}]}
+    }
+
+
+def test_current_index_is_read_from_levels():
+    records = [{"label": "Neon_Tower_1_2", "id": "towers/3"}]
+    data = {"version": uoc.INSTANCE_INDEX_VERSION, "levels": {"L": {"HISM_Cube": records}}}
+    assert uoc._upgrade_instance_index(data) == {"L": {"HISM_Cube": records}}
+
+
+def test_unreadable_index_is_empty():
+    assert uoc._upgrade_instance_index([]) == {}
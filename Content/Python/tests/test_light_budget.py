@@ -0,0 +1,72 @@
+import uat_one_click as uoc
+
+
+class _Light:
+    def __init__(self, intensity):
+        self.props = {"intensity": intensity, "cast_shadows": True, "attenuation_radius": 1000.0}
+        self.visible = True
+
+    def get_editor_property(self, name):
+        return self.props[name]
+
+    def set_editor_property(self, name, value):
+        self.props[name] = value
+
+    def is_visible(self):
+        return self.visible
+
+    def set_visibility(self, visible):
+        self.visible = visible
+
+
+class _Actor:
+    def __init__(self, label, path, tags=()):
+        self.label = label
+        self.path = path
+        self.tags = list(tags)
+
+    def get_actor_label(self):
+        return self.label
+
+    def get_path_name(self):
+        return self.path
+
+    def get_actor_location(self):
+        return uoc.unreal.Vector()
+
+
+def _patch(monkeypatch, tmp_path, lights):
+    monkeypatch.setattr(uoc, "automation_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(uoc, "_current_level_key", lambda: "/Game/L.L")
+    monkeypatch.setattr(uoc, "_light_movers", lambda: {})
+    monkeypatch.setattr(uoc, "_local_lights", lambda: lights)
+
+
+def test_duplicate_labels_restore_their_own_state(monkeypatch, tmp_path):
+    lights = [
+        (_Actor("CarLight_1", "/Game/L.L:PersistentLevel.PointLight_0"), _Light(500.0)),
+        (_Actor("CarLight_1", "/Game/L.L:PersistentLevel.PointLight_1"), _Light(2000.0)),
+        (_Actor("CarLight_1", "/Game/L.L:PersistentLevel.PointLight_2", [f"{uoc.PLAN_ID_TAG}cars/7"]), _Light(800.0)),
+    ]
+    _patch(monkeypatch, tmp_path, lights)
+    result = uoc.optimize_light_budget(max_per_cell=0, cell_size=0.0, mode="disable")
+    assert result["disable"] == 3
+    assert all(comp.props["intensity"] == 0.0 for _, comp in lights)
+    assert set(uoc._load_light_budget_state()["/Game/L.L"]) == {
+        "/Game/L.L:PersistentLevel.PointLight_0",
+        "/Game/L.L:PersistentLevel.PointLight_1",
+        f"{uoc.PLAN_ID_TAG}cars/7",
+    }
+
+    assert uoc.restore_light_budget() == 3
+    assert [comp.props["intensity"] for _, comp in lights] == [500.0, 2000.0, 800.0]
+    assert all(comp.visible for _, comp in lights)
+
+
+def test_label_keyed_state_still_restores(monkeypatch, tmp_path):
+    actor, comp = _Actor("Showcase_Light", "/Game/L.L:PersistentLevel.SpotLight_0"), _Light(0.0)
+    _patch(monkeypatch, tmp_path, [(actor, comp)])
+    old = {"intensity": 1500.0, "visible": True, "cast_shadows": True, "attenuation_radius": 900.0, "moving": False}
+    uoc._save_light_budget_state({"/Game/L.L": {"Showcase_Light": old}})
+    assert uoc.restore_light_budget() == 1
+    assert comp.props["intensity"] == 1500.0
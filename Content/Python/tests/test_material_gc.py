@@ -0,0 +1,72 @@
+import uat_one_click as uoc
+
+MAT = "/Game/UAT_Materials/"
+
+
+def test_cycle_between_dead_materials_is_collected():
+    graph = {
+        MAT + "M_A": [MAT + "M_B"],
+        MAT + "M_B": [MAT + "M_A"],
+    }
+    assert uoc._unreachable_materials(graph, roots=set()) == {MAT + "M_A", MAT + "M_B"}
+
+
+def test_cycle_reachable_from_root_is_kept():
+    graph = {
+        MAT + "M_A": [MAT + "M_B"],
+        MAT + "M_B": [MAT + "M_A"],
+        MAT + "M_Parent": [MAT + "M_A"],
+        MAT + "M_Dead": [],
+    }
+    assert uoc._unreachable_materials(graph, roots={MAT + "M_A"}) == {MAT + "M_Dead"}
+
+
+def test_reference_from_outside_generated_folder_is_a_root():
+    graph = {
+        MAT + "M_Used": ["/Game/Codex_levels/Codex_Neon"],
+        MAT + "M_Parent": [MAT + "M_Used"],
+        MAT + "M_Orphan": [],
+    }
+    assert uoc._unreachable_materials(graph, roots=set()) == {MAT + "M_Orphan"}
+
+
+def _patch_assets(monkeypatch, tmp_path, graph, level_materials, aliases):
+    deleted = []
+    asset_library = type("EditorAssetLibrary", (), {
+        "does_directory_exist": staticmethod(lambda path: True),
+        "list_assets": staticmethod(lambda path, recursive, include_folder: [f"{p}.{p.rsplit('/', 1)[1]}" for p in graph]),
+        "find_package_referencers_for_asset": staticmethod(lambda package, load: graph[package]),
+        "delete_asset": staticmethod(lambda package: deleted.append(package) or True),
+    })
+    registry = type("Registry", (), {"is_loading_assets": lambda self: False})()
+    helpers = type("AssetRegistryHelpers", (), {"get_asset_registry": staticmethod(lambda: registry)})
+    monkeypatch.setattr(uoc.unreal, "EditorAssetLibrary", asset_library, raising=False)
+    monkeypatch.setattr(uoc.unreal, "AssetRegistryHelpers", helpers, raising=False)
+    monkeypatch.setattr(uoc, "automation_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(uoc, "_materials_on_level_actors", lambda: set(level_materials))
+    monkeypatch.setattr(uoc, "_material_index", {"aliases": dict(aliases), "materials": {}})
+    return deleted
+
+
+def test_aliased_material_without_users_is_collected(monkeypatch, tmp_path):
+    graph = {
+        MAT + "M_UAT_Lit_v01": [],
+        MAT + "M_UAT_Lit_live": [],
+        MAT + "M_UAT_Lit_saved": ["/Game/Codex_levels/Codex_Scifi_Variant_02"],
+    }
+    aliases = {
+        "M_UAT_Scifi_Base_v01": MAT + "M_UAT_Lit_v01",
+        "M_UAT_Codex_Neon_hull": MAT + "M_UAT_Lit_live",
+        "M_UAT_Scifi_Base_v02": MAT + "M_UAT_Lit_saved",
+        "M_UAT_Scifi_Base_v03": MAT + "M_UAT_Lit_gone",
+    }
+    deleted = _patch_assets(monkeypatch, tmp_path, graph, [MAT + "M_UAT_Lit_live"], aliases)
+
+    report = uoc.collect_unused_materials(dry_run=True)
+    assert report["unreferenced"] == [MAT + "M_UAT_Lit_v01"]
+    assert report["stale_aliases"] == ["M_UAT_Scifi_Base_v01", "M_UAT_Scifi_Base_v03"]
+    assert deleted == []
+
+    report = uoc.collect_unused_materials(dry_run=False)
+    assert deleted == [MAT + "M_UAT_Lit_v01"]
+    assert sorted(uoc._material_index["aliases"]) == ["M_UAT_Codex_Neon_hull", "M_UAT_Scifi_Base_v02"]
@@ -0,0 +1,88 @@
+import math
+
+import pytest
+
+import uat_one_click as uoc
+
+LO, HI = -3600.0, 3600.0
+STEP = 1.0 / uoc.MOVE_SIM_HZ
+
+
+def _clip_steps(p, v, steps):
+    """Reference integrator of the unsliced tick: step, then reflect and clamp at the walls."""
+    for _ in range(steps):
+        p += v * STEP
+        if p < LO or p > HI:
+            v = -v
+            p = min(max(p, LO), HI)
+    return p, v
+
+
+def test_fold_bounce_matches_repeated_single_steps():
+    p, v = 100.0, 750.0
+    for _ in range(600):
+        p, v = uoc._fold_bounce(p, v, STEP, LO, HI)
+    once, v_once = uoc._fold_bounce(100.0, 750.0, 600 * STEP, LO, HI)
+    assert once == pytest.approx(p, abs=1e-6)
+    assert v_once == v
+
+
+def test_fold_bounce_tracks_the_clamping_tick():
+    p, v = 100.0, 750.0
+    steps = 600
+    clipped, v_clipped = _clip_steps(p, v, steps)
+    folded, v_folded = uoc._fold_bounce(p, v, steps * STEP, LO, HI)
+    bounces = math.ceil(abs(v) * steps * STEP / (HI - LO)) + 1
+    # The clamp drops at most one step of travel per bounce; folding is exact.
+    assert abs(folded - clipped) <= bounces * abs(v) * STEP
+    assert math.copysign(1.0, v_folded) == math.copysign(1.0, v_clipped)
+
+
+def _movers():
+    linear = uoc._Mover(object(), uoc.unreal.Vector(750.0, -420.0, 130.0))
+    linear.pos = linear.written = (100.0, -50.0, 500.0)
+    orbit = uoc._Mover(object(), uoc.unreal.Vector()).set_orbit(uoc.unreal.Vector(10.0, 20.0, 0.0), 300.0, 900.0, 0.5, 1.3)
+    orbit.pos = orbit.written = (0.0, 0.0, 900.0)
+    return [linear, orbit]
+
+
+def test_motion_arrays_advance_matches_repeated_single_steps(monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(uoc, "MOVE_JITTER_CHANCE", 0.0)
+    monkeypatch.setattr(uoc, "_move_time_accum", 0.0)
+    stepped = uoc._MotionArrays(_movers())
+    jumped = uoc._MotionArrays(_movers())
+    rows = np.arange(2)
+    for k in range(1, 301):
+        stepped.advance(rows, k * STEP)
+    jumped.advance(rows, 300 * STEP)
+    assert np.allclose(stepped.pos, jumped.pos, atol=1e-6)
+    assert np.array_equal(stepped.vel, jumped.vel)
+    # Each linear axis is the scalar fold of that axis.
+    bounds = [(-uoc._MOVE_BOUNDS.x, uoc._MOVE_BOUNDS.x), (-uoc._MOVE_BOUNDS.y, uoc._MOVE_BOUNDS.y), (uoc._MOVE_Z_MIN, uoc._MOVE_BOUNDS.z)]
+    for axis, (lo, hi) in enumerate(bounds):
+        p, v = uoc._fold_bounce(_movers()[0].pos[axis], (750.0, -420.0, 130.0)[axis], 300 * STEP, lo, hi)
+        assert jumped.pos[0, axis] == pytest.approx(p, abs=1e-6)
+        assert jumped.vel[0, axis] == v
+
+
+@pytest.mark.parametrize("count", [401, 1000, 4000, 20000])
+def test_slices_refresh_every_mover_at_the_minimum_rate(monkeypatch, count):
+    monkeypatch.setattr(uoc, "_move_slice_cursor", 0)
+    seen = set()
+    steps = 0
+    while len(seen) < count:
+        start, size = uoc._next_move_slice(count)
+        seen.update((start + i) % count for i in range(size))
+        steps += 1
+    assert steps <= uoc.MOVE_SIM_HZ / uoc.MOVE_SLICE_MIN_HZ
+
+
+def test_owed_steps_advance_as_many_slices(monkeypatch):
+    monkeypatch.setattr(uoc, "_move_slice_cursor", 0)
+    count = 20000
+    per_step = uoc._move_slice_size(count)
+    start, size = uoc._next_move_slice(count, steps=2)
+    assert (start, size) == (0, 2 * per_step)
+    assert uoc._next_move_slice(count)[0] == 2 * per_step
+    assert uoc._next_move_slice(1000, steps=uoc.MOVE_MAX_STEPS_PER_TICK)[1] == 1000
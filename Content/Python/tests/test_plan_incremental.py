@@ -0,0 +1,69 @@
+import uat_one_click as uoc
+import uat_scene_spec
+
+
+class _Actor:
+    def __init__(self, label, tags):
+        self.label = label
+        self.tags = tags
+
+    def get_actor_label(self):
+        return self.label
+
+
+class _ActorSubsystem:
+    def __init__(self):
+        self.destroyed = []
+
+    def destroy_actor(self, actor):
+        self.destroyed.append(actor)
+
+
+def _plan():
+    spec = {
+        "name": "Incremental",
+        "seed": 3,
+        "palette": {"hull": {"kind": "lit", "color": [0.4, 0.4, 0.5]}},
+        "generators": [
+            {"type": "scatter", "name": "props", "count": 4, "extent": [300.0, 300.0], "mesh": "cube", "material": "hull"},
+        ],
+    }
+    return uat_scene_spec.compile_spec(spec, backend="python")
+
+
+def _run(monkeypatch, actors):
+    subsystem = _ActorSubsystem()
+    spawned = []
+    level_library = type("EditorLevelLibrary", (), {"get_all_level_actors": staticmethod(lambda: actors)})
+    monkeypatch.setattr(uoc.unreal, "EditorLevelLibrary", level_library, raising=False)
+    monkeypatch.setattr(uoc, "actor_sub", lambda: subsystem)
+    monkeypatch.setattr(uoc, "_apply_plan_item", lambda item, *args: spawned.append(item["id"]))
+    monkeypatch.setattr(uoc, "_plan_context", lambda plan: {"meshes": {}, "materials": {}, "shared": {}})
+    return uoc.apply_plan_incremental(_plan()), spawned, subsystem.destroyed
+
+
+def test_instanced_level_falls_back_to_full_rebuild(monkeypatch):
+    actors = [
+        _Actor("Ground", [f"{uoc.PLAN_ID_TAG}ground", f"{uoc.PLAN_HASH_TAG}0"]),
+        _Actor("HISM_Cube_hull", [uoc.INSTANCED_ACTOR_TAG]),
+    ]
+    changed, spawned, destroyed = _run(monkeypatch, actors)
+    assert changed is None
+    assert spawned == [] and destroyed == []
+
+
+def test_untagged_hism_label_also_falls_back(monkeypatch):
+    actors = [
+        _Actor("Ground", [f"{uoc.PLAN_ID_TAG}ground", f"{uoc.PLAN_HASH_TAG}0"]),
+        _Actor("hism_cube_hull", []),
+    ]
+    changed, spawned, destroyed = _run(monkeypatch, actors)
+    assert changed is None
+    assert spawned == [] and destroyed == []
+
+
+def test_tagged_level_without_instances_is_diffed(monkeypatch):
+    actors = [_Actor("Ground", [f"{uoc.PLAN_ID_TAG}ground", f"{uoc.PLAN_HASH_TAG}0"])]
+    changed, spawned, destroyed = _run(monkeypatch, actors)
+    assert changed == len(spawned) + len(destroyed)
+    assert len(spawned) == 4
@@ -0,0 +1,54 @@
+import uat_one_click as uoc
+
+
+class _Package:
+    def __init__(self, name):
+        self.name = name
+
+    def get_name(self):
+        return self.name
+
+
+class _World:
+    def get_path_name(self):
+        return "/Game/Codex_levels/Current.Current"
+
+
+def _patch(monkeypatch, tmp_path, dirty):
+    events = []
+    level_library = type("EditorLevelLibrary", (), {
+        "get_editor_world": staticmethod(lambda: _World()),
+        "load_level": staticmethod(lambda path: events.append(("load", path)) or True),
+        "save_all_dirty_levels": staticmethod(lambda: events.append(("save",)) or True),
+    })
+    saving_utils = type("EditorLoadingAndSavingUtils", (), {
+        "get_dirty_map_packages": staticmethod(lambda: [_Package(name) for name in dirty]),
+    })
+    monkeypatch.setattr(uoc.unreal, "EditorLevelLibrary", level_library, raising=False)
+    monkeypatch.setattr(uoc.unreal, "EditorLoadingAndSavingUtils", saving_utils, raising=False)
+    monkeypatch.setattr(uoc, "automation_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(uoc, "stop_motion", lambda: events.append(("stop_motion",)))
+    monkeypatch.setattr(uoc, "_codex_level_paths", lambda: ["/Game/Codex_levels/A"])
+    monkeypatch.setattr(uoc, "_level_cost", lambda path: {
+        "level": path, "actors": 0, "draw_calls_estimate": 0, "mesh_material_pairs": 0, "dynamic_lights": 0,
+        "light_overlap_max": 0, "translucent_area_m2_total": 0.0, "moving_entities": 0,
+    })
+    return events
+
+
+def test_all_levels_refuses_while_a_level_is_dirty(monkeypatch, tmp_path):
+    events = _patch(monkeypatch, tmp_path, ["Current"])
+    assert uoc.scene_cost_report(all_levels=True) is None
+    assert events == []
+
+
+def test_all_levels_saves_and_stops_motion_before_switching(monkeypatch, tmp_path):
+    events = _patch(monkeypatch, tmp_path, ["Current"])
+    report = uoc.scene_cost_report(all_levels=True, save_dirty=True)
+    assert [entry["level"] for entry in report["levels"]] == ["/Game/Codex_levels/A"]
+    assert events == [
+        ("save",),
+        ("stop_motion",),
+        ("load", "/Game/Codex_levels/A"),
+        ("load", "/Game/Codex_levels/Current"),
+    ]
@@ -0,0 +1,76 @@
+import pytest
+
+import uat_scene_spec
+
+
+def _var_spec():
+    return {
+        "name": "Parity",
+        "seed": 7,
+        "vars": {"lift": 125.0, "turn": 45.0},
+        "palette": {"hull": {"kind": "lit", "color": [0.5, 0.5, 0.5]}},
+        "generators": [
+            {
+                "type": "scatter",
+                "name": "props",
+                "count": 12,
+                "extent": [500.0, 500.0],
+                "z": "$lift",
+                "rotation": {"yaw": "$turn"},
+                "mesh": "cube",
+                "material": "hull",
+            }
+        ],
+    }
+
+
+def _poses(plan):
+    return sorted(
+        (round(item["loc"][2], 3), round(item["rot"][1], 3))
+        for item in uat_scene_spec.iter_items(plan)
+        if item["type"] == "mesh"
+    )
+
+
+def test_spec_vars_match_across_backends():
+    pytest.importorskip("numpy")
+    spec = _var_spec()
+    assert uat_scene_spec.validate_spec(spec) == []
+    python_poses = _poses(uat_scene_spec.compile_spec(spec, backend="python"))
+    numpy_poses = _poses(uat_scene_spec.compile_spec(spec, backend="numpy"))
+    assert len(python_poses) == 12
+    assert python_poses == numpy_poses
+    assert all(z == 125.0 and yaw != 0.0 for z, yaw in numpy_poses)
+
+
+def _specs(count):
+    specs = []
+    for seed in range(count):
+        spec = _var_spec()
+        spec["name"] = f"Parity_{seed}"
+        spec["seed"] = seed
+        specs.append(spec)
+    return specs
+
+
+def test_pooled_plans_match_serial():
+    specs = _specs(3)
+    serial = [plan for _, plan in uat_scene_spec.compile_plans(specs, backend="python")]
+    messages = []
+    pooled = [
+        entry for entry in uat_scene_spec.compile_plans(specs, workers=2, backend="python", poll=0.01, log=messages.append)
+        if entry is not None
+    ]
+    assert messages == []
+    assert [index for index, _ in pooled] == [0, 1, 2]
+    assert [plan for _, plan in pooled] == serial
+
+
+def test_pool_start_failure_is_logged_and_compiles_serially():
+    specs = _specs(2)
+    messages = []
+    plans = list(uat_scene_spec.compile_plans(
+        specs, workers=2, executable="/nonexistent/python", backend="python", log=messages.append,
+    ))
+    assert [index for index, _ in plans] == [0, 1]
+    assert len(messages) == 1 and "serially" in messages[0]
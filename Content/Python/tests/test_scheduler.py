@@ -0,0 +1,100 @@
+import pytest
+
+import uat_scheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def spend(self, ms):
+        self.now += ms / 1000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(uat_scheduler, "_systems", {})
+    monkeypatch.setattr(uat_scheduler, "_order", [])
+    monkeypatch.setattr(uat_scheduler, "_tick_handle", None)
+    monkeypatch.setattr(uat_scheduler, "_frame_samples", uat_scheduler.collections.deque(maxlen=8))
+    fake = _Clock()
+    monkeypatch.setattr(uat_scheduler.time, "perf_counter", fake)
+    return fake
+
+
+def test_systems_run_in_priority_order(clock):
+    ran = []
+    uat_scheduler.register("late", lambda dt: ran.append("late"), priority=30)
+    uat_scheduler.register("early", lambda dt: ran.append("early"), priority=10)
+    uat_scheduler.register("middle", lambda dt: ran.append("middle"), priority=20)
+    uat_scheduler._tick(0.016)
+    assert ran == ["early", "middle", "late"]
+
+
+def test_hz_gating_carries_pending_time(clock):
+    elapsed = []
+    uat_scheduler.register("slow", elapsed.append, hz=10.0)
+    for _ in range(5):
+        uat_scheduler._tick(0.03)
+    # Runs once 0.1 s has accumulated and receives all of it; the rest carries on.
+    assert elapsed == [pytest.approx(0.12)]
+    uat_scheduler._tick(0.03)
+    assert elapsed == [pytest.approx(0.12)]
+    uat_scheduler._tick(0.05)
+    assert elapsed == [pytest.approx(0.12), pytest.approx(0.11)]
+
+
+def test_deferral_is_capped_and_passes_accumulated_delta(clock):
+    received = []
+    uat_scheduler.register("hog", lambda dt: clock.spend(uat_scheduler.FRAME_BUDGET_MS + 1.0), priority=0)
+    uat_scheduler.register("low", received.append, priority=50)
+    frames = uat_scheduler.MAX_DEFER_FRAMES + 1
+    for _ in range(frames):
+        uat_scheduler._tick(0.02)
+    assert received == [pytest.approx(0.02 * frames)]
+    stats = uat_scheduler.stats()["systems"]["low"]
+    assert stats["deferred"] == uat_scheduler.MAX_DEFER_FRAMES and stats["runs"] == 1
+
+
+def test_register_again_replaces_the_callback(clock):
+    ran = []
+    first = uat_scheduler.register("motion", lambda dt: ran.append("first"), priority=20)
+    second = uat_scheduler.register("motion", lambda dt: ran.append("second"), priority=5)
+    uat_scheduler._tick(0.016)
+    assert ran == ["second"]
+    assert first is second and second.priority == 5
+    assert len(uat_scheduler._order) == 1
+
+
+def test_system_is_disabled_after_consecutive_errors(clock):
+    calls = []
+
+    def broken(dt):
+        calls.append(dt)
+        raise RuntimeError("boom")
+
+    uat_scheduler.register("broken", broken)
+    for _ in range(uat_scheduler.MAX_CONSECUTIVE_ERRORS + 3):
+        uat_scheduler._tick(0.016)
+    assert len(calls) == uat_scheduler.MAX_CONSECUTIVE_ERRORS
+    entry = uat_scheduler.stats()["systems"]["broken"]
+    assert entry["enabled"] is False and entry["errors"] == uat_scheduler.MAX_CONSECUTIVE_ERRORS
+
+
+def test_unregister_during_tick_skips_the_removed_system(clock):
+    ran = []
+
+    def stopper(dt):
+        ran.append("stopper")
+        uat_scheduler.unregister("victim")
+        uat_scheduler.unregister("stopper")
+
+    uat_scheduler.register("stopper", stopper, priority=10)
+    uat_scheduler.register("victim", lambda dt: ran.append("victim"), priority=20)
+    uat_scheduler._tick(0.016)
+    assert ran == ["stopper"]
+    assert not uat_scheduler.is_registered("victim") and not uat_scheduler.is_registered("stopper")
+    assert uat_scheduler._tick_handle is None
@@ -0,0 +1,135 @@
+import math
+
+import uat_one_click as uoc
+import uat_traffic
+
+
+def _traffic():
+    lane = uat_traffic.Lane("Highway_0", uat_traffic.loop_points((0.0, 0.0, 0.0), (4000.0, 0.0, 0.0), (0.0, 200.0, 0.0)))
+    system = uat_traffic.Traffic(400.0)
+    system.add_lane(lane)
+    system.add_vehicle(0, "Car_0", 0.0, 600.0)
+    system.add_vehicle(0, "Drone_1", lane.length / 2.0, 1000.0, height=350.0)
+    return system, lane
+
+
+def test_loop_path_closes_on_its_start():
+    _, lane = _traffic()
+    path = lane.loop_path(1234.0, 48, height=10.0)
+    assert len(path) == 49
+    assert math.dist(path[0][:3], path[-1][:3]) < 1e-6
+    assert path[0][2] == lane.position_at(1234.0)[2] + 10.0
+    assert math.isclose(abs(path[-1][3] - path[0][3]), 360.0, abs_tol=1e-6)
+
+
+def test_loop_path_heading_follows_travel_on_both_carriageways():
+    _, lane = _traffic()
+    path = lane.loop_path(0.0, 64)
+    headings = []
+    for a, b in zip(path, path[1:]):
+        travel = math.degrees(math.atan2(b[1] - a[1], b[0] - a[0]))
+        assert abs(b[3] - a[3]) < 180.0
+        error = (a[3] - travel + 180.0) % 360.0 - 180.0
+        assert abs(error) < 45.0
+        headings.append(round(a[3] % 360.0))
+    # Out along +X on one side, back along -X on the other.
+    assert 0 in headings and 180 in headings
+
+
+def test_lap_seconds_uses_the_lane_mean_speed():
+    system, lane = _traffic()
+    assert math.isclose(system.lap_seconds(0), lane.length / 800.0)
+    system.add_lane(uat_traffic.Lane("Bridge_0", uat_traffic.loop_points((0.0, 0.0, 0.0), (100.0, 0.0, 0.0), (0.0, 50.0, 0.0))))
+    assert system.lap_seconds(1) == 0.0
+
+
+class _Actor:
+    def __init__(self, label):
+        self.label = label
+        self.tags = []
+
+
+def test_bake_motion_bakes_lane_vehicles_and_clears_traffic(monkeypatch):
+    system, lane = _traffic()
+    actors = {"Car_0": _Actor("Car_0"), "Drone_1": _Actor("Drone_1")}
+    baked = []
+
+    def fake_bake(lane, vehicles, lap):
+        baked.append((lane.name, [vehicle.key for vehicle, _ in vehicles], lap))
+        return len(vehicles)
+
+    monkeypatch.setattr(uoc, "_traffic", {"system": system, "actors": actors, "written": {}})
+    monkeypatch.setattr(uoc, "_moving_actors", [])
+    monkeypatch.setattr(uoc, "_rotating_cubes", [])
+    monkeypatch.setattr(uoc, "_bake_lane_sequence", fake_bake)
+    counts = uoc.bake_motion()
+    assert uoc._traffic is None
+    assert counts["lane_vehicles"] == 2 and counts["lanes"] == 1 and counts["failed"] == 0
+    assert baked == [("Highway_0", ["Car_0", "Drone_1"], system.lap_seconds(0))]
+
+
+class _Channel:
+    def __init__(self):
+        self.keys = []
+        self.default = None
+
+    def set_default(self, value):
+        self.default = value
+
+    def add_key(self, time, value, sub_frame=0.0, interpolation=None):
+        self.keys.append((time.value + sub_frame, value))
+
+
+class _Section:
+    def __init__(self):
+        self.channels = [_Channel() for _ in range(9)]
+
+    def set_range(self, start, end):
+        self.range = (start, end)
+
+    def get_all_channels(self):
+        return self.channels
+
+
+class _Sequence:
+    def __init__(self):
+        self.sections = {}
+
+    def add_possessable(self, actor):
+        sequence = self
+
+        class _Binding:
+            def add_track(self, track_class):
+                class _Track:
+                    def add_section(self):
+                        return sequence.sections.setdefault(actor.label, _Section())
+                return _Track()
+        return _Binding()
+
+
+class _Rotator:
+    roll = pitch = 0.0
+
+
+class _KeyedActor(_Actor):
+    def get_actor_rotation(self):
+        return _Rotator()
+
+    def get_actor_scale3d(self):
+        return uoc.unreal.Vector(2.0, 1.0, 1.0)
+
+
+def test_vehicle_track_keys_position_and_heading_over_the_lap(monkeypatch):
+    _, lane = _traffic()
+    frame_number = type("FrameNumber", (), {"__init__": lambda self, value: setattr(self, "value", value)})
+    monkeypatch.setattr(uoc.unreal, "FrameNumber", frame_number, raising=False)
+    sequence = _Sequence()
+    path = lane.loop_path(500.0, 32)
+    uoc._key_vehicle_track(sequence, _KeyedActor("Car_0"), path, 120)
+    channels = sequence.sections["Car_0"].channels
+    x_keys, yaw_keys = channels[0].keys, channels[5].keys
+    assert len(x_keys) == len(yaw_keys) == 33
+    assert x_keys[0] == (0.0, path[0][0])
+    assert math.isclose(x_keys[-1][0], 120.0)
+    assert [value for _, value in yaw_keys] == [key[3] + uoc.TRAFFIC_YAW_OFFSET for key in path]
+    assert channels[6].default == 2.0 and channels[5].default is None
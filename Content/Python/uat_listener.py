@@ -5,11 +5,16 @@ import socket
 import threading
 import queue
 
+import uat_scheduler
+
 _queue = queue.Queue()
 _shutdown = threading.Event()
 _server = None
 _thread = None
-_tick_handle = None
+
+# Queued messages are drained first each editor frame.
+TICK_PRIORITY = 0
+TICK_BUDGET_MS = 4.0
 
 
 def _log(msg):
@@ -81,6 +86,9 @@ def _tick(_delta_seconds):
             _handle_message(msg)
         except Exception as exc:
             unreal.log_error(f"[UAT] Listener error: {exc}")
+        if uat_scheduler.time_left() <= 0.0:
+            # Leave the rest of the queue for the next frame.
+            break
 
 
 def _listener_thread(host, port):
@@ -118,7 +126,7 @@ def _listener_thread(host, port):
 
 
 def start_listener(host="127.0.0.1", port=27777):
-    global _thread, _tick_handle
+    global _thread
 
     if _thread and _thread.is_alive():
         _log("Listener already running")
@@ -128,12 +136,11 @@ def start_listener(host="127.0.0.1", port=27777):
     _thread = threading.Thread(target=_listener_thread, args=(host, port), daemon=True)
     _thread.start()
 
-    if _tick_handle is None:
-        _tick_handle = unreal.register_slate_post_tick_callback(_tick)
+    uat_scheduler.register("listener", _tick, priority=TICK_PRIORITY, budget_ms=TICK_BUDGET_MS)
 
 
 def stop_listener():
-    global _thread, _tick_handle
+    global _thread
 
     _shutdown.set()
 
@@ -147,9 +154,7 @@ def stop_listener():
         _thread.join(timeout=1.0)
         _thread = None
 
-    if _tick_handle is not None:
-        unreal.unregister_slate_post_tick_callback(_tick_handle)
-        _tick_handle = None
+    uat_scheduler.unregister("listener")
 
     _log("Listener stopped")
 
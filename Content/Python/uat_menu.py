@@ -58,6 +58,14 @@ def build_menu():
         ("Write Log Marker", "Write marker to Saved/Automation/uat_script.log", "write_log_marker"),
         ("Snapshot Log", "Write Saved/Automation/uat_log_snapshot.txt", "snapshot_log"),
         ("Write Log Paths", "Emit Saved/Automation/uat_log_paths.txt", "write_log_paths"),
+        ("Optimize Render Cost", "Apply the per-category render profile (culling, shadows, collision, mobility) to the level", "optimize_render_cost"),
+        ("Optimize Light Budget", "Keep a few dynamic lights per grid cell, disable or demote the rest", "optimize_light_budget"),
+        ("Restore Light Budget", "Undo the light budget on the current level", "restore_light_budget"),
+        ("Scene Cost Report", "Write Saved/Automation/scene_cost_<ts>.json for the current level", "scene_cost_report"),
+        ("Build Traffic Lanes", "Put cars and drones on lane loops along the highways and bridges", "build_traffic_lanes"),
+        ("Bake Motion", "Move cars, drones, orbiting lights and rotating cubes with engine components instead of Python ticks", "bake_motion"),
+        ("Tick Stats", "Log per-system editor tick timings (avg/p95/max vs budget, deferrals, errors)", "tick_stats"),
+        ("Cancel Builds", "Stop running Codex/scifi level builds after their current chunk", "cancel_builds"),
     ]
 
     for label, tip, cmd in commands:
@@ -4,6 +4,16 @@ import os
 import time
 import random
 import math
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import uat_scene_spec
+import uat_scheduler
+import uat_traffic
 
 # ============================================================
 # CONFIG
@@ -17,11 +27,18 @@ LOG_SNAPSHOT_NAME = "uat_log_snapshot.txt"
 BLUE_NAME = "M_UAT_Blue"
 RED_NAME  = "M_UAT_Red"
 MATERIAL_PATH = "/Game/UAT_Materials"
+MATERIAL_INDEX_NAME = "uat_material_index.json"
+MATERIAL_GRAPH_VERSION = 1
+MATERIAL_HASH_LEN = 12
+MATERIAL_COLOR_STEPS = 255.0
 CODEX_LEVEL_DIR = "/Game/Codex_levels"
 CONVERT_TO_SPHERE = True
 PLANE_MESH_PATH = "/Engine/BasicShapes/Plane.Plane"
 SPHERE_MESH_PATH = "/Engine/BasicShapes/Sphere.Sphere"
 CUBE_MESH_PATH = "/Engine/BasicShapes/Cube.Cube"
+CYLINDER_MESH_PATH = "/Engine/BasicShapes/Cylinder.Cylinder"
+CONE_MESH_PATH = "/Engine/BasicShapes/Cone.Cone"
+ENGINE_SHAPE_PATHS = [PLANE_MESH_PATH, CUBE_MESH_PATH, SPHERE_MESH_PATH, CYLINDER_MESH_PATH, CONE_MESH_PATH]
 
 CREATE_TRIANGLES = False
 TRIANGLE_COUNT = 0
@@ -56,15 +73,238 @@ CUBE_ROTATION_RATE = unreal.Rotator(0.0, 45.0, 0.0)
 CUBE_ROTATE_IN_EDITOR = True
 CUBE_ROTATE_DEG_PER_SEC = 45.0
 
+# "materials" gives every accent/crowd colour its own material; "custom_data"
+# writes colour + emissive strength into custom primitive / per-instance data
+# read by one shared material so those meshes can batch and instance.
+COLOR_MODE = "materials"
+CUSTOM_DATA_COLOR_INDEX = 0
+CUSTOM_DATA_EMISSIVE_INDEX = 3
+CUSTOM_DATA_FLOATS = 4
+
+# "actors" spawns one StaticMeshActor per tower/strip/bridge/highway; "instanced"
+# groups them by (mesh, material) into HierarchicalInstancedStaticMeshComponents.
+SCIFI_BUILD_MODE = "actors"
+INSTANCED_ACTOR_TAG = "UAT_HISM"
+INSTANCE_INDEX_NAME = "uat_instance_index.json"
+INSTANCE_INDEX_VERSION = 2
+# merge_to_instances() never merges actors in these outliner categories/folders
+# (they move, or are moved by ticks after a restart re-registers them).
+MERGE_SKIP_CATEGORIES = ("Vehicles", "Drones", "FX_Lights", "Crowd")
+
+# Codex levels are described by JSON specs in Content/Python/uat_specs (see
+# uat_scene_spec.py). SCENE_SPEC is the spec built by the "build_scene_spec" command.
+CODEX_SPECS = [
+    "codex_desert",
+    "codex_forest",
+    "codex_neon",
+    "codex_snow",
+    "codex_volcano",
+    "codex_citygrid",
+    "codex_canyon",
+    "codex_skyislands",
+    "codex_checker",
+    "codex_ruins",
+    "codex_chromatic",
+    "codex_crystal",
+    "codex_industrial",
+]
+SCENE_SPEC = None
+
+# Worker processes used to compile scifi variant plans while the editor applies
+# finished ones. 0 compiles serially on the game thread.
+VARIANT_PLAN_WORKERS = 4
+# Blocking builds wait this long per step for the next worker plan, so the
+# progress dialog stays responsive and cancellable while workers compile.
+PLAN_POLL_SECONDS = 0.05
+
+# Actors spawned from a plan carry "UAT_ID:<item id>" and "UAT_HASH:<item hash>"
+# tags so a later build can diff the plan against the level instead of rebuilding.
+PLAN_ID_TAG = "UAT_ID:"
+PLAN_HASH_TAG = "UAT_HASH:"
+
+# Saved/Automation manifest of built levels (spec/seed/code hash, status, timing).
+# Batch builds skip levels whose build key is unchanged and resume after failures.
+BUILD_MANIFEST_NAME = "uat_build_manifest.json"
+# Part of every build key together with a hash of uat_scene_spec.py. This
+# script is edited before most runs (COMMAND, tuning constants), so it is not
+# hashed; bump this when a change here alters what a plan builds (spawning,
+# materials, instancing, tagging) to invalidate cached levels.
+BUILD_CODE_VERSION = 1
+
+# Plan builds run in chunks (ground, lighting, each generator, tower grids per
+# row, at most PLAN_CHUNK_SIZE items) and check for cancellation in between.
+# "blocking" runs behind a ScopedSlowTask dialog; "tick" queues the build as a
+# slate-tick job that spends up to BUILD_JOB_BUDGET_MS per editor frame.
+PLAN_CHUNK_SIZE = 64
+BUILD_JOB_MODE = "blocking"
+BUILD_JOB_BUDGET_MS = 25.0
+BUILD_CANCEL_FLAG_NAME = "uat_cancel_builds.flag"
+
+# Tiled builds: specs with a "tiles" section are split into grid-tile streaming
+# sub-levels under <level>_Tiles/, each with a LevelStreamingVolume covering its
+# bounds plus the stream distance. SCIFI_TILE_LEVELS tiles the scifi variants
+# too; build_scifi_city_tiled builds one style at SCIFI_CITY_AREA_SCALE x area.
+LEVEL_TILE_SIZE_CM = 6000.0
+LEVEL_TILE_STREAM_DISTANCE_CM = 8000.0
+SCIFI_TILE_LEVELS = False
+SCIFI_CITY_AREA_SCALE = 10.0
+SCIFI_CITY_STYLE = 0
+
+# spawn_batch() wraps each chunk of plan mesh actors in one editor transaction
+# (one undo step) and invalidates the viewports once at the end. Turn the
+# transaction off for very large builds where the undo buffer is not wanted.
+SPAWN_BATCH_TRANSACTION = True
+
+# _move_tick integrates positions, velocities, bounce bounds, jitter and orbits
+# as NumPy arrays in one step per tick and only pushes the final locations to
+# actors. "python" keeps the per-actor loop (also used when numpy is missing).
+MOVE_TICK_BACKEND = "numpy" if np is not None else "python"
+MOVE_JITTER_CHANCE = 0.02
+
+# Motion is simulated at a fixed MOVE_SIM_HZ from an accumulator (at most
+# MOVE_MAX_STEPS_PER_TICK steps per editor tick; a longer stall is dropped).
+# Locations are only written when an actor moved more than
+# MOVE_WRITE_EPSILON_CM since its last write and is not hidden in the editor
+# (re-checked every MOVE_HIDDEN_REFRESH_S). Writes/s are logged every
+# MOVE_STATS_INTERVAL_S.
+MOVE_SIM_HZ = 30.0
+MOVE_MAX_STEPS_PER_TICK = 4
+MOVE_WRITE_EPSILON_CM = 0.5
+MOVE_HIDDEN_REFRESH_S = 1.0
+MOVE_STATS_INTERVAL_S = 5.0
+
+# Above MOVE_SLICE_THRESHOLD movers a sim step no longer advances everyone:
+# it integrates and writes the next MOVE_SLICE_SIZE movers (round-robin) over
+# their own elapsed time since their last update, folding bounces exactly, so
+# the per-step cost stays flat as the population grows. The other movers hold
+# their last written position until their slice comes round; the slice grows
+# past MOVE_SLICE_SIZE as needed so every mover is still refreshed at least
+# MOVE_SLICE_MIN_HZ (engine movement components do not tick in the editor
+# world, so held movers cannot be extrapolated engine-side). A tick that owes
+# several sim steps advances that many slices.
+MOVE_SLICE_THRESHOLD = 400
+MOVE_SLICE_SIZE = 200
+MOVE_SLICE_MIN_HZ = 10.0
+
+# Moving lights animate on their own LIGHT_ANIM_HZ schedule from a sine lookup
+# table of LIGHT_WAVE_SAMPLES (a power of two). Intensity is pushed only when it
+# moved more than LIGHT_INTENSITY_EPSILON of the base intensity, colour only
+# when a channel moved more than LIGHT_COLOR_EPSILON since the last push.
+LIGHT_ANIM_HZ = 10.0
+LIGHT_WAVE_SAMPLES = 256
+LIGHT_INTENSITY_EPSILON = 0.03
+LIGHT_COLOR_EPSILON = 0.01
+
+# Every editor-frame callback runs as a uat_scheduler system (one Slate
+# callback for the listener and all of these), in priority order with its own
+# budget and optional rate. uat_scheduler.FRAME_BUDGET_MS caps the Python time
+# per frame; tick_stats logs rolling per-system timings.
+TICK_SYSTEMS = {
+    "build_jobs": {"priority": 10, "budget_ms": BUILD_JOB_BUDGET_MS},
+    "motion": {"priority": 20, "budget_ms": 4.0},
+    "lights": {"priority": 30, "budget_ms": 1.5, "hz": LIGHT_ANIM_HZ},
+    "rotate": {"priority": 40, "budget_ms": 0.5},
+}
+
+# bake_motion() replaces Python motion with engine movement components: bounce
+# paths are sampled for BAKE_MOTION_SECONDS (at most BAKE_MOTION_MAX_POINTS
+# control points) and ping-pong. BAKE_MOTION_AFTER_BUILD bakes plan levels
+# before they are saved. Components move actors in PIE/Simulate and at runtime.
+BAKE_MOTION_SECONDS = 60.0
+BAKE_MOTION_MAX_POINTS = 24
+# Lane traffic bakes into one looping Level Sequence per lane
+# (TRAFFIC_SEQUENCE_DIR/<level>/LS_Traffic_<deck>, auto-played by a
+# TrafficLane_<deck> LevelSequenceActor). Every vehicle's location and
+# heading are keyed every TRAFFIC_BAKE_KEY_CM of lane at TRAFFIC_BAKE_FPS;
+# a lane's vehicles share its mean speed so the current spacing holds.
+TRAFFIC_SEQUENCE_DIR = "/Game/UAT_Traffic"
+TRAFFIC_BAKE_KEY_CM = 250.0
+TRAFFIC_BAKE_FPS = 30
+BAKE_MOTION_AFTER_BUILD = False
+BAKED_MOTION_TAG = "UAT_BAKED_MOTION"
+
+# build_traffic_lanes(): every highway/bridge plane becomes a closed two-way
+# lane loop (carriageways TRAFFIC_LANE_OFFSET_FRACTION of the deck width off
+# its axis) and cars/drones move along lanes at their mover speed, clamped to
+# TRAFFIC_SPEED_RANGE, at least TRAFFIC_MIN_GAP_CM apart. Car planes are long
+# along local Y, hence TRAFFIC_YAW_OFFSET.
+TRAFFIC_LANE_OFFSET_FRACTION = 0.25
+TRAFFIC_LANE_HEIGHT_CM = 40.0
+TRAFFIC_DRONE_HEIGHT_CM = 350.0
+TRAFFIC_MIN_GAP_CM = 400.0
+TRAFFIC_SAMPLE_CM = 25.0
+TRAFFIC_SPEED_RANGE = (500.0, 1200.0)
+TRAFFIC_YAW_OFFSET = -90.0
+
+# _Mover.kind bits: how an entry moves, and whether it also animates a light.
+# MOVE_LIGHT alone is a light that only animates (e.g. attached to a vehicle).
+MOVE_LINEAR = 1
+MOVE_ORBIT = 2
+MOVE_LIGHT = 4
+
+# Render-cost pass (optimize_render_cost) run after each Codex level build.
+# Keyed by outliner_category(); omitted categories and keys are left alone
+# (Environment keeps the sun's shadows and mobility). cull_distance is in cm
+# (0 = never cull), collision False turns it off for decor, mobility is
+# static/stationary/movable and translucency_sort_priority orders overlapping
+# translucent sheets (lower draws first).
+RENDER_OPTIMIZE_AFTER_BUILD = True
+RENDER_PROFILE = {
+    "Buildings": {"cull_distance": 45000.0, "cast_shadow": True, "mobility": "static"},
+    "Accents": {"cull_distance": 20000.0, "cast_shadow": False, "collision": False, "mobility": "static"},
+    "Bridges_And_Highways": {"cull_distance": 30000.0, "cast_shadow": True, "mobility": "static"},
+    "Signs_And_Billboards": {"cull_distance": 15000.0, "cast_shadow": False, "collision": False, "mobility": "static"},
+    "Vehicles": {"cull_distance": 12000.0, "cast_shadow": False, "collision": False, "mobility": "movable"},
+    "Drones": {"cull_distance": 9000.0, "cast_shadow": False, "collision": False, "mobility": "movable"},
+    "FX_Lights": {"cull_distance": 8000.0, "cast_shadow": False, "collision": False, "mobility": "movable"},
+    "FX_Fog": {"cull_distance": 12000.0, "cast_shadow": False, "collision": False, "translucency_sort_priority": -10},
+    "Crowd": {"cull_distance": 10000.0, "cast_shadow": False, "collision": False},
+    "Instanced": {"cull_distance": 45000.0, "mobility": "static"},
+    "Misc_Lights": {"cull_distance": 10000.0, "cast_shadow": False},
+}
+
+# optimize_light_budget(): point/spot/rect lights are binned into cubic cells
+# of LIGHT_BUDGET_CELL_CM and at most LIGHT_BUDGET_PER_CELL stay dynamic per
+# cell; the rest are disabled or demoted (no shadows, radius scaled down).
+# Showcase/Line/Debug lights score LIGHT_BUDGET_SHOWCASE_WEIGHT x higher. The
+# previous light state is saved per level so restore_light_budget can undo it.
+LIGHT_BUDGET_CELL_CM = 2500.0
+LIGHT_BUDGET_PER_CELL = 4
+LIGHT_BUDGET_MODE = "disable"
+LIGHT_BUDGET_DEMOTE_RADIUS_SCALE = 0.5
+LIGHT_BUDGET_SHOWCASE_WEIGHT = 4.0
+LIGHT_BUDGET_STATE_NAME = "uat_light_budget.json"
+
+# scene_cost_report(): each report is diffed against scene_cost_latest.json on
+# SCENE_COST_DIFF_KEYS and warns when a level's draw-call estimate grows by
+# more than SCENE_COST_WARN_RATIO.
+SCENE_COST_LATEST_NAME = "scene_cost_latest.json"
+SCENE_COST_WARN_RATIO = 1.5
+SCENE_COST_DIFF_KEYS = (
+    "actors", "mesh_material_pairs", "draw_calls_estimate", "dynamic_lights",
+    "light_overlap_pairs", "translucent_area_m2_total", "moving_entities",
+)
+
 # ============================================================
 # HELPERS
 # ============================================================
 _rotating_cubes = []
-_rotate_tick_handle = None
 _moving_actors = []
-_move_tick_handle = None
+_build_jobs = []
+_asset_cache = {}
+_asset_fallbacks = {}
+_asset_cache_stats = {"hits": 0, "misses": 0, "failed": 0}
 _move_time_accum = 0.0
 _move_debug_counter = 0
+_move_step_accum = 0.0
+_move_stats = {"since": 0.0, "steps": 0, "writes": 0, "skipped": 0, "light_calls": 0, "light_skipped": 0, "slices": 1}
+_move_slice_cursor = 0
+_LIGHT_WAVE = [math.sin(2.0 * math.pi * i / LIGHT_WAVE_SAMPLES) for i in range(LIGHT_WAVE_SAMPLES)]
+_LIGHT_WAVE_SCALE = LIGHT_WAVE_SAMPLES / (2.0 * math.pi)
+_LIGHT_WAVE_MASK = LIGHT_WAVE_SAMPLES - 1
+_move_hidden_checked = 0.0
+_traffic = None
+_motion = None
 _MOVE_BOUNDS = unreal.Vector(3600.0, 3600.0, 1600.0)
 _MOVE_Z_MIN = 80.0
 _EXTERIOR_LIGHT_RADIUS_MIN = 2600.0
@@ -184,7 +424,7 @@ def add_common_lighting(sun_color, sun_intensity, sky_intensity=1.0):
     unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.ExponentialHeightFog, unreal.Vector(0.0, 0.0, 0.0))
 
 def make_ground(material, scale=20.0, location=None):
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     if not plane:
         unreal.log_error(f"[UAT] Plane mesh not found: {PLANE_MESH_PATH}")
         return None
@@ -197,7 +437,7 @@ def make_ground(material, scale=20.0, location=None):
         comp.set_material(0, material)
     return actor
 
-def create_level_with_builder(name, builder_fn):
+def _new_codex_level(name):
     make_directory(CODEX_LEVEL_DIR)
     level_path = f"{CODEX_LEVEL_DIR}/{name}"
     if unreal.EditorAssetLibrary.does_asset_exist(level_path):
@@ -205,275 +445,762 @@ def create_level_with_builder(name, builder_fn):
     level_world = unreal.EditorLevelLibrary.new_level(level_path)
     if not level_world:
         unreal.log_error(f"[UAT] Failed to create level {level_path}")
-        return
+        return None
+    # Drop instance records left by an earlier build of the same level path.
+    _save_instance_index({}, replace=True)
+    return level_path
+
+def _finish_codex_level(level_path):
+    if BAKE_MOTION_AFTER_BUILD:
+        bake_motion()
+    if RENDER_OPTIMIZE_AFTER_BUILD:
+        optimize_render_cost()
+    unreal.EditorLevelLibrary.save_current_level()
+    actor_count = len(unreal.EditorLevelLibrary.get_all_level_actors() or [])
+    log(f"Built level {level_path} (actors: {actor_count})")
+
+def create_level_with_builder(name, builder_fn):
+    level_path = _new_codex_level(name)
+    if level_path is None:
+        return False
     try:
         builder_fn()
+    except BuildCancelled:
+        unreal.EditorLevelLibrary.save_current_level()
+        raise
     except Exception as exc:
         unreal.log_error(f"[UAT] Builder failed for {level_path}: {exc}")
         unreal.EditorLevelLibrary.save_current_level()
+        return False
+    _finish_codex_level(level_path)
+    return True
+
+# ============================================================
+# BUILD JOBS
+# ============================================================
+class BuildCancelled(Exception):
+    pass
+
+def _cancel_flag_path():
+    return os.path.join(automation_dir(), BUILD_CANCEL_FLAG_NAME)
+
+def cancel_builds():
+    """Ask running chunked builds (blocking or tick jobs) to stop after their current chunk."""
+    with open(_cancel_flag_path(), "w", encoding="utf-8") as f:
+        f.write(ts())
+    log("Build cancel requested")
+
+def _consume_cancel_request():
+    # A flag file rather than module state: each listener run re-executes this
+    # script, so the running job and the cancel command don't share globals.
+    path = _cancel_flag_path()
+    if not os.path.exists(path):
+        return False
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return True
+
+def _run_build_steps(steps, title):
+    """Drain a build generator on the game thread behind a cancellable ScopedSlowTask.
+
+    Build generators yield (done, total, label) after each chunk and return
+    their result; cancelling throws BuildCancelled into the generator so it can
+    record where it stopped.
+    """
+    _consume_cancel_request()
+    shown = 0.0
+    with unreal.ScopedSlowTask(100.0, title) as task:
+        task.make_dialog(True)
+        try:
+            progress = next(steps)
+            while True:
+                done, total, label = progress
+                target = 100.0 * done / total if total else 100.0
+                task.enter_progress_frame(max(0.0, target - shown), label)
+                shown = max(shown, target)
+                if task.should_cancel() or _consume_cancel_request():
+                    progress = steps.throw(BuildCancelled(title))
+                else:
+                    progress = next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+def _register_tick(name, fn):
+    """Run fn(delta_seconds) each editor frame as scheduler system name (config from TICK_SYSTEMS)."""
+    if not uat_scheduler.is_registered(name):
+        log(f"Registering {name} tick")
+    uat_scheduler.register(name, fn, **TICK_SYSTEMS[name])
+
+def _ensure_build_job_tick():
+    _register_tick("build_jobs", _build_job_tick)
+
+def _stop_build_job_tick():
+    uat_scheduler.unregister("build_jobs")
+
+def start_build_job(title, steps):
+    """Queue a build generator to run a few chunks per editor tick."""
+    if not _build_jobs:
+        _consume_cancel_request()
+    _build_jobs.append({"title": title, "steps": steps, "logged": 0})
+    _ensure_build_job_tick()
+    log(f"Queued build job: {title} ({len(_build_jobs)} queued)")
+
+def _cancel_build_jobs():
+    for job in _build_jobs:
+        try:
+            job["steps"].throw(BuildCancelled(job["title"]))
+        except (BuildCancelled, StopIteration):
+            pass
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Error while cancelling {job['title']}: {exc}")
+    log(f"Cancelled {len(_build_jobs)} build job(s)")
+    _build_jobs.clear()
+    _stop_build_job_tick()
+
+def _build_job_tick(delta_seconds):
+    if not _build_jobs:
+        _stop_build_job_tick()
         return
-    unreal.EditorLevelLibrary.save_current_level()
-    actor_count = len(unreal.EditorLevelLibrary.get_all_level_actors() or [])
-    log(f"Built level {level_path} (actors: {actor_count})")
+    if _consume_cancel_request():
+        _cancel_build_jobs()
+        return
+    job = _build_jobs[0]
+    try:
+        while True:
+            done, total, label = next(job["steps"])
+            percent = int(100.0 * done / total) if total else 100
+            if percent >= job["logged"] + 10:
+                job["logged"] = percent - percent % 10
+                log(f"{job['title']}: {percent}% ({label})")
+            if uat_scheduler.time_left() <= 0.0:
+                break
+    except StopIteration:
+        _build_jobs.pop(0)
+        log(f"Build job finished: {job['title']}")
+    except BuildCancelled:
+        _build_jobs.pop(0)
+    except Exception as exc:
+        _build_jobs.pop(0)
+        unreal.log_error(f"[UAT] Build job failed: {job['title']}: {exc}")
 
-def build_desert_level():
-    sand = ensure_material("M_UAT_Sand", unreal.LinearColor(0.9, 0.7, 0.45, 1.0))
-    add_common_lighting(unreal.LinearColor(1.0, 0.9, 0.75, 1.0), 10.0, sky_intensity=1.2)
-    make_ground(sand, scale=24.0)
-    # dunes: scattered scaled spheres
-    for i in range(8):
-        offset = unreal.Vector(random.uniform(-800.0, 800.0), random.uniform(-800.0, 800.0), -10.0)
-        dune = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, offset)
-        mesh = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
-        comp = dune.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(mesh)
-        comp.set_material(0, sand)
-        scale = random.uniform(3.0, 7.0)
-        comp.set_world_scale3d(unreal.Vector(scale, scale, 0.8 * scale))
-        dune.set_actor_label(f"Dune_{i}")
-
-def build_forest_level():
-    grass_mat = ensure_lifelike_grass_material()
-    add_common_lighting(unreal.LinearColor(1.0, 0.98, 0.9, 1.0), 7.0, sky_intensity=1.5)
-    make_ground(grass_mat, scale=18.0)
-    center = unreal.Vector(0.0, 0.0, 0.0)
-    spawn_grass_field_instanced(
-        center + unreal.Vector(0.0, 0.0, -5.0),
-        grass_mat,
-        rows=28,
-        cols=28,
-        spacing_cm=LIFELIKE_GRASS_SPACING_CM
-    )
-    # scatter trees using cylinders + spheres as canopies
-    trunk_mat = ensure_material("M_UAT_Trunk", unreal.LinearColor(0.25, 0.12, 0.06, 1.0))
-    leaf_mat = ensure_material("M_UAT_Leaf", unreal.LinearColor(0.1, 0.4, 0.12, 1.0))
-    cylinder = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder.Cylinder")
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
-    for i in range(20):
-        loc = unreal.Vector(random.uniform(-900.0, 900.0), random.uniform(-900.0, 900.0), 0.0)
-        trunk = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        ccomp = trunk.get_component_by_class(unreal.StaticMeshComponent)
-        ccomp.set_static_mesh(cylinder)
-        ccomp.set_material(0, trunk_mat)
-        ccomp.set_world_scale3d(unreal.Vector(0.3, 0.3, 4.0))
-        canopy = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc + unreal.Vector(0.0, 0.0, 300.0))
-        scomp = canopy.get_component_by_class(unreal.StaticMeshComponent)
-        scomp.set_static_mesh(sphere)
-        scomp.set_material(0, leaf_mat)
-        scomp.set_world_scale3d(unreal.Vector(1.8, 1.8, 1.6))
-        canopy.set_actor_label(f"Tree_{i}")
-
-def build_neon_level():
-    neon_floor = ensure_emissive_material("M_UAT_NeonFloor", unreal.LinearColor(0.05, 0.9, 0.8, 1.0), emissive_boost=8.0)
-    neon_pillar = ensure_emissive_material("M_UAT_NeonPillar", unreal.LinearColor(0.8, 0.2, 1.0, 1.0), emissive_boost=12.0)
-    add_common_lighting(unreal.LinearColor(0.6, 0.8, 1.0, 1.0), 4.0, sky_intensity=0.6)
-    make_ground(neon_floor, scale=16.0)
-    cylinder = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder.Cylinder")
-    positions = [
-        unreal.Vector(400.0, 400.0, 0.0),
-        unreal.Vector(-400.0, 400.0, 0.0),
-        unreal.Vector(400.0, -400.0, 0.0),
-        unreal.Vector(-400.0, -400.0, 0.0),
-        unreal.Vector(0.0, 0.0, 0.0)
-    ]
-    for i, pos in enumerate(positions):
-        pillar = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = pillar.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cylinder)
-        comp.set_material(0, neon_pillar)
-        comp.set_world_scale3d(unreal.Vector(0.6, 0.6, 8.0))
-        pillar.set_actor_label(f"NeonPillar_{i}")
-        light = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, pos + unreal.Vector(0.0, 0.0, 300.0))
-        lcomp = light.get_component_by_class(unreal.PointLightComponent)
-        if lcomp:
-            lcomp.set_editor_property("intensity", 8000.0)
-            lcomp.set_editor_property("light_color", unreal.LinearColor(0.8, 0.2, 1.0, 1.0))
-
-def build_snow_level():
-    snow = ensure_material("M_UAT_Snow", unreal.LinearColor(0.92, 0.95, 1.0, 1.0))
-    add_common_lighting(unreal.LinearColor(0.8, 0.9, 1.0, 1.0), 7.0, sky_intensity=1.8)
-    make_ground(snow, scale=18.0)
-    cone = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cone.Cone")
-    for i in range(16):
-        loc = unreal.Vector(random.uniform(-900.0, 900.0), random.uniform(-900.0, 900.0), -10.0)
-        ice = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = ice.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cone)
-        comp.set_material(0, snow)
-        scale = random.uniform(2.0, 5.0)
-        comp.set_world_scale3d(unreal.Vector(scale, scale, scale * 2.5))
-        ice.set_actor_label(f"Ice_{i}")
-
-def build_volcano_level():
-    rock = ensure_material("M_UAT_Rock", unreal.LinearColor(0.15, 0.1, 0.1, 1.0))
-    lava = ensure_emissive_material("M_UAT_Lava", unreal.LinearColor(1.0, 0.25, 0.05, 1.0), emissive_boost=10.0)
-    add_common_lighting(unreal.LinearColor(1.0, 0.6, 0.4, 1.0), 6.0, sky_intensity=0.8)
-    make_ground(rock, scale=18.0)
-    # lava pools
-    for i in range(5):
-        loc = unreal.Vector(random.uniform(-700.0, 700.0), random.uniform(-700.0, 700.0), -5.0)
-        pool = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = pool.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH))
-        comp.set_world_scale3d(unreal.Vector(random.uniform(2.0, 4.0), random.uniform(2.0, 4.0), 1.0))
-        comp.set_material(0, lava)
-    # rocks
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
-    for i in range(10):
-        loc = unreal.Vector(random.uniform(-800.0, 800.0), random.uniform(-800.0, 800.0), 0.0)
-        rock_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = rock_actor.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(sphere)
-        comp.set_material(0, rock)
-        scale = random.uniform(2.0, 5.0)
-        comp.set_world_scale3d(unreal.Vector(scale, scale, scale))
-
-def build_city_grid_level():
-    pavement = ensure_material("M_UAT_Pavement", unreal.LinearColor(0.2, 0.2, 0.22, 1.0))
-    glass = ensure_emissive_material("M_UAT_GlassGlow", unreal.LinearColor(0.2, 0.6, 1.0, 1.0), emissive_boost=6.0)
-    add_common_lighting(unreal.LinearColor(1.0, 0.95, 0.85, 1.0), 8.0, sky_intensity=1.2)
-    make_ground(pavement, scale=20.0)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    for x in range(-2, 3):
-        for y in range(-2, 3):
-            loc = unreal.Vector(x * 400.0, y * 400.0, 0.0)
-            b = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-            comp = b.get_component_by_class(unreal.StaticMeshComponent)
-            comp.set_static_mesh(cube)
-            comp.set_world_scale3d(unreal.Vector(2.0, 2.0, random.uniform(4.0, 9.0)))
-            comp.set_material(0, glass if (x + y) % 2 == 0 else pavement)
-            b.set_actor_label(f"Tower_{x}_{y}")
-
-def build_canyon_level():
-    canyon = ensure_material("M_UAT_Canyon", unreal.LinearColor(0.55, 0.32, 0.2, 1.0))
-    add_common_lighting(unreal.LinearColor(1.0, 0.8, 0.6, 1.0), 9.0, sky_intensity=1.1)
-    make_ground(canyon, scale=22.0)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    for i in range(10):
-        loc = unreal.Vector(random.uniform(-900.0, 900.0), random.uniform(-900.0, 900.0), -50.0)
-        wall = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = wall.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, canyon)
-        comp.set_world_scale3d(unreal.Vector(random.uniform(4.0, 12.0), random.uniform(1.5, 3.0), random.uniform(5.0, 10.0)))
-
-def build_sky_islands_level():
-    rock = ensure_material("M_UAT_IslandRock", unreal.LinearColor(0.3, 0.28, 0.26, 1.0))
-    grass = ensure_material("M_UAT_IslandGrass", unreal.LinearColor(0.2, 0.6, 0.2, 1.0))
-    add_common_lighting(unreal.LinearColor(0.9, 1.0, 1.0, 1.0), 8.0, sky_intensity=1.6)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
-    offsets = [
-        unreal.Vector(0.0, 0.0, 0.0),
-        unreal.Vector(800.0, 200.0, 300.0),
-        unreal.Vector(-700.0, -300.0, 250.0),
-        unreal.Vector(200.0, -900.0, 200.0)
-    ]
-    for i, off in enumerate(offsets):
-        island = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, off)
-        comp = island.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, rock)
-        comp.set_world_scale3d(unreal.Vector(6.0, 6.0, 1.2))
-        cap = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, off + unreal.Vector(0.0, 0.0, 150.0))
-        scomp = cap.get_component_by_class(unreal.StaticMeshComponent)
-        scomp.set_static_mesh(sphere)
-        scomp.set_material(0, grass)
-        scomp.set_world_scale3d(unreal.Vector(4.5, 4.5, 0.5))
-        cap.set_actor_label(f"Island_{i}")
-        light = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, off + unreal.Vector(0.0, 0.0, 500.0))
-        lcomp = light.get_component_by_class(unreal.PointLightComponent)
-        if lcomp:
-            lcomp.set_editor_property("intensity", 12000.0)
-            lcomp.set_editor_property("light_color", unreal.LinearColor(0.9, 0.95, 1.0, 1.0))
-
-def build_checker_level():
-    dark = ensure_material("M_UAT_CheckDark", unreal.LinearColor(0.1, 0.1, 0.1, 1.0))
-    light = ensure_material("M_UAT_CheckLight", unreal.LinearColor(0.9, 0.9, 0.9, 1.0))
-    add_common_lighting(unreal.LinearColor(1.0, 1.0, 1.0, 1.0), 7.0, sky_intensity=1.5)
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    size = 400.0
-    for r in range(-3, 4):
-        for c in range(-3, 4):
-            tile = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(r * size, c * size, 0.0))
-            comp = tile.get_component_by_class(unreal.StaticMeshComponent)
-            comp.set_static_mesh(plane)
-            comp.set_world_scale3d(unreal.Vector(1.5, 1.5, 1.0))
-            comp.set_material(0, light if (r + c) % 2 == 0 else dark)
-
-def build_ruins_level():
-    stone = ensure_material("M_UAT_Stone", unreal.LinearColor(0.45, 0.45, 0.42, 1.0))
-    moss = ensure_material("M_UAT_Moss", unreal.LinearColor(0.18, 0.35, 0.2, 1.0))
-    add_common_lighting(unreal.LinearColor(1.0, 0.95, 0.9, 1.0), 8.0, sky_intensity=1.3)
-    make_ground(moss, scale=20.0)
-    cylinder = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder.Cylinder")
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    for i in range(12):
-        loc = unreal.Vector(random.uniform(-800.0, 800.0), random.uniform(-800.0, 800.0), 0.0)
-        col = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = col.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cylinder)
-        comp.set_material(0, stone)
-        comp.set_world_scale3d(unreal.Vector(0.6, 0.6, random.uniform(3.0, 6.0)))
-    for i in range(10):
-        rubble = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(random.uniform(-700.0, 700.0), random.uniform(-700.0, 700.0), 0.0))
-        comp = rubble.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, stone)
-        comp.set_world_scale3d(unreal.Vector(random.uniform(0.8, 2.5), random.uniform(0.6, 2.0), random.uniform(0.3, 1.5)))
-
-def build_chromatic_level():
-    stripe_a = ensure_emissive_material("M_UAT_ChromaticA", unreal.LinearColor(1.0, 0.2, 0.4, 1.0), emissive_boost=8.0)
-    stripe_b = ensure_emissive_material("M_UAT_ChromaticB", unreal.LinearColor(0.2, 0.6, 1.0, 1.0), emissive_boost=8.0)
-    add_common_lighting(unreal.LinearColor(0.9, 0.9, 1.0, 1.0), 5.0, sky_intensity=0.8)
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    for i in range(-5, 6):
-        strip = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(i * 300.0, 0.0, 0.0))
-        comp = strip.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_world_scale3d(unreal.Vector(1.0, 10.0, 1.0))
-        comp.set_material(0, stripe_a if i % 2 == 0 else stripe_b)
-        light = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, unreal.Vector(i * 300.0, 0.0, 400.0))
-        lcomp = light.get_component_by_class(unreal.PointLightComponent)
+def _run_build(title, steps):
+    """Run a build generator now (blocking) or as a tick job, per BUILD_JOB_MODE."""
+    if BUILD_JOB_MODE == "tick":
+        start_build_job(title, steps)
+        return None
+    return _run_build_steps(steps, title)
+
+# ============================================================
+# SCENE SPECS
+# ============================================================
+def _plan_vector(values):
+    return unreal.Vector(*values)
+
+def _plan_color(values):
+    return unreal.LinearColor(*values, 1.0)
+
+def _ensure_palette(plan):
+    """Resolve palette keys to materials (content-addressed, so repeats are free)."""
+    materials = {}
+    for key, entry in plan["palette"].items():
+        alias = entry.get("alias") or f"M_UAT_{plan['name']}_{key}"
+        kind = entry.get("kind", "lit")
+        if kind == "emissive":
+            materials[key] = ensure_emissive_material(alias, _plan_color(entry["color"]), emissive_boost=entry.get("boost", 5.0))
+        elif kind == "fog":
+            color = _plan_color(entry["color"]) if entry.get("color") else None
+            materials[key] = ensure_fog_sheet_material(alias, color, opacity=entry.get("opacity", 0.2))
+        elif kind == "grass":
+            materials[key] = ensure_lifelike_grass_material(alias)
+        else:
+            materials[key] = ensure_material(alias, _plan_color(entry["color"]))
+    return materials
+
+def _plan_mesh_material(item, materials, palette, shared, per_instance):
+    material = materials.get(item["material"])
+    if item.get("accent") and shared:
+        entry = palette[item["material"]]
+        return _accent(material, _plan_color(entry["color"]), entry.get("boost", 5.0), shared(per_instance))
+    return material, None
+
+def _apply_plan_item(item, meshes, materials, palette, shared, batcher):
+    kind = item["type"]
+    loc = _plan_vector(item.get("loc", [0.0, 0.0, 0.0]))
+    actor = None
+    if kind == "sun":
+        actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.DirectionalLight, loc)
+        actor.set_actor_rotation(unreal.Rotator(*item["rot"]), teleport_physics=True)
+        set_directional_light(actor, item["intensity"], _plan_color(item["color"]))
+    elif kind == "skylight":
+        actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.SkyLight, loc)
+        sky_comp = actor.get_component_by_class(unreal.SkyLightComponent)
+        if sky_comp:
+            try:
+                sky_comp.set_editor_property("intensity", item["intensity"])
+            except Exception:
+                pass
+    elif kind == "fog":
+        actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.ExponentialHeightFog, loc)
+        fcomp = actor.get_component_by_class(unreal.ExponentialHeightFogComponent)
+        if fcomp and "density" in item:
+            fcomp.set_editor_property("fog_density", item["density"])
+            fcomp.set_editor_property("fog_height_falloff", item["falloff"])
+    elif kind == "mesh":
+        item_batcher = batcher if item.get("instance") else None
+        material, custom = _plan_mesh_material(item, materials, palette, shared, item_batcher is not None)
+        rotation = unreal.Rotator(*item["rot"]) if any(item.get("rot", [])) else None
+        actor = _place_mesh(
+            meshes[item["mesh"]], material, loc, _plan_vector(item["scale"]),
+            rotation=rotation,
+            label=item.get("label"),
+            batcher=item_batcher,
+            custom_color=custom,
+            plan_id=item["id"]
+        )
+    elif kind == "light":
+        actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, loc)
+        lcomp = actor.get_component_by_class(unreal.PointLightComponent)
         if lcomp:
-            lcomp.set_editor_property("intensity", 12000.0)
+            lcomp.set_editor_property("intensity", item["intensity"])
+            if "attenuation" in item:
+                lcomp.set_editor_property("attenuation_radius", item["attenuation"])
+            if "color" in item:
+                set_light_color_safe(lcomp, _plan_color(item["color"]))
+        if item.get("label"):
+            actor.set_actor_label(item["label"])
+    elif kind == "mover":
+        actor = _spawn_moving_actor(
+            meshes[item["mesh"]], materials.get(item["material"]), loc,
+            _plan_vector(item["velocity"]), _plan_vector(item["scale"]),
+            item.get("label") or item["id"]
+        )
+    elif kind == "moving_light":
+        actor = _spawn_moving_light(
+            loc, _plan_vector(item["velocity"]), item["intensity"],
+            _plan_color(item["color_a"]), _plan_color(item["color_b"]),
+            hue_speed=item["hue_speed"],
+            attenuation=item["attenuation"],
+            label=item.get("label")
+        )
+    elif kind == "grass":
+        actor = spawn_grass_field_instanced(loc, materials.get(item["material"]), rows=item["rows"], cols=item["cols"], spacing_cm=item["spacing"])
+    else:
+        unreal.log_warning(f"[UAT] Unknown plan item type {kind!r} ({item['id']})")
+    if actor and item.get("folder"):
+        _set_folder(actor, item["folder"])
+    return actor
 
-def build_crystal_level():
-    crystal = ensure_emissive_material("M_UAT_Crystal", unreal.LinearColor(0.3, 0.9, 1.0, 1.0), emissive_boost=10.0)
-    base = ensure_material("M_UAT_CrystalBase", unreal.LinearColor(0.05, 0.08, 0.1, 1.0))
-    add_common_lighting(unreal.LinearColor(0.8, 0.9, 1.0, 1.0), 6.0, sky_intensity=1.0)
-    make_ground(base, scale=18.0)
-    cone = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cone.Cone")
-    for i in range(18):
-        loc = unreal.Vector(random.uniform(-800.0, 800.0), random.uniform(-800.0, 800.0), 0.0)
-        c = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = c.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cone)
-        comp.set_material(0, crystal)
-        scale = random.uniform(2.0, 6.0)
-        comp.set_world_scale3d(unreal.Vector(scale * 0.6, scale * 0.6, scale * 2.5))
-        c.set_actor_rotation(unreal.Rotator(-90.0, random.uniform(0.0, 360.0), 0.0), teleport_physics=True)
-
-def build_industrial_level():
-    metal = ensure_material("M_UAT_Metal", unreal.LinearColor(0.35, 0.37, 0.4, 1.0))
-    accent = ensure_emissive_material("M_UAT_Accent", unreal.LinearColor(1.0, 0.6, 0.1, 1.0), emissive_boost=6.0)
-    add_common_lighting(unreal.LinearColor(1.0, 0.95, 0.9, 1.0), 7.0, sky_intensity=1.0)
-    make_ground(metal, scale=18.0)
-    cylinder = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cylinder.Cylinder")
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    for i in range(8):
-        loc = unreal.Vector(i * 250.0 - 900.0, -600.0, 0.0)
-        pipe = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = pipe.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cylinder)
-        comp.set_material(0, metal)
-        comp.set_world_scale3d(unreal.Vector(0.8, 0.8, 6.0))
-    for i in range(6):
-        box = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(i * 300.0 - 750.0, 400.0, 0.0))
-        comp = box.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, metal if i % 2 == 0 else accent)
-        comp.set_world_scale3d(unreal.Vector(2.0, 2.0, random.uniform(2.0, 5.0)))
+def _plan_mesh_record(item, ctx, palette):
+    """spawn_batch record for a non-instanced plan mesh item."""
+    material, custom = _plan_mesh_material(item, ctx["materials"], palette, ctx["shared"], False)
+    transform = unreal.Transform(
+        _plan_vector(item.get("loc", [0.0, 0.0, 0.0])),
+        unreal.Rotator(*item.get("rot", [0.0, 0.0, 0.0])),
+        _plan_vector(item["scale"])
+    )
+    return {
+        "mesh": ctx["meshes"][item["mesh"]],
+        "material": material,
+        "transform": transform,
+        "label": item.get("label"),
+        "folder": item.get("folder"),
+        "custom_color": custom,
+    }
+
+def _plan_context(plan):
+    """Meshes, palette materials and the shared custom-data material getter for a plan."""
+    meshes = {}
+    for name, path in uat_scene_spec.MESH_PATHS.items():
+        meshes[name] = load_asset_cached(path)
+        if not meshes[name]:
+            unreal.log_error(f"[UAT] Mesh not found: {path}; aborting plan {plan['name']}")
+            return None
+    shared = None
+    if COLOR_MODE == "custom_data":
+        shared = lambda per_instance: ensure_custom_data_material(per_instance=per_instance)
+    return {"meshes": meshes, "materials": _ensure_palette(plan), "shared": shared}
+
+def _tag_plan_actor(actor, item, palette):
+    tags = [str(t) for t in (actor.tags or [])]
+    tags = [t for t in tags if not t.startswith(PLAN_ID_TAG) and not t.startswith(PLAN_HASH_TAG)]
+    tags += [PLAN_ID_TAG + item["id"], PLAN_HASH_TAG + uat_scene_spec.item_hash(item, palette)]
+    actor.tags = [unreal.Name(t) for t in tags]
+
+def _plan_actor_tags(actor):
+    item_id = item_hash = None
+    for tag in actor.tags or []:
+        tag = str(tag)
+        if tag.startswith(PLAN_ID_TAG):
+            item_id = tag[len(PLAN_ID_TAG):]
+        elif tag.startswith(PLAN_HASH_TAG):
+            item_hash = tag[len(PLAN_HASH_TAG):]
+    return item_id, item_hash
+
+def _is_instance_actor(actor):
+    """True for HISM container actors built by _InstanceBatcher (their instances carry no plan tags)."""
+    if INSTANCED_ACTOR_TAG in [str(t) for t in (actor.tags or [])]:
+        return True
+    return actor.get_actor_label().lower().startswith("hism_")
+
+def _apply_plan_steps(plan, instanced=None, spawned=None, slot=(0.0, 1.0)):
+    """Generator form of apply_plan, yielding (done, total, label) after each chunk.
+
+    slot is (offset, total) in the caller's progress units; the plan fills one
+    unit starting at offset.
+    """
+    if instanced is None:
+        instanced = SCIFI_BUILD_MODE == "instanced"
+    spawned = {} if spawned is None else spawned
+    ctx = _plan_context(plan)
+    if ctx is None:
+        return spawned
+    batcher = _InstanceBatcher() if instanced else None
+    count = uat_scene_spec.item_count(plan) or 1
+    done = 0
+    for label, items in uat_scene_spec.plan_chunks(plan, PLAN_CHUNK_SIZE):
+        batched = []
+        for item in items:
+            if item["type"] == "mesh" and not (batcher and item.get("instance")):
+                batched.append(item)
+                continue
+            try:
+                actor = _apply_plan_item(item, ctx["meshes"], ctx["materials"], plan["palette"], ctx["shared"], batcher)
+            except Exception as exc:
+                unreal.log_warning(f"[UAT] Plan item {item['id']} failed: {exc}")
+                continue
+            if actor:
+                _tag_plan_actor(actor, item, plan["palette"])
+                spawned[item["id"]] = actor
+        records = [_plan_mesh_record(item, ctx, plan["palette"]) for item in batched]
+        for item, actor in zip(batched, spawn_batch(records, f"UAT {plan['name']}: {label}")):
+            if actor:
+                _tag_plan_actor(actor, item, plan["palette"])
+                spawned[item["id"]] = actor
+        done += len(items)
+        yield slot[0] + done / count, slot[1], f"{plan['name']}: {label}"
+    if batcher:
+        batcher.flush()
+    log(f"Applied plan {plan['name']}: {uat_scene_spec.item_count(plan)} items, {len(spawned)} actors (spec {plan['spec_hash'][:8]}, {plan['backend']})")
+    return spawned
+
+def apply_plan(plan, instanced=None):
+    """Spawn a compiled scene plan into the current level; returns {item id: actor}."""
+    return _run_build_steps(_apply_plan_steps(plan, instanced), f"Building {plan['name']}")
+
+def _update_plan_actor(actor, item, ctx, palette):
+    """Apply a changed mesh/light item to its existing actor; False means respawn it."""
+    kind = item["type"]
+    loc = _plan_vector(item["loc"])
+    if kind == "mesh":
+        comp = actor.get_component_by_class(unreal.StaticMeshComponent)
+        if comp is None:
+            return False
+        material, custom = _plan_mesh_material(item, ctx["materials"], palette, ctx["shared"], False)
+        comp.set_static_mesh(ctx["meshes"][item["mesh"]])
+        if material:
+            comp.set_material(0, material)
+        if custom:
+            set_custom_color(comp, *custom)
+        comp.set_world_scale3d(_plan_vector(item["scale"]))
+        actor.set_actor_location(loc, False, True)
+        actor.set_actor_rotation(unreal.Rotator(*item["rot"]), teleport_physics=True)
+    elif kind == "light":
+        lcomp = actor.get_component_by_class(unreal.PointLightComponent)
+        if lcomp is None:
+            return False
+        actor.set_actor_location(loc, False, True)
+        lcomp.set_editor_property("intensity", item["intensity"])
+        if "attenuation" in item:
+            lcomp.set_editor_property("attenuation_radius", item["attenuation"])
+        set_light_color_safe(lcomp, _plan_color(item.get("color", [1.0, 1.0, 1.0])))
+    else:
+        return False
+    if item.get("label"):
+        actor.set_actor_label(item["label"])
+    if item.get("folder"):
+        _set_folder(actor, item["folder"])
+    return True
+
+def _register_plan_mover(actor, item):
+    """Re-add a kept mover/moving light to the Python move tick (baked actors move on their own)."""
+    if unreal.Name(BAKED_MOTION_TAG) in actor.tags:
+        return
+    if item["type"] == "mover":
+        _push_moving(actor, _plan_vector(item["velocity"]))
+    elif item["type"] == "moving_light":
+        lcomp = actor.get_component_by_class(unreal.PointLightComponent)
+        mover = _push_moving(actor, _plan_vector(item["velocity"]))
+        mover.set_light(lcomp, item["intensity"], _plan_color(item["color_a"]), _plan_color(item["color_b"]), item["hue_speed"])
+
+def apply_plan_incremental(plan):
+    """Diff a plan against the tagged actors in the current level and apply only the changes.
+
+    Returns the number of changed actors, or None when the level needs a full
+    rebuild: it has no plan tags (built before tagging), or it was built
+    instanced, whose HISM instances cannot be diffed per item and would be
+    duplicated by spawning them again as actors.
+    """
+    start = time.time()
+    existing = {}
+    duplicates = []
+    for actor in unreal.EditorLevelLibrary.get_all_level_actors() or []:
+        if not actor:
+            continue
+        if _is_instance_actor(actor):
+            log(f"Incremental apply: {actor.get_actor_label()} holds instanced items; a full rebuild is needed")
+            return None
+        item_id, item_hash = _plan_actor_tags(actor)
+        if item_id is None:
+            continue
+        if item_id in existing:
+            duplicates.append(actor)
+            continue
+        existing[item_id] = (actor, item_hash)
+    if not existing:
+        return None
+    ctx = _plan_context(plan)
+    if ctx is None:
+        return 0
+    palette = plan["palette"]
+    _stop_move_tick()
+    _moving_actors.clear()
+    spawned = updated = respawned = kept = 0
+    desired = set()
+    for item in uat_scene_spec.iter_items(plan):
+        desired.add(item["id"])
+        actor, old_hash = existing.get(item["id"], (None, None))
+        if actor is not None and old_hash == uat_scene_spec.item_hash(item, palette):
+            _register_plan_mover(actor, item)
+            kept += 1
+            continue
+        try:
+            if actor is not None and _update_plan_actor(actor, item, ctx, palette):
+                _tag_plan_actor(actor, item, palette)
+                updated += 1
+                continue
+            if actor is not None:
+                actor_sub().destroy_actor(actor)
+                respawned += 1
+            else:
+                spawned += 1
+            new_actor = _apply_plan_item(item, ctx["meshes"], ctx["materials"], palette, ctx["shared"], None)
+            if new_actor:
+                _tag_plan_actor(new_actor, item, palette)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Plan item {item['id']} failed: {exc}")
+    removed = 0
+    for item_id, (actor, _) in existing.items():
+        if item_id not in desired:
+            actor_sub().destroy_actor(actor)
+            removed += 1
+    for actor in duplicates:
+        actor_sub().destroy_actor(actor)
+        removed += 1
+    changed = spawned + updated + respawned + removed
+    log(
+        f"Incremental apply {plan['name']}: spawned={spawned}, updated={updated}, respawned={respawned}, "
+        f"removed={removed}, unchanged={kept} in {(time.time() - start) * 1000.0:.0f} ms"
+    )
+    return changed
+
+def _create_level_steps(name, plan, slot=(0.0, 1.0), tiles=None):
+    """Generator form of create_level_with_builder for a plan (tiles: plan_tiles(plan), if computed)."""
+    if plan.get("tiles"):
+        return (yield from _create_tiled_level_steps(name, plan, slot, tiles))
+    level_path = _new_codex_level(name)
+    if level_path is None:
+        return False
+    try:
+        yield from _apply_plan_steps(plan, slot=slot)
+    except (BuildCancelled, GeneratorExit):
+        unreal.EditorLevelLibrary.save_current_level()
+        raise
+    except Exception as exc:
+        unreal.log_error(f"[UAT] Builder failed for {level_path}: {exc}")
+        unreal.EditorLevelLibrary.save_current_level()
+        return False
+    _finish_codex_level(level_path)
+    return True
+
+def _tile_level_dir(name):
+    return f"{CODEX_LEVEL_DIR}/{name}_Tiles"
+
+def _tile_level_name(name, key):
+    return f"{name}_Tile_{key}"
+
+def _add_tile_streaming_volume(streaming, tile, stream_distance):
+    """LevelStreamingVolume over the tile bounds grown by stream_distance, linked to its sub-level."""
+    (x0, y0, z0), (x1, y1, z1) = tile["bounds"]
+    center = unreal.Vector((x0 + x1) * 0.5, (y0 + y1) * 0.5, (z0 + z1) * 0.5)
+    try:
+        volume = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.LevelStreamingVolume, center)
+        # The default volume brush is a 200 cm cube.
+        volume.set_actor_scale3d(unreal.Vector(
+            (x1 - x0 + 2.0 * stream_distance) / 200.0,
+            (y1 - y0 + 2.0 * stream_distance) / 200.0,
+            (z1 - z0 + 2.0 * stream_distance) / 200.0
+        ))
+        volume.set_editor_property("streaming_usage", unreal.StreamingVolumeUsage.SVB_LOADING_AND_VISIBILITY)
+        volume.set_actor_label(f"StreamingVolume_{tile['key']}")
+        _set_folder(volume, "Streaming")
+        streaming.set_editor_property("editor_streaming_volumes", [volume])
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Streaming volume for tile {tile['key']} failed: {exc}")
+
+def _create_tiled_level_steps(name, plan, slot=(0.0, 1.0), tiles=None):
+    """Build a tiled plan: persistent items in the level, each tile in its own streaming sub-level.
+
+    Tiles are saved and hidden as soon as they are built, so the editor only
+    renders the tile being filled. They stay loaded, though: a non-World
+    Partition editor world keeps every sub-level in memory (unloading one
+    means removing it from the persistent level), so a tiled city costs as
+    much editor memory as an untiled one. Streaming volumes only take effect
+    in PIE and at runtime.
+    """
+    level_path = _new_codex_level(name)
+    if level_path is None:
+        return False
+    tile_dir = _tile_level_dir(name)
+    if unreal.EditorAssetLibrary.does_directory_exist(tile_dir):
+        unreal.EditorAssetLibrary.delete_directory(tile_dir)
+    make_directory(tile_dir)
+    level_sub = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+    tiles = tiles or uat_scene_spec.plan_tiles(plan)
+    stream_distance = plan["tiles"]["stream_distance"]
+    spawned = {}
+    try:
+        for index, tile in enumerate(tiles):
+            sub_plan = dict(plan, name=f"{name} [{tile['key']}]", items=tile["items"])
+            streaming = None
+            if tile["key"] != uat_scene_spec.PERSISTENT_TILE:
+                level_sub.set_current_level_by_name(name)
+                streaming = unreal.EditorLevelUtils.create_new_streaming_level(
+                    unreal.LevelStreamingDynamic, f"{tile_dir}/{_tile_level_name(name, tile['key'])}", False
+                )
+                if not streaming:
+                    unreal.log_error(f"[UAT] Failed to create tile level {tile['key']} for {name}")
+                    continue
+                _add_tile_streaming_volume(streaming, tile, stream_distance)
+                level_sub.set_current_level_by_name(_tile_level_name(name, tile["key"]))
+            for done, _, label in _apply_plan_steps(sub_plan, spawned=spawned):
+                yield slot[0] + (index + done) / len(tiles), slot[1], label
+            if streaming and RENDER_OPTIMIZE_AFTER_BUILD:
+                tile_level = streaming.get_loaded_level()
+                optimize_render_cost([a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a and a.get_level() == tile_level])
+            unreal.EditorLevelLibrary.save_all_dirty_levels()
+            if streaming and streaming.get_loaded_level():
+                unreal.EditorLevelUtils.set_level_visibility(streaming.get_loaded_level(), False, False)
+        level_sub.set_current_level_by_name(name)
+    except (BuildCancelled, GeneratorExit):
+        unreal.EditorLevelLibrary.save_all_dirty_levels()
+        raise
+    except Exception as exc:
+        unreal.log_error(f"[UAT] Tiled build failed for {level_path}: {exc}")
+        unreal.EditorLevelLibrary.save_all_dirty_levels()
+        return False
+    _finish_codex_level(level_path)
+    log(f"Tiled level {name}: {len(tiles) - 1} tile(s) of {plan['tiles']['size']:.0f} cm, {len(spawned)} actors")
+    return True
+
+def _tile_manifest(name, plan, tiles):
+    """Manifest record of a tiled plan's tiles: tile -> sub-level, bounds, stream distance and item ids."""
+    record = {}
+    for tile in tiles:
+        if tile["key"] == uat_scene_spec.PERSISTENT_TILE:
+            level = f"{CODEX_LEVEL_DIR}/{name}"
+        else:
+            level = f"{_tile_level_dir(name)}/{_tile_level_name(name, tile['key'])}"
+        record[tile["key"]] = {
+            "level": level,
+            "bounds": tile["bounds"],
+            "stream_distance": plan["tiles"]["stream_distance"] if tile["bounds"] else None,
+            "ids": [item["id"] for item in tile["items"]],
+        }
+    return record
+
+def _update_level_steps(name, plan, slot=(0.0, 1.0), tiles=None):
+    level_path = f"{CODEX_LEVEL_DIR}/{name}"
+    if plan.get("tiles"):
+        log(f"{level_path} is tiled; rebuilding its tiles")
+        return (yield from _create_level_steps(name, plan, slot, tiles))
+    if unreal.EditorAssetLibrary.does_asset_exist(level_path) and unreal.EditorLevelLibrary.load_level(level_path):
+        changed = apply_plan_incremental(plan)
+        if changed is not None:
+            if changed:
+                unreal.EditorLevelLibrary.save_current_level()
+            yield slot[0] + 1.0, slot[1], f"{name}: diff applied"
+            return True
+        log(f"{level_path} has no plan tags or is instanced; rebuilding")
+    return (yield from _create_level_steps(name, plan, slot))
+
+def update_level_from_plan(plan, level_name=None):
+    """Open an existing Codex level and diff-apply the plan; full rebuild if that is not possible."""
+    name = level_name or plan["name"]
+    return _run_build_steps(_update_level_steps(name, plan), f"Updating {name}")
+
+def _build_manifest_path():
+    return os.path.join(automation_dir(), BUILD_MANIFEST_NAME)
+
+def _load_build_manifest():
+    path = _build_manifest_path()
+    manifest = {}
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Failed to read build manifest: {exc}")
+    manifest.setdefault("levels", {})
+    manifest.setdefault("batches", {})
+    return manifest
+
+def _save_build_manifest(manifest):
+    try:
+        with open(_build_manifest_path(), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Failed to write build manifest: {exc}")
+
+def _build_code_hash():
+    """Hash of the spec compiler plus BUILD_CODE_VERSION; a change to either invalidates cached levels."""
+    sha = hashlib.sha1(f"build-code-{BUILD_CODE_VERSION}".encode("utf-8"))
+    try:
+        with open(os.path.abspath(uat_scene_spec.__file__), "rb") as f:
+            sha.update(f.read())
+    except OSError:
+        sha.update(b"uat_scene_spec.py")
+    return sha.hexdigest()
+
+def _level_build_record(spec, code_hash):
+    spec_hash = uat_scene_spec.spec_hash(spec)
+    key_data = [spec_hash, uat_scene_spec.DEFAULT_BACKEND, code_hash, SCIFI_BUILD_MODE, COLOR_MODE]
+    return {
+        "spec_hash": spec_hash,
+        "seed": spec.get("seed", 0),
+        "code_hash": code_hash,
+        "build_key": hashlib.sha1(json.dumps(key_data).encode("utf-8")).hexdigest(),
+    }
+
+def _level_is_current(manifest, name, record):
+    entry = manifest["levels"].get(name)
+    if not entry or entry.get("status") != "done" or entry.get("build_key") != record["build_key"]:
+        return False
+    return unreal.EditorAssetLibrary.does_asset_exist(f"{CODEX_LEVEL_DIR}/{name}")
+
+def _build_plan_tracked_steps(manifest, plan, record, incremental=False, slot=(0.0, 1.0)):
+    """Build one level, recording in_progress/done/failed/cancelled plus timing and actor count."""
+    name = plan["name"]
+    manifest["levels"][name] = dict(record, status="in_progress", started_at=ts())
+    _save_build_manifest(manifest)
+    entry = manifest["levels"][name]
+    tiles = uat_scene_spec.plan_tiles(plan) if plan.get("tiles") else None
+    start = time.time()
+    try:
+        if incremental:
+            ok = yield from _update_level_steps(name, plan, slot, tiles)
+        else:
+            ok = yield from _create_level_steps(name, plan, slot, tiles)
+    except (BuildCancelled, GeneratorExit):
+        entry["status"] = "cancelled"
+        _save_build_manifest(manifest)
+        raise
+    entry["status"] = "done" if ok else "failed"
+    entry["built_at"] = ts()
+    entry["build_seconds"] = round(time.time() - start, 2)
+    entry["actor_count"] = len(unreal.EditorLevelLibrary.get_all_level_actors() or []) if ok else 0
+    if ok and plan.get("tiles"):
+        entry["tiles"] = _tile_manifest(name, plan, tiles)
+    _save_build_manifest(manifest)
+    return ok
+
+def _batch_steps(batch_name, specs, incremental=False, force=False, workers=0, executable=None):
+    manifest = _load_build_manifest()
+    code_hash = _build_code_hash()
+    preload_assets()
+    names = [spec["name"] for spec in specs]
+    records = {spec["name"]: _level_build_record(spec, code_hash) for spec in specs}
+    previous = manifest["batches"].get(batch_name, {})
+    pending = [spec for spec in specs if force or not _level_is_current(manifest, spec["name"], records[spec["name"]])]
+    if previous.get("status") in ("in_progress", "cancelled") and pending:
+        log(f"Resuming batch {batch_name} at {pending[0]['name']}")
+    skipped = len(specs) - len(pending)
+    if skipped:
+        log(f"Batch {batch_name}: {skipped} level(s) unchanged, {len(pending)} to build")
+    manifest["batches"][batch_name] = {"levels": names, "status": "in_progress", "started_at": ts()}
+    _save_build_manifest(manifest)
+    batch = manifest["batches"][batch_name]
+    failed = built = 0
+    plans = uat_scene_spec.compile_plans(
+        pending, workers=workers, executable=executable,
+        poll=0.0 if BUILD_JOB_MODE == "tick" else PLAN_POLL_SECONDS,
+        log=lambda msg: unreal.log_warning(f"[UAT] {msg}"),
+    )
+    try:
+        for entry in plans:
+            if entry is None:
+                yield float(built + failed), float(len(pending)), f"Batch {batch_name}: waiting for plan workers"
+                continue
+            index, plan = entry
+            slot = (float(index), float(len(pending)))
+            if (yield from _build_plan_tracked_steps(manifest, plan, records[plan["name"]], incremental, slot)):
+                built += 1
+            else:
+                failed += 1
+    except (BuildCancelled, GeneratorExit):
+        batch["status"] = "cancelled"
+        batch["built"] = built
+        _save_build_manifest(manifest)
+        log(f"Batch {batch_name} cancelled after {built} level(s)")
+        raise
+    finally:
+        plans.close()
+    batch["status"] = "failed" if failed else "done"
+    batch["finished_at"] = ts()
+    batch["built"] = built
+    batch["skipped"] = skipped
+    _save_build_manifest(manifest)
+    log(f"Batch {batch_name}: built={built}, failed={failed}, skipped={skipped}")
+    log_asset_cache_stats()
+    return failed == 0
+
+def build_specs_cached(batch_name, specs, incremental=False, force=False, workers=0, executable=None):
+    """Build a batch of specs, skipping levels whose build key is unchanged.
+
+    Each level is marked in_progress before it builds and done afterwards, so
+    an interrupted batch resumes from the first level that did not finish.
+    With BUILD_JOB_MODE = "tick" the batch runs as a tick job and this returns None.
+    """
+    steps = _batch_steps(batch_name, specs, incremental, force, workers, executable)
+    try:
+        return _run_build(f"Batch {batch_name}", steps)
+    except BuildCancelled:
+        return False
+
+def build_level_from_spec(spec, level_name=None, incremental=False):
+    """Compile a spec (dict or name under uat_specs/) and build it as a Codex level."""
+    if isinstance(spec, str):
+        spec = uat_scene_spec.load_spec(spec)
+    plan = uat_scene_spec.compile_spec(spec)
+    if incremental:
+        update_level_from_plan(plan, level_name)
+    else:
+        create_level_with_builder(level_name or plan["name"], lambda: apply_plan(plan))
+    return plan
+
+def build_codex_levels(incremental=False, force=False):
+    specs = []
+    for spec_name in CODEX_SPECS:
+        try:
+            spec = uat_scene_spec.load_spec(spec_name)
+            errors = uat_scene_spec.validate_spec(spec)
+            if errors:
+                raise ValueError("; ".join(errors))
+            specs.append(spec)
+        except (OSError, ValueError) as exc:
+            unreal.log_error(f"[UAT] Skipping spec {spec_name}: {exc}")
+    build_specs_cached("codex", specs, incremental=incremental, force=force)
 
 def build_scifi_landscape_level():
     log("Scifi build: start")
@@ -483,26 +1210,101 @@ def build_scifi_landscape_level():
         global _move_time_accum, _move_debug_counter
         _move_time_accum = 0.0
         _move_debug_counter = 0
+        preload_assets()
         _build_scifi_landscape_level_impl()
+        log_asset_cache_stats()
     except Exception as exc:
         unreal.log_error(f"[UAT] Scifi build failed: {exc}")
         return
 
+def build_scifi_landscape_level_instanced():
+    """Build the scifi landscape with towers/strips/bridges/highways as HISM instances."""
+    global SCIFI_BUILD_MODE
+    prev_mode = SCIFI_BUILD_MODE
+    SCIFI_BUILD_MODE = "instanced"
+    try:
+        build_scifi_landscape_level()
+    finally:
+        SCIFI_BUILD_MODE = prev_mode
+
 def _ensure_move_tick():
-    global _move_tick_handle
-    if _move_tick_handle is None:
-        log("Registering move tick")
-        _move_tick_handle = unreal.register_slate_post_tick_callback(_move_tick)
+    _register_tick("motion", _move_tick)
+    _register_tick("lights", _animate_moving_lights)
+
+class _Mover:
+    """One entry of _moving_actors.
+
+    kind is MOVE_LINEAR or MOVE_ORBIT, plus MOVE_LIGHT when the actor's light
+    pulses and cycles colour (MOVE_LIGHT alone animates in place). Colours are
+    stored as (r, g, b) tuples so the tick does no lookups beyond attribute
+    reads.
+    """
+
+    __slots__ = (
+        "actor", "kind", "vx", "vy", "vz",
+        "light_comp", "base_intensity", "phase", "hue_speed", "rgb_a", "rgb_b",
+        "center_x", "center_y", "height", "radius", "angle", "speed",
+        "pos", "written", "hidden", "updated", "shown_intensity", "shown_rgb",
+    )
 
-def _push_moving(actor, velocity, meta=None):
-    global _moving_actors
+    def __init__(self, actor, velocity):
+        self.actor = actor
+        self.kind = MOVE_LINEAR
+        self.vx, self.vy, self.vz = velocity.x, velocity.y, velocity.z
+        self.light_comp = None
+        self.base_intensity = 0.0
+        self.phase = 0.0
+        self.hue_speed = 0.0
+        self.rgb_a = self.rgb_b = (0.0, 0.0, 0.0)
+        self.center_x = self.center_y = self.height = 0.0
+        self.radius = self.angle = self.speed = 0.0
+        # Simulated and last-written (x, y, z); None until first read from the actor.
+        self.pos = None
+        self.written = None
+        self.hidden = False
+        # _move_time_accum at the last integration; None until first simulated.
+        self.updated = None
+        # Last intensity / (r, g, b) pushed to the light; None forces the next push.
+        self.shown_intensity = None
+        self.shown_rgb = None
+
+    def set_light(self, light_comp, intensity, color_a, color_b=None, hue_speed=0.5):
+        if light_comp is None:
+            return self
+        color_b = color_b or color_a
+        self.kind |= MOVE_LIGHT
+        self.light_comp = light_comp
+        self.base_intensity = intensity
+        self.phase = random.uniform(0.0, math.pi * 2.0)
+        self.hue_speed = hue_speed
+        self.rgb_a = (color_a.r, color_a.g, color_a.b)
+        self.rgb_b = (color_b.r, color_b.g, color_b.b)
+        return self
+
+    def set_orbit(self, center, radius, height, angle, speed):
+        self.kind = MOVE_ORBIT | (self.kind & MOVE_LIGHT)
+        self.center_x, self.center_y = center.x, center.y
+        self.height = height
+        self.radius = radius
+        self.angle = angle
+        self.speed = speed
+        return self
+
+def _push_moving(actor, velocity):
+    """Register actor with the move tick; returns its _Mover for set_light/set_orbit."""
     if actor is None:
-        return
-    vel = unreal.Vector(velocity.x, velocity.y, velocity.z)
-    _moving_actors.append((actor, vel, meta))
+        return None
+    mover = _Mover(actor, velocity)
+    _motion_store()
+    _moving_actors.append(mover)
     _ensure_move_tick()
+    return mover
 
-def _spawn_moving_actor(mesh, material, start, velocity, scale, label, meta=None):
+def _light_movers():
+    """{id(light component): _Mover} for the moving lights."""
+    return {id(m.light_comp): m for m in _moving_actors if m.kind & MOVE_LIGHT}
+
+def _spawn_moving_actor(mesh, material, start, velocity, scale, label):
     if not mesh:
         unreal.log_error(f"[UAT] Missing mesh for {label}")
         return None
@@ -513,7 +1315,7 @@ def _spawn_moving_actor(mesh, material, start, velocity, scale, label, meta=None
     if material:
         comp.set_material(0, material)
     actor.set_actor_label(label)
-    _push_moving(actor, velocity, meta)
+    _push_moving(actor, velocity)
     return actor
 
 def _spawn_moving_light(start, velocity, intensity, color_a, color_b=None, hue_speed=0.5, attenuation=1800.0, label=None):
@@ -523,23 +1325,15 @@ def _spawn_moving_light(start, velocity, intensity, color_a, color_b=None, hue_s
         lcomp.set_editor_property("intensity", intensity)
         lcomp.set_editor_property("attenuation_radius", attenuation)
         set_light_color_safe(lcomp, color_a)
-    meta = {
-        "light_comp": lcomp,
-        "base_intensity": intensity,
-        "color_a": color_a,
-        "color_b": color_b or color_a,
-        "phase": random.uniform(0.0, math.pi * 2.0),
-        "hue_speed": hue_speed,
-    }
     if label:
         light.set_actor_label(label)
-    _push_moving(light, velocity, meta)
+    _push_moving(light, velocity).set_light(lcomp, intensity, color_a, color_b, hue_speed)
     return light
 
 def rotate_exterior_lights(speed_deg_per_sec=12.0, radius_min=_EXTERIOR_LIGHT_RADIUS_MIN):
     speed_rad = math.radians(speed_deg_per_sec)
     actors = unreal.EditorLevelLibrary.get_all_level_actors()
-    existing_moving = {entry[0] for entry in _moving_actors}
+    existing_moving = {m.actor for m in _moving_actors}
     count = 0
     for actor in actors:
         if not actor or not isinstance(actor, unreal.PointLight):
@@ -551,16 +1345,8 @@ def rotate_exterior_lights(speed_deg_per_sec=12.0, radius_min=_EXTERIOR_LIGHT_RA
         if actor in existing_moving:
             continue
         angle = math.atan2(loc.y, loc.x)
-        meta = {
-            "orbit": {
-                "center": unreal.Vector(0.0, 0.0, 0.0),
-                "radius": radius,
-                "height": loc.z,
-                "angle": angle,
-                "speed": speed_rad,
-            }
-        }
-        _push_moving(actor, unreal.Vector(0.0, 0.0, 0.0), meta)
+        mover = _push_moving(actor, unreal.Vector(0.0, 0.0, 0.0))
+        mover.set_orbit(unreal.Vector(0.0, 0.0, 0.0), radius, loc.z, angle, speed_rad)
         count += 1
     log(f"Exterior lights rotating: {count} started")
 
@@ -587,18 +1373,486 @@ def _set_folder(actor, folder_name):
     except Exception:
         pass
 
+def load_asset_cached(path):
+    """EditorAssetLibrary.load_asset through a per-run handle cache (hits/misses in _asset_cache_stats)."""
+    asset = _asset_cache.get(path)
+    if asset is not None and unreal.SystemLibrary.is_valid(asset):
+        _asset_cache_stats["hits"] += 1
+        return asset
+    _asset_cache_stats["misses"] += 1
+    asset = unreal.EditorAssetLibrary.load_asset(path)
+    if asset:
+        _asset_cache[path] = asset
+    else:
+        _asset_cache.pop(path, None)
+        _asset_cache_stats["failed"] += 1
+    return asset
+
+def _asset_exists(path):
+    """Asset registry lookup; answers without loading the package."""
+    try:
+        registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        return registry.get_asset_by_object_path(path).is_valid()
+    except Exception:
+        return unreal.EditorAssetLibrary.does_asset_exist(path)
+
 def _load_first_asset(paths):
+    """Load the first existing asset of a fallback list; the resolved path is cached too."""
+    key = tuple(paths)
+    resolved = _asset_fallbacks.get(key)
+    if resolved:
+        return load_asset_cached(resolved)
     for path in paths:
-        asset = unreal.EditorAssetLibrary.load_asset(path)
-        if asset:
-            return asset
+        if path in _asset_cache or _asset_exists(path):
+            asset = load_asset_cached(path)
+            if asset:
+                _asset_fallbacks[key] = path
+                return asset
     return None
 
+def preload_assets(paths=None):
+    """Load assets (engine shapes by default) into the cache up front.
+
+    Editor Python has no async load API, so this loads synchronously, but once,
+    before any builder loop runs.
+    """
+    paths = list(paths or ENGINE_SHAPE_PATHS)
+    start = time.time()
+    missing = [path for path in paths if not load_asset_cached(path)]
+    for path in missing:
+        unreal.log_warning(f"[UAT] Preload failed: {path}")
+    log(f"Preloaded {len(paths) - len(missing)}/{len(paths)} assets in {(time.time() - start) * 1000.0:.0f} ms")
+
+def log_asset_cache_stats():
+    stats = _asset_cache_stats
+    lookups = stats["hits"] + stats["misses"]
+    rate = 100.0 * stats["hits"] / lookups if lookups else 0.0
+    log(f"Asset cache: {len(_asset_cache)} handles, hits={stats['hits']}, misses={stats['misses']}, failed={stats['failed']} ({rate:.0f}% hit rate)")
+
+def _place_mesh(mesh, material, location, scale, rotation=None, label=None, batcher=None, custom_color=None, plan_id=None):
+    """Spawn a StaticMeshActor, or queue an instance when an _InstanceBatcher is given."""
+    if batcher is not None:
+        transform = unreal.Transform(location, rotation or unreal.Rotator(0.0, 0.0, 0.0), scale)
+        batcher.add(mesh, material, transform, label, custom_color, plan_id)
+        return None
+    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, location)
+    comp = actor.get_component_by_class(unreal.StaticMeshComponent)
+    comp.set_static_mesh(mesh)
+    comp.set_world_scale3d(scale)
+    if material:
+        comp.set_material(0, material)
+    if custom_color:
+        set_custom_color(comp, *custom_color)
+    if rotation:
+        actor.set_actor_rotation(rotation, teleport_physics=True)
+    if label:
+        actor.set_actor_label(label)
+    return actor
+
+def _spawn_record(record):
+    transform = record["transform"]
+    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(
+        record.get("class") or unreal.StaticMeshActor,
+        transform.translation,
+        transform.rotation.rotator()
+    )
+    comp = actor.get_component_by_class(unreal.StaticMeshComponent)
+    if comp:
+        if record.get("mesh"):
+            comp.set_static_mesh(record["mesh"])
+        comp.set_world_scale3d(transform.scale3d)
+        if record.get("material"):
+            comp.set_material(0, record["material"])
+        if record.get("custom_color"):
+            set_custom_color(comp, *record["custom_color"])
+    return actor
+
+def _spawn_records(records):
+    actors = []
+    for record in records:
+        try:
+            actors.append(_spawn_record(record))
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Batch spawn of {record.get('label') or 'record'} failed: {exc}")
+            actors.append(None)
+    for record, actor in zip(records, actors):
+        if actor is None:
+            continue
+        if record.get("label"):
+            actor.set_actor_label(record["label"], False)
+        if record.get("folder"):
+            _set_folder(actor, record["folder"])
+    return actors
+
+def spawn_batch(records, description="UAT Spawn Batch"):
+    """Spawn mesh actor records in one editor transaction; returns actors aligned with records.
+
+    A record is a dict with transform (unreal.Transform), mesh and material plus
+    optional class (default StaticMeshActor), label, folder and custom_color.
+    Rotation is passed at spawn time, labels and folders are applied in a second
+    pass without re-dirtying the level per actor, and viewports are invalidated
+    once at the end.
+    """
+    if not records:
+        return []
+    if SPAWN_BATCH_TRANSACTION:
+        with unreal.ScopedEditorTransaction(description):
+            actors = _spawn_records(records)
+    else:
+        actors = _spawn_records(records)
+    try:
+        unreal.EditorLevelLibrary.editor_invalidate_viewports()
+    except Exception:
+        pass
+    return actors
+
+def _add_component(actor, component_class):
+    """Add a component to a placed actor through the subobject data subsystem."""
+    sds = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+    handles = sds.k2_gather_subobject_data_for_instance(actor)
+    if not handles:
+        return None
+    params = unreal.AddNewSubobjectParams(parent_handle=handles[0], new_class=component_class)
+    handle, fail_reason = sds.add_new_subobject(params)
+    if str(fail_reason):
+        unreal.log_warning(f"[UAT] Failed to add {component_class.__name__} to {actor.get_actor_label()}: {fail_reason}")
+        return None
+    data = unreal.SubobjectDataBlueprintFunctionLibrary.get_data(handle)
+    return unreal.SubobjectDataBlueprintFunctionLibrary.get_object(data)
+
+def _spawn_hism_actor(mesh, material, label, location=None):
+    actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.Actor, location or unreal.Vector(0.0, 0.0, 0.0))
+    comp = _add_component(actor, unreal.HierarchicalInstancedStaticMeshComponent)
+    if comp is None:
+        actor_sub().destroy_actor(actor)
+        return None, None
+    comp.set_static_mesh(mesh)
+    if material:
+        comp.set_material(0, material)
+    actor.set_actor_label(label)
+    actor.tags = [unreal.Name(INSTANCED_ACTOR_TAG)]
+    return actor, comp
+
+def _instance_index_path():
+    return os.path.join(automation_dir(), INSTANCE_INDEX_NAME)
+
+def _current_level_key():
+    world = unreal.EditorLevelLibrary.get_editor_world()
+    return world.get_path_name() if world else "None"
+
+def _upgrade_instance_index(data):
+    """{level: {hism_label: [record]}} from any index version.
+
+    Version 1 (no "version" key) stored the levels at the top level and one
+    logical label string per instance; records are now dicts with "label" plus
+    optional "id" and "tags".
+    """
+    if not isinstance(data, dict):
+        return {}
+    levels = data.get("levels", {}) if "version" in data else data
+    upgraded = {}
+    for level, entries in levels.items():
+        upgraded[level] = {
+            hism_label: [record if isinstance(record, dict) else {"label": str(record)} for record in records]
+            for hism_label, records in (entries or {}).items()
+        }
+    return upgraded
+
+def _load_instance_index():
+    """Return {level_path: {hism_label: [record per instance]}}."""
+    path = _instance_index_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return _upgrade_instance_index(json.load(f))
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Failed to read instance index: {exc}")
+        return {}
+
+def _save_instance_index(level_entries, replace=False):
+    """Merge (or with replace, set) the current level's {hism_label: records}.
+
+    Entries whose HISM actor is no longer in the level are dropped, so a
+    rebuild never leaves records pointing at instances that are gone.
+    """
+    index = _load_instance_index()
+    key = _current_level_key()
+    if replace or key not in index:
+        index[key] = {}
+    present = {a.get_actor_label() for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a}
+    index[key] = {label: records for label, records in index[key].items() if label in present}
+    index[key].update(level_entries)
+    try:
+        with open(_instance_index_path(), "w", encoding="utf-8") as f:
+            json.dump({"version": INSTANCE_INDEX_VERSION, "levels": index}, f, indent=2)
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Failed to write instance index: {exc}")
+
+class _InstanceBatcher:
+    """Group placements by (mesh, material) and emit one HISM actor per group on flush()."""
+
+    def __init__(self, folder="Instanced"):
+        self.folder = folder
+        self.groups = {}
+
+    def add(self, mesh, material, transform, logical_id=None, custom_color=None, plan_id=None):
+        key = (mesh.get_path_name(), material.get_path_name() if material else "")
+        group = self.groups.get(key)
+        if group is None:
+            group = {"mesh": mesh, "material": material, "transforms": [], "ids": [], "custom": []}
+            self.groups[key] = group
+        group["transforms"].append(transform)
+        record = {"label": logical_id or plan_id or f"instance_{len(group['ids'])}"}
+        if plan_id:
+            # Plan ids are unique per level; labels built from coordinates may not be.
+            record["id"] = plan_id
+        group["ids"].append(record)
+        group["custom"].append(custom_color)
+
+    def flush(self):
+        entries = {}
+        taken = {a.get_actor_label() for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a}
+        for group in self.groups.values():
+            mesh, material = group["mesh"], group["material"]
+            label = _unique_label(f"HISM_{mesh.get_name()}_{material.get_name() if material else 'Default'}", taken)
+            actor, comp = _spawn_hism_actor(mesh, material, label)
+            if comp is None:
+                continue
+            comp.add_instances(group["transforms"], False, True)
+            for idx, custom in enumerate(group["custom"]):
+                if custom:
+                    set_custom_color(comp, custom[0], custom[1], instance_index=idx)
+            _set_folder(actor, self.folder)
+            entries[label] = group["ids"]
+        _save_instance_index(entries)
+        count = sum(len(ids) for ids in entries.values())
+        log(f"Instanced build: {count} instances in {len(entries)} HISM actors")
+        self.groups = {}
+        return entries
+
+def _unique_label(base, taken):
+    label = base
+    n = 1
+    while label in taken:
+        label = f"{base}_{n}"
+        n += 1
+    taken.add(label)
+    return label
+
+def _lookup_instance(logical_label):
+    """(hism_label, instance index) for a plan id or logical label, or (None, -1)."""
+    level = _load_instance_index().get(_current_level_key(), {})
+    for field in ("id", "label"):
+        for hism_label, records in level.items():
+            for idx, record in enumerate(records):
+                if record.get(field) == logical_label:
+                    return hism_label, idx
+    return None, -1
+
+def _estimate_draw_calls(actors):
+    """Rough draw-call count: one per material slot per visible mesh component or instance group."""
+    calls = 0
+    for actor in actors:
+        if not actor:
+            continue
+        for comp in actor.get_components_by_class(unreal.MeshComponent) or []:
+            if isinstance(comp, unreal.InstancedStaticMeshComponent) and comp.get_instance_count() == 0:
+                continue
+            calls += max(1, comp.get_num_materials())
+    return calls
+
+def _swap_custom_data_material(material, per_instance):
+    """Map the shared custom-data material to its primitive/per-instance twin."""
+    names = material_aliases(material)
+    if "M_UAT_CustomData_Primitive" in names or "M_UAT_CustomData_Instance" in names:
+        return ensure_custom_data_material(per_instance=per_instance)
+    return material
+
+def _read_custom_data(comp):
+    """Custom primitive data floats, or the flat per-instance array for ISM components."""
+    try:
+        if isinstance(comp, unreal.InstancedStaticMeshComponent):
+            return list(comp.get_editor_property("per_instance_sm_custom_data") or [])
+        data = comp.get_editor_property("custom_primitive_data")
+        return list(data.get_editor_property("data") or [])
+    except Exception:
+        return []
+
+def _is_moving_actor(actor, registered):
+    """True for actors that move: registered with a tick, baked, in a moving category or with a movement component.
+
+    Only the last three survive an editor restart, so they are what keeps
+    cars and drones out of merge_to_instances when the tick lists are empty.
+    """
+    if actor in registered:
+        return True
+    if unreal.Name(BAKED_MOTION_TAG) in (actor.tags or []):
+        return True
+    folder = str(actor.get_folder_path()).split("/")[-1]
+    if outliner_category(actor) in MERGE_SKIP_CATEGORIES or folder in MERGE_SKIP_CATEGORIES:
+        return True
+    return bool(actor.get_components_by_class(unreal.MovementComponent))
+
+def merge_to_instances(min_group_size=2):
+    """Replace groups of identical StaticMeshActors (mesh, materials, folder) with HISM actors."""
+    actors = [a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a]
+    before_actors = len(actors)
+    before_calls = _estimate_draw_calls(actors)
+    registered = {m.actor for m in _moving_actors} | set(_rotating_cubes)
+    if _traffic is not None:
+        registered.update(_traffic["actors"].values())
+
+    groups = {}
+    for actor in actors:
+        if not isinstance(actor, unreal.StaticMeshActor) or _is_moving_actor(actor, registered):
+            continue
+        comp = actor.get_component_by_class(unreal.StaticMeshComponent)
+        mesh = comp.get_editor_property("static_mesh") if comp else None
+        if not mesh:
+            continue
+        mats = tuple(m.get_path_name() if m else "" for m in comp.get_materials())
+        folder = str(actor.get_folder_path())
+        groups.setdefault((mesh.get_path_name(), mats, folder), []).append((actor, comp))
+
+    taken = {a.get_actor_label() for a in actors}
+    entries = {}
+    merged = 0
+    for (_mesh_path, _mats, folder), members in groups.items():
+        if len(members) < min_group_size:
+            continue
+        first = members[0][1]
+        mesh = first.get_editor_property("static_mesh")
+        materials = [_swap_custom_data_material(m, True) if m else None for m in first.get_materials()]
+        label = _unique_label(f"HISM_{mesh.get_name()}", taken)
+        hism, hcomp = _spawn_hism_actor(mesh, materials[0] if materials else None, label)
+        if hcomp is None:
+            continue
+        for slot, mat in enumerate(materials[1:], start=1):
+            if mat:
+                hcomp.set_material(slot, mat)
+        hcomp.add_instances([c.get_world_transform() for _a, c in members], False, True)
+        records = []
+        for idx, (actor, comp) in enumerate(members):
+            custom = _read_custom_data(comp)
+            if custom:
+                if hcomp.get_editor_property("num_custom_data_floats") < len(custom):
+                    hcomp.set_num_custom_data_floats(len(custom))
+                for data_idx, value in enumerate(custom):
+                    hcomp.set_custom_data_value(idx, data_idx, value, False)
+            records.append({"label": actor.get_actor_label(), "tags": [str(t) for t in (actor.tags or [])]})
+            actor_sub().destroy_actor(actor)
+        if folder and folder != "None":
+            _set_folder(hism, folder)
+        entries[label] = records
+        merged += len(members)
+    if entries:
+        _save_instance_index(entries)
+
+    after = [a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a]
+    report = {
+        "merged_actors": merged,
+        "hism_actors": len(entries),
+        "actors_before": before_actors,
+        "actors_after": len(after),
+        "draw_calls_before": before_calls,
+        "draw_calls_after": _estimate_draw_calls(after),
+    }
+    log(f"merge_to_instances: {report}")
+    return report
+
+def explode_instances():
+    """Turn UAT HISM actors back into individual StaticMeshActors with their labels, tags and folders."""
+    actors = [a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a]
+    before_actors = len(actors)
+    before_calls = _estimate_draw_calls(actors)
+    index = _load_instance_index().get(_current_level_key(), {})
+
+    exploded = 0
+    restored = {}
+    for actor in actors:
+        label = actor.get_actor_label()
+        tags = [str(t) for t in (actor.tags or [])]
+        if INSTANCED_ACTOR_TAG not in tags and not label.startswith("HISM_"):
+            continue
+        comp = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+        if not comp:
+            continue
+        mesh = comp.get_editor_property("static_mesh")
+        materials = [_swap_custom_data_material(m, False) if m else None for m in comp.get_materials()]
+        stride = comp.get_editor_property("num_custom_data_floats")
+        custom = _read_custom_data(comp) if stride else []
+        folder = str(actor.get_folder_path())
+        records = index.get(label, [])
+        for i in range(comp.get_instance_count()):
+            transform = comp.get_instance_transform(i, True)
+            new_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, transform.translation)
+            ncomp = new_actor.get_component_by_class(unreal.StaticMeshComponent)
+            ncomp.set_static_mesh(mesh)
+            for slot, mat in enumerate(materials):
+                if mat:
+                    ncomp.set_material(slot, mat)
+            new_actor.set_actor_transform(transform, False, True)
+            for data_idx, value in enumerate(custom[i * stride:(i + 1) * stride]):
+                ncomp.set_custom_primitive_data_float(data_idx, value)
+            record = records[i] if i < len(records) else {}
+            new_actor.set_actor_label(record.get("label") or f"{label}_{i}")
+            if record.get("tags"):
+                new_actor.tags = [unreal.Name(t) for t in record["tags"]]
+            if folder and folder != "None":
+                _set_folder(new_actor, folder)
+            exploded += 1
+        restored[label] = comp.get_instance_count()
+        actor_sub().destroy_actor(actor)
+
+    if restored:
+        remaining = {k: v for k, v in index.items() if k not in restored}
+        _save_instance_index(remaining, replace=True)
+
+    after = [a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a]
+    report = {
+        "exploded_instances": exploded,
+        "hism_actors": len(restored),
+        "actors_before": before_actors,
+        "actors_after": len(after),
+        "draw_calls_before": before_calls,
+        "draw_calls_after": _estimate_draw_calls(after),
+    }
+    log(f"explode_instances: {report}")
+    return report
+
+def select_logical_object(logical_label):
+    """Select the HISM actor (and instance) holding a logical object from an instanced build."""
+    hism_label, idx = _lookup_instance(logical_label)
+    actor = _find_actor_by_label(hism_label) if hism_label else None
+    if not actor:
+        unreal.log_warning(f"[UAT] No instanced object named {logical_label}")
+        return None, -1
+    unreal.EditorLevelLibrary.set_selected_level_actors([actor])
+    comp = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+    try:
+        comp.select_instance(True, idx, 1)
+    except Exception:
+        pass
+    return actor, idx
+
+def logical_object_transform(logical_label):
+    """World transform of a logical object, whether it is an actor or an instance."""
+    actor = _find_actor_by_label(logical_label)
+    if actor:
+        return actor.get_actor_transform()
+    hism_label, idx = _lookup_instance(logical_label)
+    actor = _find_actor_by_label(hism_label) if hism_label else None
+    if not actor:
+        return None
+    comp = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+    return comp.get_instance_transform(idx, True)
+
 def _spawn_reference_showcase(base_loc, cyan, magenta, base_mat):
     """Place representative assets with labels for quick visual selection."""
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
+    cube = load_asset_cached(CUBE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
 
     if not plane or not cube or not sphere:
         unreal.log_warning("[UAT] Showcase skipped; missing primitive mesh")
@@ -709,7 +1963,7 @@ def spawn_debug_showcase():
     car_pos = base + right * -200.0
     car_vel = unreal.Vector(400.0, 0.0, 0.0)
     car_mat = ensure_emissive_material("M_UAT_Scifi_Car", unreal.LinearColor(0.1, 0.8, 1.0, 1.0), emissive_boost=14.0)
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     _spawn_moving_actor(plane, car_mat, car_pos, car_vel, unreal.Vector(0.9, 2.8, 0.35), "Debug_Car")
     _spawn_moving_light(car_pos + unreal.Vector(0.0, 0.0, 40.0), car_vel, 6000.0, unreal.LinearColor(0.2, 0.9, 1.0, 1.0), unreal.LinearColor(1.0, 0.3, 0.2, 1.0), hue_speed=0.8, attenuation=1200.0, label="Debug_CarLight")
     _spawn_text_label(car_pos + unreal.Vector(0.0, 0.0, 200.0), "Car")
@@ -718,7 +1972,7 @@ def spawn_debug_showcase():
     drone_pos = base + right * 0.0 + up * 150.0
     drone_vel = unreal.Vector(-220.0, 120.0, 60.0)
     drone_mat = ensure_emissive_material("M_UAT_Scifi_Drone", unreal.LinearColor(0.0, 0.9, 0.8, 1.0), emissive_boost=10.0)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     _spawn_moving_actor(sphere, drone_mat, drone_pos, drone_vel, unreal.Vector(0.6, 0.6, 0.6), "Debug_Drone")
     _spawn_moving_light(drone_pos + unreal.Vector(0.0, 0.0, 70.0), drone_vel, 5200.0, unreal.LinearColor(0.0, 0.9, 0.8, 1.0), unreal.LinearColor(1.0, 0.2, 0.7, 1.0), hue_speed=1.0, attenuation=900.0, label="Debug_DroneLight")
     _spawn_text_label(drone_pos + unreal.Vector(0.0, 0.0, 200.0), "Drone")
@@ -732,15 +1986,325 @@ def spawn_debug_showcase():
     log(f"Debug showcase spawned. Moving actors={len(_moving_actors)}")
 
 def stop_motion():
-    """Clear moving actors and stop move tick."""
-    global _moving_actors
+    """Clear moving actors and traffic and stop move tick."""
+    global _moving_actors, _traffic
+    movers = len(_moving_actors)
+    vehicles = _traffic["system"].vehicle_count() if _traffic is not None else 0
+    _moving_actors.clear()
+    _traffic = None
+    _stop_move_tick()
+    log(f"Stopped move tick: cleared {movers} moving actors and {vehicles} lane vehicles (left where they are)")
+    return {"moving_actors": movers, "lane_vehicles": vehicles}
+
+def _lane_points(actor):
+    """Out-and-back lane points along a highway/bridge plane's local X axis."""
+    loc = actor.get_actor_location()
+    scale = actor.get_actor_scale3d()
+    forward = actor.get_actor_forward_vector()
+    right = actor.get_actor_right_vector()
+    half = abs(scale.x) * 50.0
+    lateral = abs(scale.y) * 100.0 * TRAFFIC_LANE_OFFSET_FRACTION
+    start = (loc.x - forward.x * half, loc.y - forward.y * half, loc.z + TRAFFIC_LANE_HEIGHT_CM)
+    end = (loc.x + forward.x * half, loc.y + forward.y * half, loc.z + TRAFFIC_LANE_HEIGHT_CM)
+    return uat_traffic.loop_points(start, end, (right.x * lateral, right.y * lateral, 0.0))
+
+def build_traffic_lanes():
+    """Move cars and drones onto lane loops generated along the level's highways and bridges.
+
+    Vehicles leave the free-bounce move tick and follow their lane by arc
+    length; car/drone lights (CarLight_<n> / DroneLight_<n>) are attached to
+    their vehicle. Returns the number of vehicles placed.
+    """
+    global _traffic, _moving_actors
+    decks = [
+        a for a in unreal.EditorLevelLibrary.get_all_level_actors() or []
+        if isinstance(a, unreal.StaticMeshActor) and outliner_category(a) == "Bridges_And_Highways"
+    ]
+    if not decks:
+        log("Traffic: no Highway/Bridge actors found (instanced builds keep them in HISM actors)")
+        return 0
+    system = uat_traffic.Traffic(TRAFFIC_MIN_GAP_CM)
+    for deck in sorted(decks, key=lambda a: a.get_actor_label()):
+        system.add_lane(uat_traffic.Lane(deck.get_actor_label(), _lane_points(deck), TRAFFIC_SAMPLE_CM))
+
+    _motion_store()
+    by_label = {m.actor.get_actor_label(): m for m in _moving_actors if m.actor is not None}
+    actors = {}
+    placed = set()
+    load = [0.0] * len(system.lanes)
+    for label, m in sorted(by_label.items()):
+        if m.kind & MOVE_LIGHT:
+            continue
+        category = outliner_category(m.actor)
+        if category not in ("Vehicles", "Drones"):
+            continue
+        # Least-loaded lane per unit length keeps density even across decks.
+        index = min(range(len(system.lanes)), key=lambda i: load[i] / system.lanes[i].length)
+        lane = system.lanes[index]
+        load[index] += 1.0
+        speed = min(max(math.hypot(m.vx, m.vy), TRAFFIC_SPEED_RANGE[0]), TRAFFIC_SPEED_RANGE[1])
+        height = TRAFFIC_DRONE_HEIGHT_CM if category == "Drones" else 0.0
+        system.add_vehicle(index, label, random.uniform(0.0, lane.length), speed, height)
+        actors[label] = m.actor
+        placed.add(id(m))
+        for prefix in ("Car_", "Drone_"):
+            light = by_label.get(label.replace(prefix, prefix[:-1] + "Light_")) if prefix in label else None
+            if light is not None and light.kind & MOVE_LIGHT:
+                try:
+                    light.actor.attach_to_actor(m.actor, unreal.AttachmentTransformRules.keep_world_transform)
+                except Exception:
+                    continue
+                # Attached lights keep animating but no longer move on their own.
+                light.kind = MOVE_LIGHT
+    _moving_actors = [m for m in _moving_actors if id(m) not in placed]
+    _traffic = {"system": system, "actors": actors, "written": {}}
+    _ensure_move_tick()
+    log(f"Traffic: {system.vehicle_count()} vehicles on {len(system.lanes)} lane loops")
+    return system.vehicle_count()
+
+def _bounce_path(pos, vel, seconds, max_points):
+    """Control points (relative to pos) and duration of a jitter-free bounce inside _MOVE_BOUNDS."""
+    lo = (-_MOVE_BOUNDS.x, -_MOVE_BOUNDS.y, _MOVE_Z_MIN)
+    hi = (_MOVE_BOUNDS.x, _MOVE_BOUNDS.y, _MOVE_BOUNDS.z)
+    p = [min(max(pos[i], lo[i]), hi[i]) for i in range(3)]
+    v = list(vel)
+    points = [tuple(p[i] - pos[i] for i in range(3))]
+    elapsed = 0.0
+    while elapsed < seconds and len(points) < max_points:
+        hits = [
+            ((hi[i] if v[i] > 0.0 else lo[i]) - p[i]) / v[i] if abs(v[i]) > 1e-6 else float("inf")
+            for i in range(3)
+        ]
+        if min(hits) == float("inf"):
+            break
+        dt = min(min(hits), seconds - elapsed)
+        p = [p[i] + v[i] * dt for i in range(3)]
+        for i in range(3):
+            if hits[i] <= dt + 1e-6:
+                v[i] = -v[i]
+        elapsed += dt
+        points.append(tuple(p[i] - pos[i] for i in range(3)))
+    return points, elapsed
+
+def _bake_rotation(actor, yaw_deg_per_sec, pivot=None):
+    comp = _add_component(actor, unreal.RotatingMovementComponent)
+    if comp is None:
+        return False
+    comp.set_editor_property("rotation_rate", unreal.Rotator(roll=0.0, pitch=0.0, yaw=yaw_deg_per_sec))
+    if pivot is not None:
+        # Pivot is in the actor's frame; baked orbits start from a zero rotation.
+        actor.set_actor_rotation(unreal.Rotator(0.0, 0.0, 0.0), teleport_physics=True)
+        comp.set_editor_property("pivot_translation", pivot)
+    return True
+
+def _bake_interp_path(actor, points, duration):
+    comp = _add_component(actor, unreal.InterpToMovementComponent)
+    if comp is None:
+        return False
+    comp.set_editor_property("duration", duration)
+    comp.set_editor_property("behaviour_type", unreal.InterpToBehaviourType.PING_PONG)
+    comp.set_editor_property("control_points", [
+        unreal.InterpControlPoint(position_control_point=unreal.Vector(*point), position_is_relative=True)
+        for point in points
+    ])
+    try:
+        comp.finalise_control_points()
+    except Exception:
+        pass
+    return True
+
+def _lane_sequence(lane, frames):
+    """Empty LevelSequence asset of frames at TRAFFIC_BAKE_FPS for a lane, replacing an earlier bake."""
+    world = unreal.EditorLevelLibrary.get_editor_world()
+    folder = f"{TRAFFIC_SEQUENCE_DIR}/{world.get_name() if world else 'Untitled'}"
+    name = f"LS_Traffic_{lane.name}"
+    if unreal.EditorAssetLibrary.does_asset_exist(f"{folder}/{name}"):
+        unreal.EditorAssetLibrary.delete_asset(f"{folder}/{name}")
+    make_directory(folder)
+    sequence = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+        name, folder, unreal.LevelSequence, unreal.LevelSequenceFactoryNew()
+    )
+    if sequence is None:
+        return None
+    sequence.set_display_rate(unreal.FrameRate(TRAFFIC_BAKE_FPS, 1))
+    sequence.set_playback_start(0)
+    sequence.set_playback_end(frames)
+    return sequence
+
+def _key_vehicle_track(sequence, actor, path, frames):
+    """Bind actor to sequence and key its location and heading at each (x, y, z, yaw) of path over frames."""
+    binding = sequence.add_possessable(actor)
+    section = binding.add_track(unreal.MovieScene3DTransformTrack).add_section()
+    section.set_range(0, frames)
+    # Location X/Y/Z, rotation roll/pitch/yaw, scale X/Y/Z.
+    channels = list(section.get_all_channels())
+    rotation = actor.get_actor_rotation()
+    scale = actor.get_actor_scale3d()
+    for channel, value in zip(channels[3:5] + channels[6:9], (rotation.roll, rotation.pitch, scale.x, scale.y, scale.z)):
+        channel.set_default(value)
+    keyed = channels[0:3] + channels[5:6]
+    step = frames / (len(path) - 1)
+    for k, (x, y, z, yaw) in enumerate(path):
+        frame = k * step
+        whole = int(frame)
+        for channel, value in zip(keyed, (x, y, z, yaw + TRAFFIC_YAW_OFFSET)):
+            channel.add_key(
+                unreal.FrameNumber(whole), value, sub_frame=frame - whole,
+                interpolation=unreal.MovieSceneKeyInterpolation.LINEAR,
+            )
+
+def _bake_lane_sequence(lane, vehicles, lap):
+    """Bake [(Vehicle, actor)] on lane into a looping sequence played by a TrafficLane_<deck> actor.
+
+    Every vehicle goes once around the lane per lap seconds (rounded to whole
+    frames), keyed every TRAFFIC_BAKE_KEY_CM with the lane heading, so both
+    carriageways drive forwards and the spacing at bake time holds. Returns
+    the number of vehicles keyed.
+    """
+    frames = max(1, round(lap * TRAFFIC_BAKE_FPS))
+    count = max(8, math.ceil(lane.length / TRAFFIC_BAKE_KEY_CM))
+    sequence = _lane_sequence(lane, frames)
+    if sequence is None:
+        unreal.log_warning(f"[UAT] Bake motion could not create a traffic sequence for {lane.name}")
+        return 0
+    keyed = 0
+    for vehicle, actor in vehicles:
+        try:
+            path = lane.loop_path(vehicle.distance, count, vehicle.height)
+            x, y, z, yaw = path[0]
+            root = actor.get_editor_property("root_component")
+            if root:
+                root.set_mobility(unreal.ComponentMobility.MOVABLE)
+            actor.set_actor_location_and_rotation(
+                unreal.Vector(x, y, z), unreal.Rotator(roll=0.0, pitch=0.0, yaw=yaw + TRAFFIC_YAW_OFFSET),
+                sweep=False, teleport=True
+            )
+            _key_vehicle_track(sequence, actor, path, frames)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Bake motion failed for lane vehicle {vehicle.key}: {exc}")
+            continue
+        actor.tags = list(actor.tags) + [unreal.Name(BAKED_MOTION_TAG)]
+        keyed += 1
+    label = f"TrafficLane_{lane.name}"
+    old = _find_actor_by_label(label)
+    if old:
+        actor_sub().destroy_actor(old)
+    start = lane.position_at(0.0)
+    player = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.LevelSequenceActor, unreal.Vector(*start[:3]))
+    player.set_sequence(sequence)
+    settings = player.get_editor_property("playback_settings")
+    settings.set_editor_property("auto_play", True)
+    settings.set_editor_property("loop_count", unreal.MovieSceneSequenceLoopCount(value=-1))
+    player.set_editor_property("playback_settings", settings)
+    player.set_actor_label(label)
+    player.tags = [unreal.Name(BAKED_MOTION_TAG)]
+    _set_folder(player, "Traffic")
+    unreal.EditorAssetLibrary.save_loaded_asset(sequence)
+    return keyed
+
+def _bake_traffic(counts):
+    """Bake lane traffic into one looping Level Sequence per occupied lane (see _bake_lane_sequence)."""
+    system = _traffic["system"]
+    actors = _traffic["actors"]
+    for index, (lane, queue) in enumerate(zip(system.lanes, system.vehicles)):
+        lap = system.lap_seconds(index)
+        vehicles = [
+            (vehicle, actors[vehicle.key]) for vehicle in queue
+            if actors.get(vehicle.key) is not None and unreal.Name(BAKED_MOTION_TAG) not in actors[vehicle.key].tags
+        ]
+        if not vehicles or lap <= 0.0:
+            continue
+        try:
+            keyed = _bake_lane_sequence(lane, vehicles, lap)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Bake motion failed for lane {lane.name}: {exc}")
+            keyed = 0
+        if keyed:
+            counts["lanes"] += 1
+        counts["lane_vehicles"] += keyed
+        counts["failed"] += len(vehicles) - keyed
+
+def bake_motion(seconds=None):
+    """Turn Python-ticked motion into engine movement components and stop the Python ticks.
+
+    Orbiting lights and rotating cubes get a RotatingMovementComponent;
+    bouncing cars, drones and lights get an InterpToMovementComponent that
+    ping-pongs along BAKE_MOTION_SECONDS of their bounce path (without the
+    random jitter). Lane traffic is keyed into a looping Level Sequence per
+    lane, played by a TrafficLane_<deck> actor (see _bake_lane_sequence);
+    attached car/drone lights ride along. Moving lights keep their base intensity and first
+    colour. Baked actors are tagged BAKED_MOTION_TAG and skipped on later bakes.
+    """
+    global _traffic
+    seconds = BAKE_MOTION_SECONDS if seconds is None else seconds
+    _motion_store()
+    counts = {"interp": 0, "rotating": 0, "static": 0, "attached": 0, "lanes": 0, "lane_vehicles": 0, "failed": 0}
+    for m in list(_moving_actors):
+        actor = m.actor
+        try:
+            if actor is None or unreal.Name(BAKED_MOTION_TAG) in actor.tags:
+                continue
+            if not m.kind & (MOVE_LINEAR | MOVE_ORBIT):
+                # Animate-only light attached to a traffic vehicle: it moves with
+                # the baked vehicle, so only its light state is frozen.
+                m.light_comp.set_editor_property("intensity", m.base_intensity)
+                set_light_color_safe(m.light_comp, unreal.LinearColor(*m.rgb_a, 1.0))
+                actor.tags = list(actor.tags) + [unreal.Name(BAKED_MOTION_TAG)]
+                counts["attached"] += 1
+                continue
+            root = actor.get_editor_property("root_component")
+            if root:
+                root.set_mobility(unreal.ComponentMobility.MOVABLE)
+            if m.pos is not None:
+                actor.set_actor_location(unreal.Vector(*m.pos), sweep=False, teleport=True)
+            loc = actor.get_actor_location()
+            if m.kind & MOVE_ORBIT:
+                pivot = unreal.Vector(m.center_x - loc.x, m.center_y - loc.y, 0.0)
+                ok = _bake_rotation(actor, math.degrees(m.speed), pivot)
+                kind = "rotating"
+            else:
+                points, duration = _bounce_path((loc.x, loc.y, loc.z), (m.vx, m.vy, m.vz), seconds, BAKE_MOTION_MAX_POINTS)
+                if duration > 0.0:
+                    ok = _bake_interp_path(actor, points, duration)
+                    kind = "interp"
+                else:
+                    ok, kind = True, "static"
+            if m.kind & MOVE_LIGHT:
+                m.light_comp.set_editor_property("intensity", m.base_intensity)
+                set_light_color_safe(m.light_comp, unreal.LinearColor(*m.rgb_a, 1.0))
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Bake motion failed for {actor.get_actor_label() if actor else 'actor'}: {exc}")
+            ok = False
+        if ok:
+            actor.tags = list(actor.tags) + [unreal.Name(BAKED_MOTION_TAG)]
+            counts[kind] += 1
+        else:
+            counts["failed"] += 1
+    for actor in list(_rotating_cubes):
+        if actor is None or unreal.Name(BAKED_MOTION_TAG) in actor.tags:
+            continue
+        if _bake_rotation(actor, CUBE_ROTATE_DEG_PER_SEC):
+            actor.tags = list(actor.tags) + [unreal.Name(BAKED_MOTION_TAG)]
+            counts["rotating"] += 1
+        else:
+            counts["failed"] += 1
+    if _traffic is not None:
+        _bake_traffic(counts)
+    _traffic = None
     _moving_actors.clear()
+    _rotating_cubes.clear()
     _stop_move_tick()
-    log("Stopped move tick and cleared moving actors")
+    _stop_rotate_tick()
+    log(
+        f"Baked motion: interp={counts['interp']} rotating={counts['rotating']} static={counts['static']} "
+        f"attached_lights={counts['attached']} lane_vehicles={counts['lane_vehicles']} on {counts['lanes']} lane(s) "
+        f"failed={counts['failed']}; Python move/rotate ticks stopped"
+    )
+    return counts
 
 def spawn_marker_near_camera():
     """Spawn a large red sphere marker near the current viewport camera."""
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     red_mat = ensure_emissive_material("M_UAT_Test_Red", unreal.LinearColor(1.0, 0.1, 0.1, 1.0), emissive_boost=6.0)
     cam_loc = unreal.Vector(0.0, 0.0, 200.0)
     cam_rot = unreal.Rotator(0.0, 0.0, 0.0)
@@ -802,7 +2366,7 @@ def spawn_red_lights_near_camera():
 
 def spawn_floating_spheres(count=5):
     """Spawn glowing spheres that float around the city."""
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     if not sphere:
         unreal.log_error(f"[UAT] Sphere mesh not found: {SPHERE_MESH_PATH}")
         return
@@ -833,18 +2397,19 @@ def spawn_floating_spheres(count=5):
             _set_folder(actor, "FX_Lights")
     log(f"Spawned {count} floating spheres")
 
-def spawn_crowd(count=20):
+def spawn_crowd(count=20, color_mode=None):
     """Spawn simple walking crowd using mannequin mesh if available."""
     mesh = _load_first_asset([
         "/Engine/Characters/Mannequins/Meshes/SK_Manny.SK_Manny",
         "/Engine/Characters/Mannequins/Meshes/SK_Mannequin.SK_Mannequin",
         "/Engine/Characters/Mannequins/Meshes/SK_Quinn.SK_Quinn",
     ])
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
+    cube = load_asset_cached(CUBE_MESH_PATH)
     base_range = 1400.0
     min_z = 0.0
     max_z = 10.0
     spawned = 0
+    shared_mat = ensure_custom_data_material() if (color_mode or COLOR_MODE) == "custom_data" else None
     for i in range(count):
         glow_color = unreal.LinearColor(
             random.uniform(0.2, 1.0),
@@ -852,8 +2417,9 @@ def spawn_crowd(count=20):
             random.uniform(0.2, 1.0),
             1.0
         )
-        glow_mat = ensure_emissive_material(
-            f"M_UAT_CrowdGlow_{i+1}",
+        # Random colours get no alias: a fixed name would be re-pointed every spawn.
+        glow_mat = shared_mat or ensure_emissive_material(
+            None,
             glow_color,
             emissive_boost=6.0
         )
@@ -874,12 +2440,16 @@ def spawn_crowd(count=20):
                 comp.set_skeletal_mesh(mesh)
                 comp.set_world_scale3d(unreal.Vector(1.0, 1.0, 1.0))
                 comp.set_material(0, glow_mat)
+                if shared_mat:
+                    set_custom_color(comp, glow_color, 6.0)
         elif cube:
             actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, start)
             comp = actor.get_component_by_class(unreal.StaticMeshComponent)
             comp.set_static_mesh(cube)
             comp.set_world_scale3d(unreal.Vector(0.35, 0.35, 1.7))
             comp.set_material(0, glow_mat)
+            if shared_mat:
+                set_custom_color(comp, glow_color, 6.0)
         else:
             continue
         actor.set_actor_label(f"Crowd_{i+1}")
@@ -890,11 +2460,11 @@ def spawn_crowd(count=20):
 
 def spawn_car_placeholders(count=18):
     """Spawn simple car placeholders moving around the city."""
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     if not plane:
         unreal.log_error(f"[UAT] Plane mesh not found: {PLANE_MESH_PATH}")
         return
-    car_mat = ensure_emissive_material("M_UAT_Scifi_Car", unreal.LinearColor(0.1, 0.8, 1.0, 1.0), emissive_boost=8.0)
+    car_mat = ensure_emissive_material("M_UAT_Scifi_Car_Placeholder", unreal.LinearColor(0.1, 0.8, 1.0, 1.0), emissive_boost=8.0)
     radius = 1800.0
     base_z = 260.0
     for i in range(count):
@@ -966,9 +2536,9 @@ def setup_overview_plane():
 
 def spawn_asset_line(base_loc, step=unreal.Vector(0.0, 400.0, 0.0)):
     """Place one static sample of each major asset type with labels (no animation)."""
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
+    cube = load_asset_cached(CUBE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     base_mat = ensure_material("M_UAT_Scifi_Base", unreal.LinearColor(0.05, 0.08, 0.12, 1.0))
     cyan = ensure_emissive_material("M_UAT_Scifi_Cyan", unreal.LinearColor(0.0, 0.75, 1.0, 1.0), emissive_boost=12.0)
     magenta = ensure_emissive_material("M_UAT_Scifi_Magenta", unreal.LinearColor(1.0, 0.1, 0.65, 1.0), emissive_boost=12.0)
@@ -1037,6 +2607,54 @@ def spawn_asset_line(base_loc, step=unreal.Vector(0.0, 400.0, 0.0)):
 
     log(f"Asset line spawned at {base_loc} with {len(items)} items.")
 
+def outliner_category(actor):
+    """Outliner folder (category) for an actor, from its label and class."""
+    label = actor.get_actor_label()
+    lname = label.lower()
+    # Plan labels carry a style prefix ("Neon_Car_3"), so match words as well as prefixes.
+    words = set(lname.split("_"))
+
+    if lname.startswith("hism_"):
+        return "Instanced"
+    if lname.startswith("fogsheet") or lname.startswith("groundfog"):
+        return "FX_Fog"
+    if lname.startswith("water") or "ground" in lname or "plane" in lname:
+        return "Environment"
+    if isinstance(actor, unreal.DirectionalLight) or isinstance(actor, unreal.SkyLight) or isinstance(actor, unreal.ExponentialHeightFog):
+        return "Environment"
+    if "strip" in words or "rail" in words:
+        return "Accents"
+    if lname.startswith("scifitower") or "tower" in lname:
+        return "Buildings"
+    if lname.startswith("bridge") or lname.startswith("highway") or "bridge" in words or "highway" in words:
+        return "Bridges_And_Highways"
+    if "sign" in lname or "billboard" in lname:
+        return "Signs_And_Billboards"
+    if lname.startswith("car") or "car" in words:
+        return "Vehicles"
+    if "drone" in lname:
+        return "Drones"
+    if "movinglight" in lname or "glow" in lname:
+        return "FX_Lights"
+    if lname.startswith("crowd"):
+        return "Crowd"
+    if lname.startswith("showcase") or lname.startswith("ov_") or lname.startswith("overview_"):
+        return "Showcase"
+    if lname.startswith("debug") or lname.startswith("test"):
+        return "Debug"
+    # fallback buckets
+    cls_name = actor.get_class().get_name().lower()
+    if (
+        isinstance(actor, unreal.PointLight)
+        or isinstance(actor, unreal.SpotLight)
+        or isinstance(actor, unreal.RectLight)
+        or "light" in cls_name
+    ):
+        return "Misc_Lights"
+    if isinstance(actor, unreal.StaticMeshActor):
+        return "Misc_StaticMesh"
+    return "Misc_Uncategorized"
+
 def organize_outliner():
     """Group scene actors into Outliner folders and parent vehicle lights."""
     actors = list(unreal.EditorLevelLibrary.get_all_level_actors() or [])
@@ -1056,51 +2674,124 @@ def organize_outliner():
                     pass
 
     for actor in actors:
-        if not actor:
-            continue
-        label = actor.get_actor_label()
-        lname = label.lower()
-
-        if lname.startswith("water") or "ground" in lname or "plane" in lname:
-            _set_folder(actor, "Environment")
-        elif isinstance(actor, unreal.DirectionalLight) or isinstance(actor, unreal.SkyLight) or isinstance(actor, unreal.ExponentialHeightFog):
-            _set_folder(actor, "Environment")
-        elif lname.startswith("scifitower") or "tower" in lname:
-            _set_folder(actor, "Buildings")
-        elif lname.startswith("bridge") or lname.startswith("highway"):
-            _set_folder(actor, "Bridges_And_Highways")
-        elif "sign" in lname or "billboard" in lname:
-            _set_folder(actor, "Signs_And_Billboards")
-        elif lname.startswith("car"):
-            _set_folder(actor, "Vehicles")
-        elif "drone" in lname:
-            _set_folder(actor, "Drones")
-        elif "movinglight" in lname or "glow" in lname:
-            _set_folder(actor, "FX_Lights")
-        elif lname.startswith("showcase") or lname.startswith("ov_") or lname.startswith("overview_"):
-            _set_folder(actor, "Showcase")
-        elif lname.startswith("debug") or lname.startswith("test"):
-            _set_folder(actor, "Debug")
-        else:
-            # fallback buckets
-            cls_name = actor.get_class().get_name().lower()
-            if (
-                isinstance(actor, unreal.PointLight)
-                or isinstance(actor, unreal.SpotLight)
-                or isinstance(actor, unreal.RectLight)
-                or "light" in cls_name
-            ):
-                _set_folder(actor, "Misc_Lights")
-            elif isinstance(actor, unreal.StaticMeshActor):
-                _set_folder(actor, "Misc_StaticMesh")
-            else:
-                _set_folder(actor, "Misc_Uncategorized")
+        if actor:
+            _set_folder(actor, outliner_category(actor))
 
     attach_light("CarLight_", "Car_")
     attach_light("DroneLight_", "Drone_")
 
     log("Organized Outliner folders and parented vehicle lights.")
 
+_MOBILITY = {
+    "static": unreal.ComponentMobility.STATIC,
+    "stationary": unreal.ComponentMobility.STATIONARY,
+    "movable": unreal.ComponentMobility.MOVABLE,
+}
+
+def _report_value(value):
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    return str(value).split(".")[-1].rstrip(">").strip()
+
+def _render_setting(comp, key, value):
+    """(property, old, new, setter) for one profile key on a component, or None when it does not apply."""
+    is_light = isinstance(comp, unreal.LightComponent)
+    if key == "cull_distance":
+        prop = "max_draw_distance" if is_light else "ld_max_draw_distance"
+        setter = None if is_light else getattr(comp, "set_cull_distance", None)
+        value = float(value)
+    elif key == "cast_shadow":
+        prop = "cast_shadows" if is_light else "cast_shadow"
+        setter = None if is_light else comp.set_cast_shadow
+        value = bool(value)
+    elif key == "mobility":
+        prop = "mobility"
+        setter = comp.set_mobility
+        value = _MOBILITY[value]
+    elif key == "translucency_sort_priority":
+        if is_light:
+            return None
+        prop = "translucency_sort_priority"
+        setter = comp.set_translucent_sort_priority
+        value = int(value)
+    elif key == "collision":
+        if is_light:
+            return None
+        old = comp.get_collision_enabled()
+        new = unreal.CollisionEnabled.QUERY_AND_PHYSICS if value else unreal.CollisionEnabled.NO_COLLISION
+        return "collision_enabled", old, new, comp.set_collision_enabled
+    else:
+        return None
+    try:
+        old = comp.get_editor_property(prop)
+    except Exception:
+        return None
+    return prop, old, value, setter or (lambda v: comp.set_editor_property(prop, v))
+
+def optimize_render_cost(actors=None, profile=None, dry_run=False, write_report=True):
+    """Apply RENDER_PROFILE per outliner category and report every property that changed.
+
+    Covers cull distance, shadow casting, collision, mobility and translucency
+    sort priority on each mesh and light component; keys missing from a
+    category's profile are left alone. Actors driven by the move tick always
+    stay movable. Returns the report dict (also written to Saved/Automation).
+    """
+    profile = RENDER_PROFILE if profile is None else profile
+    if actors is None:
+        actors = list(unreal.EditorLevelLibrary.get_all_level_actors() or [])
+    moving = {m.actor for m in _moving_actors}
+    changes = []
+    summary = {}
+    scanned = 0
+    for actor in actors:
+        if not actor:
+            continue
+        category = outliner_category(actor)
+        settings = profile.get(category)
+        if not settings:
+            continue
+        if actor in moving and settings.get("mobility") != "movable":
+            settings = dict(settings, mobility="movable")
+        scanned += 1
+        label = actor.get_actor_label()
+        comps = list(actor.get_components_by_class(unreal.PrimitiveComponent) or [])
+        comps += list(actor.get_components_by_class(unreal.LightComponent) or [])
+        for comp in comps:
+            for key, value in settings.items():
+                setting = _render_setting(comp, key, value)
+                if setting is None:
+                    continue
+                prop, old, new, setter = setting
+                if isinstance(old, float) and abs(old - new) < 0.5 or old == new:
+                    continue
+                if not dry_run:
+                    try:
+                        setter(new)
+                    except Exception as exc:
+                        unreal.log_warning(f"[UAT] Render opt: {label}.{comp.get_name()}.{prop} failed: {exc}")
+                        continue
+                changes.append({
+                    "actor": label,
+                    "category": category,
+                    "component": comp.get_name(),
+                    "property": prop,
+                    "old": _report_value(old),
+                    "new": _report_value(new),
+                })
+                counts = summary.setdefault(category, {})
+                counts[key] = counts.get(key, 0) + 1
+
+    report = {"timestamp": ts(), "dry_run": dry_run, "actors": scanned, "summary": summary, "changes": changes}
+    out_path = None
+    if write_report and changes:
+        out_path = os.path.join(automation_dir(), f"render_opt_{report['timestamp']}.json")
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    for category, counts in sorted(summary.items()):
+        log(f"Render opt {category}: " + ", ".join(f"{key}={n}" for key, n in sorted(counts.items())))
+    log(f"Render opt: actors={scanned} changes={len(changes)} dry_run={dry_run} report={out_path}")
+    return report
+
 def lights_showcase_only():
     """Turn off all point/spot/rect lights except the lineup/showcase lights."""
     actors = list(unreal.EditorLevelLibrary.get_all_level_actors() or [])
@@ -1141,52 +2832,338 @@ def lights_showcase_only():
     log(f"Lights limited to showcase: kept={kept}, turned_off={off}")
 
 def lights_keep_three():
-    """Turn off all point/spot/rect lights except three (prefers Showcase/Line/Debug)."""
-    actors = list(unreal.EditorLevelLibrary.get_all_level_actors() or [])
+    """Keep the three highest-scoring point/spot/rect lights in the level (one budget cell)."""
+    return optimize_light_budget(max_per_cell=3, cell_size=0.0)
+
+def _light_budget_path():
+    return os.path.join(automation_dir(), LIGHT_BUDGET_STATE_NAME)
+
+def _load_light_budget_state():
+    """Return {level_path: {light key: saved light state}} (keys from _light_state_key)."""
+    path = _light_budget_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Light budget state unreadable, ignoring: {exc}")
+        return {}
+
+def _save_light_budget_state(state):
+    with open(_light_budget_path(), "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+def _light_state_key(actor):
+    """Saved-state key for a light: its plan id when tagged, else its object path.
+
+    Labels are not unique (plan levels repeat CarLight_ etc.), so a label key
+    let one light's saved state overwrite another's.
+    """
+    item_id, _ = _plan_actor_tags(actor)
+    return f"{PLAN_ID_TAG}{item_id}" if item_id else actor.get_path_name()
+
+def _local_lights():
+    """[(actor, light component)] for every point/spot/rect light in the level."""
     lights = []
-    for actor in actors:
+    for actor in unreal.EditorLevelLibrary.get_all_level_actors() or []:
         if not actor:
             continue
-        cls = actor.get_class()
-        cname = cls.get_name().lower() if cls else ""
-        if (
-            isinstance(actor, unreal.PointLight)
-            or isinstance(actor, unreal.SpotLight)
-            or isinstance(actor, unreal.RectLight)
-            or "light" in cname
-        ):
-            lights.append(actor)
-
-    def priority(a):
-        lbl = a.get_actor_label().lower()
-        if lbl.startswith("line_") or lbl.startswith("showcase_") or lbl.startswith("debug_"):
-            return (0, lbl)
-        return (1, lbl)
-
-    lights.sort(key=priority)
-    keep = set(lights[:3])
-    kept = len(keep)
-    off = 0
-
-    for actor in lights:
-        if actor in keep:
-            continue
-        comp = None
-        if isinstance(actor, unreal.PointLight):
-            comp = actor.get_component_by_class(unreal.PointLightComponent)
-        elif isinstance(actor, unreal.SpotLight):
-            comp = actor.get_component_by_class(unreal.SpotLightComponent)
-        elif isinstance(actor, unreal.RectLight):
-            comp = actor.get_component_by_class(unreal.RectLightComponent)
+        comp = actor.get_component_by_class(unreal.LocalLightComponent)
         if comp:
-            try:
+            lights.append((actor, comp))
+    return lights
+
+def _light_overlap(a, b):
+    """Fraction (0..1) of the smaller attenuation sphere that overlaps the other."""
+    dist = (a["loc"] - b["loc"]).length()
+    small = min(a["radius"], b["radius"])
+    if small <= 0.0:
+        return 0.0
+    return max(0.0, min(1.0, (a["radius"] + b["radius"] - dist) / (2.0 * small)))
+
+def _light_budget_cell(loc, cell_size):
+    if cell_size <= 0.0:
+        return (0, 0, 0)
+    return (math.floor(loc.x / cell_size), math.floor(loc.y / cell_size), math.floor(loc.z / cell_size))
+
+def _neighbour_cells(cell):
+    x, y, z = cell
+    return [(x + dx, y + dy, z + dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+
+def optimize_light_budget(max_per_cell=None, cell_size=None, mode=None):
+    """Keep at most max_per_cell dynamic lights per grid cell and disable or demote the rest.
+
+    Lights are binned by location into cells of cell_size cm (<= 0 puts every
+    light in one cell). Within a cell they are picked greedily by
+    intensity x priority / (1 + attenuation overlap with lights already kept
+    in the cell or its neighbours), so clustered lights lose to isolated ones.
+    mode "disable" zeroes the rest; "demote" drops their shadows and shrinks
+    their attenuation radius. The previous state is saved per level for
+    restore_light_budget(); a re-run restores first, so budgets do not stack.
+    """
+    max_per_cell = LIGHT_BUDGET_PER_CELL if max_per_cell is None else max_per_cell
+    cell_size = LIGHT_BUDGET_CELL_CM if cell_size is None else cell_size
+    mode = mode or LIGHT_BUDGET_MODE
+    if mode not in ("disable", "demote"):
+        raise ValueError(f"Unknown light budget mode {mode!r}")
+    restore_light_budget(quiet=True)
+
+    movers = _light_movers()
+    cells = {}
+    for actor, comp in _local_lights():
+        label = actor.get_actor_label()
+        mover = movers.get(id(comp))
+        intensity = mover.base_intensity if mover else comp.get_editor_property("intensity")
+        if not comp.is_visible() or intensity <= 0.0:
+            continue
+        lname = label.lower()
+        weight = LIGHT_BUDGET_SHOWCASE_WEIGHT if lname.startswith(("line_", "showcase_", "debug_")) else 1.0
+        loc = actor.get_actor_location()
+        light = {
+            "actor": actor, "comp": comp, "label": label, "mover": mover, "loc": loc,
+            "intensity": intensity, "radius": comp.get_editor_property("attenuation_radius"),
+            "base": intensity * weight,
+        }
+        cells.setdefault(_light_budget_cell(loc, cell_size), []).append(light)
+
+    kept = {}
+    rest = []
+    for cell in sorted(cells):
+        candidates = list(cells[cell])
+        chosen = kept.setdefault(cell, [])
+        while candidates and len(chosen) < max_per_cell:
+            nearby = [k for n in _neighbour_cells(cell) for k in kept.get(n, [])]
+            for light in candidates:
+                light["score"] = light["base"] / (1.0 + sum(_light_overlap(light, k) for k in nearby))
+            best = max(candidates, key=lambda l: l["score"])
+            candidates.remove(best)
+            chosen.append(best)
+        rest += candidates
+
+    state = _load_light_budget_state()
+    saved = state.setdefault(_current_level_key(), {})
+    for light in rest:
+        comp = light["comp"]
+        saved[_light_state_key(light["actor"])] = {
+            "label": light["label"],
+            "intensity": light["intensity"],
+            "visible": True,
+            "cast_shadows": comp.get_editor_property("cast_shadows"),
+            "attenuation_radius": light["radius"],
+            "moving": light["mover"] is not None,
+        }
+        try:
+            if mode == "disable":
                 comp.set_editor_property("intensity", 0.0)
-                comp.set_editor_property("visibility", False)
-            except Exception:
-                pass
-    off += 1
+                comp.set_visibility(False)
+                if light["mover"]:
+                    light["mover"].base_intensity = 0.0
+            else:
+                comp.set_editor_property("cast_shadows", False)
+                comp.set_editor_property("attenuation_radius", light["radius"] * LIGHT_BUDGET_DEMOTE_RADIUS_SCALE)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Light budget could not {mode} {light['label']}: {exc}")
+    _save_light_budget_state(state)
+
+    kept_count = sum(len(k) for k in kept.values())
+    busiest = max((len(c) for c in cells.values()), default=0)
+    log(
+        f"Light budget: cells={len(cells)} (max {busiest} lights/cell), kept={kept_count}, "
+        f"{mode}d={len(rest)}, max_per_cell={max_per_cell}, cell={cell_size:.0f}cm"
+    )
+    return {"cells": len(cells), "kept": kept_count, mode: len(rest)}
+
+def restore_light_budget(quiet=False):
+    """Undo optimize_light_budget on the current level from the saved light state."""
+    state = _load_light_budget_state()
+    saved = state.pop(_current_level_key(), None)
+    if not saved:
+        if not quiet:
+            log("Light budget: nothing to restore for this level")
+        return 0
+    movers = _light_movers()
+    restored = 0
+    pending = dict(saved)
+    for actor, comp in _local_lights():
+        # States saved before lights were keyed by path/plan id used the label.
+        entry = pending.pop(_light_state_key(actor), None) or pending.pop(actor.get_actor_label(), None)
+        if not entry:
+            continue
+        try:
+            comp.set_editor_property("intensity", entry["intensity"])
+            comp.set_visibility(entry["visible"])
+            comp.set_editor_property("cast_shadows", entry["cast_shadows"])
+            comp.set_editor_property("attenuation_radius", entry["attenuation_radius"])
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Light budget could not restore {actor.get_actor_label()}: {exc}")
+            continue
+        mover = movers.get(id(comp))
+        if mover:
+            mover.base_intensity = entry["intensity"]
+        restored += 1
+    _save_light_budget_state(state)
+    if not quiet:
+        log(f"Light budget: restored {restored} of {len(saved)} lights")
+    return restored
+
+def _translucent_material(material):
+    try:
+        base = material.get_base_material()
+        return base.get_editor_property("blend_mode") not in (unreal.BlendMode.BLEND_OPAQUE, unreal.BlendMode.BLEND_MASKED)
+    except Exception:
+        return False
+
+def _registered_tick_callbacks():
+    return {name: entry["enabled"] for name, entry in uat_scheduler.stats()["systems"].items()}
+
+def _level_cost(level_key):
+    """Cost record for the loaded level; every list and dict is sorted so reports diff cleanly."""
+    actors = [a for a in unreal.EditorLevelLibrary.get_all_level_actors() or [] if a]
+    by_class = {}
+    by_folder = {}
+    pairs = set()
+    translucent = {}
+    for actor in actors:
+        cls = actor.get_class().get_name()
+        by_class[cls] = by_class.get(cls, 0) + 1
+        folder = str(actor.get_folder_path()) or "(none)"
+        by_folder[folder] = by_folder.get(folder, 0) + 1
+        for comp in actor.get_components_by_class(unreal.StaticMeshComponent) or []:
+            mesh = comp.get_editor_property("static_mesh")
+            instances = comp.get_instance_count() if isinstance(comp, unreal.InstancedStaticMeshComponent) else 1
+            if not mesh or instances == 0:
+                continue
+            mats = comp.get_materials() or []
+            for mat in mats or [None]:
+                pairs.add((mesh.get_path_name(), mat.get_path_name() if mat else ""))
+            if any(mat and _translucent_material(mat) for mat in mats):
+                # Top-down area in m2: actor bounds, or instance scales (1 m engine plane) for ISMs.
+                if isinstance(comp, unreal.InstancedStaticMeshComponent):
+                    area = 0.0
+                    for i in range(instances):
+                        scale = comp.get_instance_transform(i, True).scale3d
+                        area += abs(scale.x * scale.y)
+                else:
+                    _origin, extent = actor.get_actor_bounds(False)
+                    area = 4.0 * extent.x * extent.y / 10000.0
+                name = outliner_category(actor)
+                translucent[name] = translucent.get(name, 0.0) + area
+
+    lights = []
+    for actor, comp in _local_lights():
+        if comp.is_visible() and comp.get_editor_property("intensity") > 0.0:
+            lights.append({"loc": actor.get_actor_location(), "radius": comp.get_editor_property("attenuation_radius")})
+    overlaps = [sum(1 for other in lights if other is not light and _light_overlap(light, other) > 0.0) for light in lights]
+
+    actor_set = set(actors)
+    moving = sum(1 for m in _moving_actors if m.actor in actor_set)
+    return {
+        "level": level_key,
+        "actors": len(actors),
+        "actors_by_class": dict(sorted(by_class.items())),
+        "actors_by_folder": dict(sorted(by_folder.items())),
+        "mesh_material_pairs": len(pairs),
+        "draw_calls_estimate": _estimate_draw_calls(actors),
+        "dynamic_lights": len(lights),
+        "light_overlap_pairs": sum(overlaps) // 2,
+        "light_overlap_max": max(overlaps, default=0),
+        "light_overlap_mean": round(sum(overlaps) / len(lights), 2) if lights else 0.0,
+        "translucent_area_m2": {k: round(v, 1) for k, v in sorted(translucent.items())},
+        "translucent_area_m2_total": round(sum(translucent.values()), 1),
+        "moving_entities": moving,
+        "tick_callbacks": _registered_tick_callbacks(),
+    }
 
-    log(f"Lights limited to three: kept={kept}, turned_off={off}")
+def _codex_level_paths():
+    paths = set()
+    for asset in unreal.EditorAssetLibrary.list_assets(CODEX_LEVEL_DIR, recursive=False, include_folder=False) or []:
+        data = unreal.EditorAssetLibrary.find_asset_data(asset)
+        if data and str(data.asset_class_path.asset_name) == "World":
+            paths.add(asset.split(".")[0])
+    return sorted(paths)
+
+def _scene_cost_diff(previous, levels):
+    """Per-level deltas of the headline numbers against the previous report."""
+    before = {entry["level"]: entry for entry in (previous or {}).get("levels", [])}
+    diff = {}
+    for entry in levels:
+        old = before.get(entry["level"])
+        if not old:
+            continue
+        deltas = {
+            key: round(entry[key] - old.get(key, 0), 1)
+            for key in SCENE_COST_DIFF_KEYS
+            if entry[key] != old.get(key, 0)
+        }
+        if deltas:
+            diff[entry["level"]] = deltas
+        old_calls = old.get("draw_calls_estimate", 0)
+        if old_calls and entry["draw_calls_estimate"] > old_calls * SCENE_COST_WARN_RATIO:
+            unreal.log_warning(
+                f"[UAT] {entry['level']}: draw-call estimate {old_calls} -> {entry['draw_calls_estimate']} "
+                f"(> {SCENE_COST_WARN_RATIO:g}x the last report)"
+            )
+    return diff
+
+def scene_cost_report(all_levels=False, save_dirty=False):
+    """Write a JSON cost report for the current level, or every level in CODEX_LEVEL_DIR.
+
+    Saved/Automation/scene_cost_<ts>.json holds the report and
+    scene_cost_latest.json the most recent one; each run is diffed against the
+    previous latest so generator changes show up as deltas in the log.
+    all_levels switches levels, so it refuses (returns None) while a level has
+    unsaved changes unless save_dirty saves them first, and it stops motion
+    and traffic, whose actors are unloaded with the level.
+    """
+    world = unreal.EditorLevelLibrary.get_editor_world()
+    current = world.get_path_name().split(".")[0] if world else None
+    levels = []
+    if all_levels:
+        dirty = [p.get_name() for p in unreal.EditorLoadingAndSavingUtils.get_dirty_map_packages() or []]
+        if dirty and not save_dirty:
+            unreal.log_warning(
+                f"[UAT] Scene cost: unsaved changes in {', '.join(dirty)}; save first or pass save_dirty=True"
+            )
+            return None
+        if dirty:
+            unreal.EditorLevelLibrary.save_all_dirty_levels()
+            log(f"Scene cost: saved {', '.join(dirty)} before switching levels")
+        stop_motion()
+        for level_path in _codex_level_paths():
+            if not unreal.EditorLevelLibrary.load_level(level_path):
+                unreal.log_warning(f"[UAT] Scene cost: could not load {level_path}")
+                continue
+            levels.append(_level_cost(level_path))
+        if current:
+            unreal.EditorLevelLibrary.load_level(current)
+    else:
+        levels.append(_level_cost(current or "None"))
+
+    latest_path = os.path.join(automation_dir(), SCENE_COST_LATEST_NAME)
+    previous = None
+    if os.path.exists(latest_path):
+        try:
+            with open(latest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Previous scene cost report unreadable, not diffing: {exc}")
+    report = {"timestamp": ts(), "levels": levels, "diff": _scene_cost_diff(previous, levels)}
+    out_path = os.path.join(automation_dir(), f"scene_cost_{report['timestamp']}.json")
+    for path in (out_path, latest_path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    for entry in levels:
+        log(
+            f"Scene cost {entry['level']}: actors={entry['actors']} draw_calls~{entry['draw_calls_estimate']} "
+            f"pairs={entry['mesh_material_pairs']} lights={entry['dynamic_lights']} "
+            f"(overlap max {entry['light_overlap_max']}) translucent={entry['translucent_area_m2_total']}m2 "
+            f"moving={entry['moving_entities']}"
+        )
+    for level, deltas in report["diff"].items():
+        log(f"Scene cost diff {level}: " + ", ".join(f"{k} {v:+g}" for k, v in sorted(deltas.items())))
+    log(f"Scene cost report: {len(levels)} level(s) -> {out_path}")
+    return report
 
 def replace_emissive_with_matte():
     """Swap emissive materials to matte base on all static mesh actors."""
@@ -1195,9 +3172,11 @@ def replace_emissive_with_matte():
         "M_UAT_Scifi_Magenta",
         "M_UAT_Scifi_Red",
         "M_UAT_Scifi_Car",
+        "M_UAT_Scifi_Car_Placeholder",
         "M_UAT_Scifi_Drone",
         "M_UAT_Scifi_Water",
         "M_UAT_Test_Red",
+        "M_UAT_Test_Red_Cube",
     }
     base_mat = ensure_material("M_UAT_Scifi_Base", unreal.LinearColor(0.05, 0.08, 0.12, 1.0))
     swapped = 0
@@ -1213,8 +3192,7 @@ def replace_emissive_with_matte():
         for idx, m in enumerate(mats):
             if not m:
                 continue
-            name = m.get_name()
-            if name in emissive_names:
+            if emissive_names.intersection(material_aliases(m)):
                 comp.set_material(idx, base_mat)
                 changed = True
         if changed:
@@ -1228,9 +3206,11 @@ def replace_emissive_with_grey():
         "M_UAT_Scifi_Magenta",
         "M_UAT_Scifi_Red",
         "M_UAT_Scifi_Car",
+        "M_UAT_Scifi_Car_Placeholder",
         "M_UAT_Scifi_Drone",
         "M_UAT_Scifi_Water",
         "M_UAT_Test_Red",
+        "M_UAT_Test_Red_Cube",
         "M_UAT_Float_Glow",
         "M_UAT_NeonFloor",
         "M_UAT_NeonPillar",
@@ -1254,10 +3234,10 @@ def replace_emissive_with_grey():
         for idx, m in enumerate(mats):
             if not m:
                 continue
-            name = m.get_name()
-            lname = name.lower()
+            names = material_aliases(m)
+            lname = " ".join(names).lower()
             if (
-                name in emissive_names
+                emissive_names.intersection(names)
                 or "emissive" in lname
                 or "glow" in lname
                 or "neon" in lname
@@ -1369,7 +3349,7 @@ def raise_fog_layer(height_offset=300.0):
 
 def spawn_fog_sheets(count=3):
     """Spawn translucent fog sheet planes near ground for guaranteed visibility."""
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     if not plane:
         unreal.log_error(f"[UAT] Plane mesh not found: {PLANE_MESH_PATH}")
         return
@@ -1388,7 +3368,7 @@ def spawn_fog_sheets(count=3):
             f"FogSheet_{i+1}"
         )
         if sheet:
-            _set_folder(sheet, "FX_Lights")
+            _set_folder(sheet, "FX_Fog")
     log(f"Spawned {count} fog sheets")
 
 def set_floating_orbs_emissive():
@@ -1417,13 +3397,18 @@ def _build_scifi_landscape_level_impl():
     drones_spawned = 0
     moving_lights_spawned = 0
 
+    cyan_color = unreal.LinearColor(0.0, 0.75, 1.0, 1.0)
+    magenta_color = unreal.LinearColor(1.0, 0.1, 0.65, 1.0)
     base = ensure_material("M_UAT_Scifi_Base", unreal.LinearColor(0.05, 0.08, 0.12, 1.0))
-    cyan = ensure_emissive_material("M_UAT_Scifi_Cyan", unreal.LinearColor(0.0, 0.75, 1.0, 1.0), emissive_boost=12.0)
+    cyan = ensure_emissive_material("M_UAT_Scifi_Cyan", cyan_color, emissive_boost=12.0)
     red = ensure_emissive_material("M_UAT_Scifi_Red", unreal.LinearColor(1.0, 0.25, 0.1, 1.0), emissive_boost=10.0)
-    magenta = ensure_emissive_material("M_UAT_Scifi_Magenta", unreal.LinearColor(1.0, 0.1, 0.65, 1.0), emissive_boost=12.0)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    magenta = ensure_emissive_material("M_UAT_Scifi_Magenta", magenta_color, emissive_boost=12.0)
+    instanced = SCIFI_BUILD_MODE == "instanced"
+    strip_shared = ensure_custom_data_material(per_instance=instanced) if COLOR_MODE == "custom_data" else None
+    batcher = _InstanceBatcher() if instanced else None
+    cube = load_asset_cached(CUBE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     if not cube or not plane or not sphere:
         unreal.log_error("[UAT] Missing cube/plane/sphere mesh; aborting build_scifi_landscape_level")
         return
@@ -1465,20 +3450,23 @@ def _build_scifi_landscape_level_impl():
 
     def spawn_tower(pos, footprint, height, strips=3, hue_shift=False):
         nonlocal towers_spawned
-        tower = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = tower.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, base)
-        comp.set_world_scale3d(unreal.Vector(footprint.x, footprint.y, height))
+        tower_label = f"ScifiTower_{towers_spawned}"
+        _place_mesh(cube, base, pos, unreal.Vector(footprint.x, footprint.y, height), label=tower_label, batcher=batcher)
         # cyan strips
         for i in range(strips):
             offset = (i - strips // 2) * footprint.x * 50.0
-            strip = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos + unreal.Vector(offset, footprint.y * 80.0, height * 50.0))
-            scomp = strip.get_component_by_class(unreal.StaticMeshComponent)
-            scomp.set_static_mesh(cube)
-            scomp.set_material(0, magenta if (hue_shift and i % 2 == 0) else cyan)
-            scomp.set_world_scale3d(unreal.Vector(0.1, 0.4, height * 2.0))
-        tower.set_actor_label(f"ScifiTower_{pos.x}_{pos.y}")
+            if hue_shift and i % 2 == 0:
+                mat, custom = _accent(magenta, magenta_color, 12.0, strip_shared)
+            else:
+                mat, custom = _accent(cyan, cyan_color, 12.0, strip_shared)
+            _place_mesh(
+                cube, mat,
+                pos + unreal.Vector(offset, footprint.y * 80.0, height * 50.0),
+                unreal.Vector(0.1, 0.4, height * 2.0),
+                label=f"{tower_label}_Strip_{i}",
+                batcher=batcher,
+                custom_color=custom
+            )
         towers_spawned += 1
 
     towers = [
@@ -1526,17 +3514,8 @@ def _build_scifi_landscape_level_impl():
         (unreal.Vector(900.0, 0.0, 700.0), unreal.Vector(20.0, 0.7, 0.22)),
     ]
     for i, (pos, scale) in enumerate(bridges):
-        bridge = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = bridge.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_material(0, base)
-        comp.set_world_scale3d(scale)
-        strip = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos + unreal.Vector(0.0, 0.0, 50.0))
-        scomp = strip.get_component_by_class(unreal.StaticMeshComponent)
-        scomp.set_static_mesh(plane)
-        scomp.set_material(0, cyan)
-        scomp.set_world_scale3d(unreal.Vector(scale.x, 0.08, 0.1))
-        bridge.set_actor_label(f"Bridge_{i}")
+        _place_mesh(plane, base, pos, scale, label=f"Bridge_{i}", batcher=batcher)
+        _place_mesh(plane, cyan, pos + unreal.Vector(0.0, 0.0, 50.0), unreal.Vector(scale.x, 0.08, 0.1), label=f"Bridge_{i}_Rail", batcher=batcher)
         bridges_spawned += 1
 
     # mid/highways with magenta/cyan rails
@@ -1547,15 +3526,12 @@ def _build_scifi_landscape_level_impl():
         (unreal.Vector(1100.0, -400.0, 550.0), unreal.Vector(24.0, 0.9, 0.25), 10.0, magenta),
     ]
     for idx, (pos, scl, yaw, mat) in enumerate(highways):
-        road = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = road.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_material(0, mat)
-        comp.set_world_scale3d(scl)
-        road.set_actor_rotation(unreal.Rotator(0.0, yaw, 0.0), teleport_physics=True)
-        road.set_actor_label(f"Highway_{idx}")
+        _place_mesh(plane, mat, pos, scl, rotation=unreal.Rotator(0.0, yaw, 0.0), label=f"Highway_{idx}", batcher=batcher)
         highways_spawned += 1
 
+    if batcher:
+        batcher.flush()
+
     # neon signage at foreground
     sign = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(-1200.0, -200.0, 150.0))
     scomp = sign.get_component_by_class(unreal.StaticMeshComponent)
@@ -1659,185 +3635,55 @@ def _build_scifi_landscape_level_impl():
     log(f"Scifi build summary: towers={towers_spawned}, bridges={bridges_spawned}, highways={highways_spawned}, signs={signs_spawned}, cars={cars_spawned}, drones={drones_spawned}, moving_lights={moving_lights_spawned}, total_actors={total_actors}")
 
 def _scifi_variant_styles():
-    return [
-        {"id": "V01", "seed": 101, "label": "Neon_Azure", "base": (0.05, 0.08, 0.14), "a": (0.0, 0.85, 1.0), "b": (1.0, 0.2, 0.6), "water": (0.02, 0.12, 0.2), "sun": (0.25, 0.55, 1.0), "sun_i": 4.0, "sky_i": 1.1, "fog_d": 0.05, "fog_f": 0.018},
-        {"id": "V02", "seed": 202, "label": "Amber_Rust", "base": (0.12, 0.08, 0.05), "a": (1.0, 0.55, 0.15), "b": (0.9, 0.15, 0.05), "water": (0.08, 0.05, 0.02), "sun": (1.0, 0.85, 0.6), "sun_i": 6.0, "sky_i": 0.8, "fog_d": 0.03, "fog_f": 0.012},
-        {"id": "V03", "seed": 303, "label": "Emerald_Mist", "base": (0.04, 0.09, 0.07), "a": (0.1, 0.95, 0.55), "b": (0.05, 0.65, 1.0), "water": (0.01, 0.1, 0.08), "sun": (0.6, 0.9, 0.8), "sun_i": 4.5, "sky_i": 1.0, "fog_d": 0.06, "fog_f": 0.02},
-        {"id": "V04", "seed": 404, "label": "Cold_Steel", "base": (0.12, 0.13, 0.16), "a": (0.6, 0.9, 1.0), "b": (0.2, 0.55, 0.9), "water": (0.04, 0.08, 0.12), "sun": (0.8, 0.9, 1.0), "sun_i": 5.0, "sky_i": 1.2, "fog_d": 0.04, "fog_f": 0.015},
-        {"id": "V05", "seed": 505, "label": "Crimson_Noir", "base": (0.1, 0.02, 0.03), "a": (1.0, 0.15, 0.2), "b": (1.0, 0.55, 0.05), "water": (0.05, 0.01, 0.01), "sun": (1.0, 0.4, 0.2), "sun_i": 4.2, "sky_i": 0.7, "fog_d": 0.05, "fog_f": 0.02},
-        {"id": "V06", "seed": 606, "label": "Teal_Void", "base": (0.02, 0.05, 0.08), "a": (0.0, 0.9, 0.9), "b": (0.2, 0.6, 1.0), "water": (0.01, 0.08, 0.12), "sun": (0.4, 0.75, 1.0), "sun_i": 3.8, "sky_i": 1.0, "fog_d": 0.07, "fog_f": 0.022},
-        {"id": "V07", "seed": 707, "label": "Cobalt_Arc", "base": (0.04, 0.06, 0.12), "a": (0.2, 0.45, 1.0), "b": (0.0, 0.9, 1.0), "water": (0.02, 0.05, 0.1), "sun": (0.3, 0.6, 1.0), "sun_i": 4.6, "sky_i": 1.1, "fog_d": 0.045, "fog_f": 0.017},
-        {"id": "V08", "seed": 808, "label": "Golden_Haze", "base": (0.12, 0.1, 0.05), "a": (1.0, 0.75, 0.25), "b": (0.8, 0.45, 0.1), "water": (0.08, 0.06, 0.02), "sun": (1.0, 0.9, 0.7), "sun_i": 6.5, "sky_i": 0.9, "fog_d": 0.035, "fog_f": 0.013},
-        {"id": "V09", "seed": 909, "label": "Pink_Neo", "base": (0.08, 0.03, 0.08), "a": (1.0, 0.2, 0.7), "b": (0.0, 0.85, 1.0), "water": (0.04, 0.01, 0.05), "sun": (1.0, 0.6, 0.9), "sun_i": 4.0, "sky_i": 0.9, "fog_d": 0.055, "fog_f": 0.02},
-        {"id": "V10", "seed": 1001, "label": "Saffron_Rain", "base": (0.1, 0.08, 0.03), "a": (1.0, 0.7, 0.1), "b": (0.3, 0.6, 1.0), "water": (0.06, 0.04, 0.02), "sun": (0.9, 0.8, 0.6), "sun_i": 5.2, "sky_i": 0.95, "fog_d": 0.05, "fog_f": 0.018},
-        {"id": "V11", "seed": 1101, "label": "Viridian_Grid", "base": (0.03, 0.08, 0.06), "a": (0.1, 0.9, 0.7), "b": (0.05, 0.55, 0.35), "water": (0.02, 0.08, 0.06), "sun": (0.6, 0.95, 0.85), "sun_i": 4.8, "sky_i": 1.0, "fog_d": 0.04, "fog_f": 0.015},
-        {"id": "V12", "seed": 1201, "label": "Blue_Storm", "base": (0.03, 0.04, 0.1), "a": (0.2, 0.75, 1.0), "b": (0.05, 0.35, 0.9), "water": (0.01, 0.05, 0.12), "sun": (0.4, 0.6, 1.0), "sun_i": 3.6, "sky_i": 1.2, "fog_d": 0.075, "fog_f": 0.024},
-        {"id": "V13", "seed": 1301, "label": "Lime_Signal", "base": (0.05, 0.08, 0.03), "a": (0.6, 1.0, 0.2), "b": (0.1, 0.7, 0.3), "water": (0.03, 0.06, 0.02), "sun": (0.8, 1.0, 0.7), "sun_i": 5.0, "sky_i": 0.9, "fog_d": 0.03, "fog_f": 0.012},
-        {"id": "V14", "seed": 1401, "label": "Ice_Prisma", "base": (0.08, 0.1, 0.14), "a": (0.85, 0.95, 1.0), "b": (0.3, 0.7, 1.0), "water": (0.05, 0.08, 0.12), "sun": (0.95, 0.98, 1.0), "sun_i": 5.8, "sky_i": 1.3, "fog_d": 0.04, "fog_f": 0.014},
-        {"id": "V15", "seed": 1501, "label": "Obsidian_Core", "base": (0.02, 0.02, 0.02), "a": (0.7, 0.9, 1.0), "b": (1.0, 0.35, 0.1), "water": (0.01, 0.01, 0.01), "sun": (0.6, 0.7, 0.9), "sun_i": 3.2, "sky_i": 0.6, "fog_d": 0.06, "fog_f": 0.02},
-        {"id": "V16", "seed": 1601, "label": "Sunset_Signal", "base": (0.11, 0.06, 0.04), "a": (1.0, 0.4, 0.2), "b": (1.0, 0.85, 0.35), "water": (0.06, 0.03, 0.02), "sun": (1.0, 0.6, 0.3), "sun_i": 5.5, "sky_i": 0.85, "fog_d": 0.045, "fog_f": 0.016},
-        {"id": "V17", "seed": 1701, "label": "Royal_Blue", "base": (0.04, 0.05, 0.1), "a": (0.3, 0.55, 1.0), "b": (0.1, 0.9, 0.9), "water": (0.02, 0.04, 0.1), "sun": (0.5, 0.7, 1.0), "sun_i": 4.4, "sky_i": 1.0, "fog_d": 0.05, "fog_f": 0.017},
-        {"id": "V18", "seed": 1801, "label": "Copper_Fog", "base": (0.09, 0.06, 0.04), "a": (0.9, 0.45, 0.2), "b": (0.6, 0.3, 0.1), "water": (0.05, 0.03, 0.02), "sun": (0.9, 0.7, 0.5), "sun_i": 5.0, "sky_i": 0.8, "fog_d": 0.055, "fog_f": 0.02},
-        {"id": "V19", "seed": 1901, "label": "Aqua_Noise", "base": (0.04, 0.07, 0.09), "a": (0.0, 0.9, 0.8), "b": (0.1, 0.5, 0.9), "water": (0.02, 0.08, 0.1), "sun": (0.5, 0.85, 0.95), "sun_i": 4.7, "sky_i": 1.05, "fog_d": 0.065, "fog_f": 0.021},
-        {"id": "V20", "seed": 2001, "label": "Monochrome_Cyan", "base": (0.07, 0.08, 0.09), "a": (0.4, 0.9, 1.0), "b": (0.2, 0.6, 0.8), "water": (0.04, 0.06, 0.08), "sun": (0.7, 0.9, 1.0), "sun_i": 5.0, "sky_i": 1.1, "fog_d": 0.04, "fog_f": 0.015},
-    ]
-
-def _build_scifi_variant_impl(style):
-    random.seed(style["seed"])
-
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
-    if not plane or not cube or not sphere:
-        unreal.log_error("[UAT] Missing cube/plane/sphere mesh; aborting build_scifi_variant")
-        return
-
-    base = ensure_material(f"M_UAT_Scifi_Base_{style['id']}", unreal.LinearColor(*style["base"], 1.0))
-    accent_a = ensure_emissive_material(f"M_UAT_Scifi_A_{style['id']}", unreal.LinearColor(*style["a"], 1.0), emissive_boost=10.0)
-    accent_b = ensure_emissive_material(f"M_UAT_Scifi_B_{style['id']}", unreal.LinearColor(*style["b"], 1.0), emissive_boost=12.0)
-    water = ensure_emissive_material(f"M_UAT_Scifi_Water_{style['id']}", unreal.LinearColor(*style["water"], 1.0), emissive_boost=2.2)
-
-    add_common_lighting(unreal.LinearColor(*style["sun"], 1.0), style["sun_i"], sky_intensity=style["sky_i"])
-    make_ground(base, scale=90.0)
-
-    water_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, unreal.Vector(0.0, 0.0, -12.0))
-    wcomp = water_actor.get_component_by_class(unreal.StaticMeshComponent)
-    wcomp.set_static_mesh(plane)
-    wcomp.set_world_scale3d(unreal.Vector(82.0, 82.0, 1.0))
-    wcomp.set_material(0, water)
-    water_actor.set_actor_label("WaterPlane")
-
-    fog = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.ExponentialHeightFog, unreal.Vector(0.0, 0.0, 0.0))
-    fcomp = fog.get_component_by_class(unreal.ExponentialHeightFogComponent)
-    if fcomp:
-        fcomp.set_editor_property("fog_density", style["fog_d"])
-        fcomp.set_editor_property("fog_height_falloff", style["fog_f"])
-
-    def spawn_tower(pos, footprint, height, strips=2):
-        tower = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = tower.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(cube)
-        comp.set_material(0, base)
-        comp.set_world_scale3d(unreal.Vector(footprint.x, footprint.y, height))
-        for i in range(strips):
-            offset = (i - strips // 2) * footprint.x * 55.0
-            strip = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos + unreal.Vector(offset, footprint.y * 80.0, height * 50.0))
-            scomp = strip.get_component_by_class(unreal.StaticMeshComponent)
-            scomp.set_static_mesh(cube)
-            scomp.set_material(0, accent_a if i % 2 == 0 else accent_b)
-            scomp.set_world_scale3d(unreal.Vector(0.1, 0.4, height * 2.0))
-        tower.set_actor_label(f"{style['label']}_Tower_{pos.x}_{pos.y}")
-
-    grid_range = random.randint(4, 6)
-    grid_spacing = random.uniform(480.0, 620.0)
-    for gx in range(-grid_range, grid_range + 1):
-        for gy in range(-grid_range, grid_range + 1):
-            if abs(gx) <= 1 and abs(gy) <= 1:
-                continue
-            loc = unreal.Vector(gx * grid_spacing, gy * grid_spacing, 0.0)
-            height = random.uniform(5.0, 14.0)
-            footprint = unreal.Vector(random.uniform(0.6, 1.7), random.uniform(0.6, 1.7), 1.0)
-            strips = 2 if random.random() > 0.35 else 1
-            spawn_tower(loc, footprint, height, strips=strips)
-
-    extra_towers = random.randint(18, 40)
-    for i in range(extra_towers):
-        loc = unreal.Vector(random.uniform(-3000.0, 3000.0), random.uniform(-3000.0, 3000.0), 0.0)
-        height = random.uniform(6.0, 18.0)
-        footprint = unreal.Vector(random.uniform(0.5, 1.5), random.uniform(0.5, 1.5), 1.0)
-        spawn_tower(loc, footprint, height, strips=2)
-
-    ring_radius = random.uniform(2800.0, 3400.0)
-    ring_height = random.uniform(560.0, 820.0)
-    ring_count = random.randint(12, 20)
-    for i in range(ring_count):
-        ang = (360.0 / ring_count) * i
-        rad = math.radians(ang)
-        loc = unreal.Vector(math.cos(rad) * ring_radius, math.sin(rad) * ring_radius, ring_height)
-        glow = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, loc)
-        lcomp = glow.get_component_by_class(unreal.PointLightComponent)
-        if lcomp:
-            lcomp.set_editor_property("intensity", random.uniform(8000.0, 14000.0))
-            set_light_color_safe(lcomp, unreal.LinearColor(*style["a"], 1.0))
-
-    bridge_count = random.randint(3, 6)
-    for i in range(bridge_count):
-        yaw = random.uniform(-30.0, 30.0)
-        pos = unreal.Vector(random.uniform(-900.0, 900.0), random.uniform(-900.0, 900.0), random.uniform(480.0, 720.0))
-        scale = unreal.Vector(random.uniform(14.0, 24.0), 0.8, 0.25)
-        bridge = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = bridge.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_material(0, base)
-        comp.set_world_scale3d(scale)
-        bridge.set_actor_rotation(unreal.Rotator(0.0, yaw, 0.0), teleport_physics=True)
-        strip = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos + unreal.Vector(0.0, 0.0, 50.0))
-        scomp = strip.get_component_by_class(unreal.StaticMeshComponent)
-        scomp.set_static_mesh(plane)
-        scomp.set_material(0, accent_a)
-        scomp.set_world_scale3d(unreal.Vector(scale.x, 0.08, 0.1))
-
-    highway_count = random.randint(3, 5)
-    for i in range(highway_count):
-        pos = unreal.Vector(random.uniform(-1400.0, 1400.0), random.uniform(-1400.0, 1400.0), random.uniform(420.0, 620.0))
-        scale = unreal.Vector(random.uniform(18.0, 32.0), 0.9, 0.25)
-        yaw = random.uniform(-35.0, 35.0)
-        mat = accent_b if i % 2 == 0 else accent_a
-        road = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, pos)
-        comp = road.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_material(0, mat)
-        comp.set_world_scale3d(scale)
-        road.set_actor_rotation(unreal.Rotator(0.0, yaw, 0.0), teleport_physics=True)
-
-    sign_count = random.randint(12, 22)
-    sign_radius = random.uniform(1700.0, 2400.0)
-    sign_height = random.uniform(620.0, 780.0)
-    for i in range(sign_count):
-        ang = (360.0 / sign_count) * i
-        rad = math.radians(ang)
-        loc = unreal.Vector(math.cos(rad) * sign_radius, math.sin(rad) * sign_radius, sign_height + random.uniform(-140.0, 140.0))
-        sign_actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
-        comp = sign_actor.get_component_by_class(unreal.StaticMeshComponent)
-        comp.set_static_mesh(plane)
-        comp.set_material(0, accent_b if i % 2 == 0 else accent_a)
-        comp.set_world_scale3d(unreal.Vector(random.uniform(1.4, 3.2), 0.35, 1.0))
-        sign_actor.set_actor_rotation(unreal.Rotator(0.0, ang + 90.0, random.uniform(-6.0, 6.0)), teleport_physics=True)
-        sign_light = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.PointLight, loc + unreal.Vector(0.0, 0.0, 150.0))
-        lcomp = sign_light.get_component_by_class(unreal.PointLightComponent)
-        if lcomp:
-            lcomp.set_editor_property("intensity", random.uniform(8000.0, 11000.0))
-            set_light_color_safe(lcomp, unreal.LinearColor(*style["b"], 1.0))
-
-    moving_lights = random.randint(12, 22)
-    for i in range(moving_lights):
-        start = unreal.Vector(random.uniform(-1800.0, 1800.0), random.uniform(-1800.0, 1800.0), random.uniform(260.0, 980.0))
-        vel = unreal.Vector(random.uniform(-260.0, 260.0), random.uniform(-260.0, 260.0), random.uniform(-120.0, 120.0))
-        _spawn_moving_light(start, vel, random.uniform(5500.0, 9800.0), unreal.LinearColor(*style["a"], 1.0), unreal.LinearColor(*style["b"], 1.0), hue_speed=0.6, attenuation=1600.0, label=f"{style['label']}_MovingLight_{i}")
+    return uat_scene_spec.scifi_variant_styles()
 
-    car_mat = ensure_emissive_material(f"M_UAT_Scifi_Car_{style['id']}", unreal.LinearColor(*style["a"], 1.0), emissive_boost=12.0)
-    car_count = random.randint(18, 35)
-    for i in range(car_count):
-        start = unreal.Vector(-3600.0, random.uniform(-1800.0, 1800.0), random.uniform(320.0, 1200.0))
-        vel = unreal.Vector(random.uniform(650.0, 1150.0), random.uniform(-180.0, 180.0), random.uniform(-80.0, 80.0))
-        _spawn_moving_actor(plane, car_mat, start, vel, unreal.Vector(0.9, 2.6, 0.35), f"{style['label']}_Car_{i}")
-
-    drone_mat = ensure_emissive_material(f"M_UAT_Scifi_Drone_{style['id']}", unreal.LinearColor(*style["b"], 1.0), emissive_boost=10.0)
-    drone_count = random.randint(12, 26)
-    for i in range(drone_count):
-        start = unreal.Vector(random.uniform(-2200.0, 2200.0), random.uniform(-2200.0, 2200.0), random.uniform(520.0, 1400.0))
-        vel = unreal.Vector(random.uniform(-260.0, 260.0), random.uniform(-260.0, 260.0), random.uniform(-90.0, 90.0))
-        _spawn_moving_actor(sphere, drone_mat, start, vel, unreal.Vector(0.5, 0.5, 0.5), f"{style['label']}_Drone_{i}")
+def _interpreter_path():
+    """Standalone Python interpreter bundled with the editor, or None if unavailable."""
+    try:
+        path = unreal.get_interpreter_executable_path()
+    except AttributeError:
+        return None
+    return path if path and os.path.isfile(path) else None
 
-def build_scifi_variants_20():
+def build_scifi_variants_20(force=False):
     log("Scifi variants: start")
     styles = _scifi_variant_styles()
     make_directory(CODEX_LEVEL_DIR)
-    for idx, style in enumerate(styles, start=1):
-        level_name = f"Codex_Scifi_Variant_{idx:02d}"
-        log(f"Building {level_name} ({style['label']})")
-        create_level_with_builder(level_name, lambda s=style: _build_scifi_variant_impl(s))
-    log("Scifi variants: complete")
+    tiles = _level_tiles() if SCIFI_TILE_LEVELS else None
+    specs = [
+        uat_scene_spec.scifi_variant_spec(style, f"Codex_Scifi_Variant_{idx:02d}", tiles=tiles)
+        for idx, style in enumerate(styles, start=1)
+    ]
+    executable = _interpreter_path()
+    workers = VARIANT_PLAN_WORKERS if executable else 0
+    log(f"Scifi variants: compiling plans ({workers} workers)")
+    start = time.time()
+    if build_specs_cached("scifi_variants", specs, force=force, workers=workers, executable=executable) is not None:
+        log(f"Scifi variants: complete in {time.time() - start:.1f}s")
+
+def _level_tiles():
+    return {"size": LEVEL_TILE_SIZE_CM, "stream_distance": LEVEL_TILE_STREAM_DISTANCE_CM}
+
+def build_scifi_city_tiled(force=False):
+    """Build one scifi style at SCIFI_CITY_AREA_SCALE x the variant area as streaming tiles."""
+    styles = _scifi_variant_styles()
+    style = styles[SCIFI_CITY_STYLE % len(styles)]
+    spec = uat_scene_spec.scifi_variant_spec(
+        style, f"Codex_Scifi_City_{style['label']}", area_scale=SCIFI_CITY_AREA_SCALE, tiles=_level_tiles()
+    )
+    make_directory(CODEX_LEVEL_DIR)
+    log(f"Scifi city: {style['label']} at {SCIFI_CITY_AREA_SCALE:g}x area, {LEVEL_TILE_SIZE_CM:.0f} cm tiles")
+    return build_specs_cached("scifi_city", [spec], force=force)
+
+def build_scifi_variants_20_background(force=False):
+    """Queue the variant batch as a tick job so the editor stays responsive (see cancel_builds)."""
+    global BUILD_JOB_MODE
+    prev_mode = BUILD_JOB_MODE
+    BUILD_JOB_MODE = "tick"
+    try:
+        build_scifi_variants_20(force=force)
+    finally:
+        BUILD_JOB_MODE = prev_mode
 
 def delete_scifi_variants():
     if not unreal.EditorAssetLibrary.does_directory_exist(CODEX_LEVEL_DIR):
@@ -1851,11 +3697,12 @@ def delete_scifi_variants():
                 deleted += 1
     log(f"Deleted scifi variants: {deleted}")
 
+def _ensure_rotate_tick():
+    if CUBE_ROTATE_IN_EDITOR:
+        _register_tick("rotate", _rotate_tick)
+
 def _stop_rotate_tick():
-    global _rotate_tick_handle
-    if _rotate_tick_handle is not None:
-        unreal.unregister_slate_post_tick_callback(_rotate_tick_handle)
-        _rotate_tick_handle = None
+    uat_scheduler.unregister("rotate")
 
 def _rotate_tick(delta_seconds):
     global _rotating_cubes
@@ -1877,122 +3724,534 @@ def _rotate_tick(delta_seconds):
         _stop_rotate_tick()
 
 def _stop_move_tick():
-    global _move_tick_handle
-    if _move_tick_handle is not None:
-        unreal.unregister_slate_post_tick_callback(_move_tick_handle)
-        _move_tick_handle = None
+    _motion_store()
+    uat_scheduler.unregister("motion")
+    uat_scheduler.unregister("lights")
+
+def _mover_position(m):
+    """Simulated position of a mover, read from its actor the first time."""
+    if m.pos is None:
+        loc = m.actor.get_actor_location()
+        m.pos = (loc.x, loc.y, loc.z)
+        m.written = m.pos
+    return m.pos
+
+def _actor_hidden(actor):
+    try:
+        return actor.is_hidden_ed()
+    except Exception:
+        return False
+
+def _hidden_check_due():
+    """True once per MOVE_HIDDEN_REFRESH_S; movers re-read their editor hidden state then."""
+    global _move_hidden_checked
+    now = time.time()
+    if now - _move_hidden_checked < MOVE_HIDDEN_REFRESH_S:
+        return False
+    _move_hidden_checked = now
+    return True
+
+class _MotionArrays:
+    """Structure-of-arrays view of _moving_actors for the vectorised move tick.
+
+    Rows follow the mover order. Positions come from the movers (read from
+    the actors only the first time); velocities, positions, last-written
+    positions and orbit angles live here until store() writes them back into
+    the _Mover records.
+    """
+
+    def __init__(self, movers):
+        n = len(movers)
+        self.movers = movers
+        self.actors = [m.actor for m in movers]
+        self.pos = np.zeros((n, 3))
+        self.written = np.zeros((n, 3))
+        self.vel = np.array([(m.vx, m.vy, m.vz) for m in movers], dtype=float).reshape(n, 3)
+        self.lo = np.tile([-_MOVE_BOUNDS.x, -_MOVE_BOUNDS.y, _MOVE_Z_MIN], (n, 1))
+        self.hi = np.tile([_MOVE_BOUNDS.x, _MOVE_BOUNDS.y, _MOVE_BOUNDS.z], (n, 1))
+        self.orbit = np.array([bool(m.kind & MOVE_ORBIT) for m in movers], dtype=bool)
+        self.center = np.array([(m.center_x, m.center_y, m.height) for m in movers], dtype=float).reshape(n, 3)
+        self.radius = np.array([m.radius for m in movers], dtype=float)
+        self.angle = np.array([m.angle for m in movers], dtype=float)
+        self.speed = np.array([m.speed for m in movers], dtype=float)
+        self.hidden = np.array([m.hidden for m in movers], dtype=bool)
+        self.last = np.array([_move_time_accum if m.updated is None else m.updated for m in movers], dtype=float)
+        self.lights = [m for m in movers if m.kind & MOVE_LIGHT]
+        self.dead = []
+        for i, m in enumerate(movers):
+            try:
+                self.pos[i] = _mover_position(m)
+            except Exception:
+                self.dead.append(i)
+                continue
+            self.written[i] = m.written
+        self.linear = np.array([bool(m.kind & MOVE_LINEAR) for m in movers], dtype=bool)
+        self.rng = np.random.default_rng()
+
+    def step(self, delta_seconds):
+        lin = self.linear
+        pos = self.pos
+        vel = self.vel
+        pos[lin] += vel[lin] * delta_seconds
+        flip = ((pos < self.lo) | (pos > self.hi)) & lin[:, None]
+        vel[flip] *= -1.0
+        np.clip(pos, self.lo, self.hi, out=pos, where=lin[:, None])
+        jitter = lin & (self.rng.random(len(lin)) < MOVE_JITTER_CHANCE)
+        if jitter.any():
+            vel[jitter] += self.rng.uniform(-1.0, 1.0, (int(jitter.sum()), 3)) * (30.0, 30.0, 15.0)
+        orb = self.orbit
+        if orb.any():
+            self.angle[orb] = (self.angle[orb] + self.speed[orb] * delta_seconds) % (math.pi * 2.0)
+            pos[orb, 0] = self.center[orb, 0] + np.cos(self.angle[orb]) * self.radius[orb]
+            pos[orb, 1] = self.center[orb, 1] + np.sin(self.angle[orb]) * self.radius[orb]
+            pos[orb, 2] = self.center[orb, 2]
+
+    def advance(self, rows, now):
+        """Integrate rows from their last update to now in one step (sliced mode)."""
+        elapsed = now - self.last[rows]
+        self.last[rows] = now
+        lin_mask = self.linear[rows]
+        lin = rows[lin_mask]
+        if len(lin):
+            lo = self.lo[lin]
+            span = np.maximum(self.hi[lin] - lo, 1.0)
+            unfolded = self.pos[lin] - lo + self.vel[lin] * elapsed[lin_mask, None]
+            laps = np.floor(unfolded / span)
+            folded = unfolded - laps * span
+            odd = laps % 2.0 == 1.0
+            self.pos[lin] = lo + np.where(odd, span - folded, folded)
+            self.vel[lin] = np.where(odd, -self.vel[lin], self.vel[lin])
+            # Same odds as one MOVE_JITTER_CHANCE roll per skipped sim step.
+            chance = 1.0 - (1.0 - MOVE_JITTER_CHANCE) ** (elapsed[lin_mask] * MOVE_SIM_HZ)
+            jitter = lin[self.rng.random(len(lin)) < chance]
+            if len(jitter):
+                self.vel[jitter] += self.rng.uniform(-1.0, 1.0, (len(jitter), 3)) * (30.0, 30.0, 15.0)
+        orb = rows[self.orbit[rows]]
+        if len(orb):
+            self.angle[orb] = (self.angle[orb] + self.speed[orb] * elapsed[self.orbit[rows]]) % (math.pi * 2.0)
+            self.pos[orb, 0] = self.center[orb, 0] + np.cos(self.angle[orb]) * self.radius[orb]
+            self.pos[orb, 1] = self.center[orb, 1] + np.sin(self.angle[orb]) * self.radius[orb]
+            self.pos[orb, 2] = self.center[orb, 2]
+
+    def push(self, rows=None):
+        """Write moved, visible rows (default: all) to their actors; returns (writes, skipped).
+
+        Rows whose actor is gone are added to dead.
+        """
+        if rows is None:
+            rows = np.arange(len(self.actors))
+        if _hidden_check_due():
+            self.hidden[rows] = [_actor_hidden(self.actors[i]) for i in rows.tolist()]
+        moved = np.abs(self.pos[rows] - self.written[rows]).max(axis=1) > MOVE_WRITE_EPSILON_CM
+        dirty = rows[moved & ~self.hidden[rows]]
+        for i, (x, y, z) in zip(dirty.tolist(), self.pos[dirty].tolist()):
+            try:
+                self.actors[i].set_actor_location(unreal.Vector(x, y, z), sweep=False, teleport=True)
+            except Exception:
+                self.dead.append(i)
+        self.written[dirty] = self.pos[dirty]
+        return len(dirty), len(rows) - len(dirty)
+
+    def store(self):
+        """Copy velocities, positions, orbit angles and update times back into the _Mover records."""
+        rows = zip(
+            self.movers, self.vel.tolist(), self.pos.tolist(), self.written.tolist(),
+            self.angle.tolist(), self.hidden.tolist(), self.last.tolist(),
+        )
+        for m, (vx, vy, vz), pos, written, angle, hidden, last in rows:
+            m.vx, m.vy, m.vz = vx, vy, vz
+            m.pos = tuple(pos)
+            m.written = tuple(written)
+            m.angle = angle
+            m.hidden = hidden
+            m.updated = last
+
+def _motion_store():
+    """Drop the motion arrays after saving their state, e.g. before _moving_actors changes."""
+    global _motion
+    if _motion is not None:
+        _motion.store()
+        _motion = None
+
+def _animate_moving_light(m, t):
+    """Pulse intensity and blend colour for a MOVE_LIGHT mover at time t; returns editor calls made."""
+    wave = _LIGHT_WAVE
+    t += m.phase
+    intensity = m.base_intensity * (0.65 + 0.45 * wave[int(t * 1.35 * _LIGHT_WAVE_SCALE) & _LIGHT_WAVE_MASK])
+    blend = 0.5 + 0.5 * wave[int(t * m.hue_speed * _LIGHT_WAVE_SCALE) & _LIGHT_WAVE_MASK]
+    calls = 0
+    shown = m.shown_intensity
+    if shown is None or abs(intensity - shown) > LIGHT_INTENSITY_EPSILON * max(m.base_intensity, 1.0):
+        try:
+            m.light_comp.set_editor_property("intensity", intensity)
+        except Exception:
+            # Component (and its actor) is gone; the location push drops the mover.
+            return 0
+        m.shown_intensity = intensity
+        calls += 1
+    ar, ag, ab = m.rgb_a
+    br, bg, bb = m.rgb_b
+    rgb = (ar + (br - ar) * blend, ag + (bg - ag) * blend, ab + (bb - ab) * blend)
+    shown = m.shown_rgb
+    if shown is None or max(abs(rgb[0] - shown[0]), abs(rgb[1] - shown[1]), abs(rgb[2] - shown[2])) > LIGHT_COLOR_EPSILON:
+        set_light_color_safe(m.light_comp, unreal.LinearColor(rgb[0], rgb[1], rgb[2], 1.0))
+        m.shown_rgb = rgb
+        calls += 1
+    return calls
+
+def _animate_moving_lights(delta_seconds):
+    """Lights tick system: animate every moving light at _move_time_accum (runs at LIGHT_ANIM_HZ)."""
+    lights = _motion.lights if _motion is not None else [m for m in _moving_actors if m.kind & MOVE_LIGHT]
+    calls = 0
+    for m in lights:
+        calls += _animate_moving_light(m, _move_time_accum)
+    _move_stats["light_calls"] += calls
+    _move_stats["light_skipped"] += 2 * len(lights) - calls
+
+def _move_slice_size(count):
+    """Movers per sim step: MOVE_SLICE_SIZE, or more so each refreshes at MOVE_SLICE_MIN_HZ."""
+    return min(count, max(MOVE_SLICE_SIZE, math.ceil(count * MOVE_SLICE_MIN_HZ / MOVE_SIM_HZ)))
+
+def _next_move_slice(count, steps=1):
+    """(start, size) of the next round-robin slice of count movers covering steps sim steps.
+
+    The whole list below MOVE_SLICE_THRESHOLD or when the owed slices cover it.
+    """
+    global _move_slice_cursor
+    if count <= MOVE_SLICE_THRESHOLD:
+        _move_stats["slices"] = 1
+        return 0, count
+    per_step = _move_slice_size(count)
+    _move_stats["slices"] = -(-count // per_step)
+    size = min(per_step * steps, count)
+    start = _move_slice_cursor % count
+    _move_slice_cursor = start + size
+    return start, size
+
+def _move_tick_numpy(step, steps):
+    global _moving_actors, _motion
+    if _motion is None:
+        _motion = _MotionArrays([m for m in _moving_actors if m.actor is not None])
+    count = len(_motion.movers)
+    start, size = _next_move_slice(count, steps)
+    if size < count:
+        rows = (start + np.arange(size)) % count
+        _motion.advance(rows, _move_time_accum)
+        writes, skipped = _motion.push(rows)
+    else:
+        for _ in range(steps):
+            _motion.step(step)
+        _motion.last[:] = _move_time_accum
+        writes, skipped = _motion.push()
+    if _motion.dead:
+        dead = set(_motion.dead)
+        _motion.store()
+        _moving_actors = [m for i, m in enumerate(_motion.movers) if i not in dead]
+        _motion = None
+    return writes, skipped
+
+def _log_move_stats():
+    """Log steps/writes/skipped per second every MOVE_STATS_INTERVAL_S and reset the counters."""
+    now = time.time()
+    stats = _move_stats
+    if not stats["since"]:
+        stats["since"] = now
+        return
+    elapsed = now - stats["since"]
+    if elapsed < MOVE_STATS_INTERVAL_S:
+        return
+    sliced = f" (1/{stats['slices']} per step)" if stats["slices"] > 1 else ""
+    log(
+        f"Move tick: {len(_moving_actors)} actors{sliced}, {stats['steps'] / elapsed:.1f} steps/s, "
+        f"{stats['writes'] / elapsed:.0f} writes/s, {stats['skipped'] / elapsed:.0f} skipped/s, "
+        f"{stats['light_calls'] / elapsed:.0f} light calls/s, {stats['light_skipped'] / elapsed:.0f} light skipped/s"
+    )
+    stats.update(since=now, steps=0, writes=0, skipped=0, light_calls=0, light_skipped=0)
+
+def _traffic_step(delta_seconds):
+    """Advance lane traffic and push moved vehicles; returns (writes, skipped)."""
+    global _traffic
+    system = _traffic["system"]
+    actors = _traffic["actors"]
+    written = _traffic["written"]
+    writes = skipped = 0
+    dead = []
+    for key, x, y, z, yaw in system.step(delta_seconds):
+        last = written.get(key)
+        if last and max(abs(x - last[0]), abs(y - last[1]), abs(z - last[2])) <= MOVE_WRITE_EPSILON_CM:
+            skipped += 1
+            continue
+        try:
+            actors[key].set_actor_location_and_rotation(
+                unreal.Vector(x, y, z), unreal.Rotator(roll=0.0, pitch=0.0, yaw=yaw + TRAFFIC_YAW_OFFSET),
+                sweep=False, teleport=True
+            )
+        except Exception:
+            dead.append(key)
+            continue
+        written[key] = (x, y, z)
+        writes += 1
+    if dead:
+        system.remove(dead)
+        if not system.vehicle_count():
+            _traffic = None
+    return writes, skipped
 
 def _move_tick(delta_seconds):
-    global _moving_actors, _move_time_accum, _move_debug_counter
-    if not _moving_actors:
+    global _move_time_accum, _move_debug_counter, _move_step_accum
+    if not _moving_actors and _traffic is None:
         _stop_move_tick()
         return
 
     try:
-        _move_time_accum += delta_seconds
         _move_debug_counter += 1
-        alive = []
-        for actor, vel, meta in _moving_actors:
-            if actor is None:
-                continue
-            try:
-                loc = actor.get_actor_location()
-            except Exception:
-                continue
-            vel_mut = unreal.Vector(vel.x, vel.y, vel.z)
-            orbit = meta.get("orbit") if meta else None
-            if orbit:
-                orbit["angle"] = (orbit["angle"] + orbit["speed"] * delta_seconds) % (math.pi * 2.0)
-                angle = orbit["angle"]
-                center = orbit["center"]
-                radius = orbit["radius"]
-                loc = unreal.Vector(
-                    center.x + math.cos(angle) * radius,
-                    center.y + math.sin(angle) * radius,
-                    orbit["height"]
-                )
+        step = 1.0 / MOVE_SIM_HZ
+        _move_step_accum += delta_seconds
+        steps = min(int(_move_step_accum / step), MOVE_MAX_STEPS_PER_TICK)
+        _move_step_accum -= steps * step
+        if _move_step_accum >= step:
+            # Editor stalled for longer than MOVE_MAX_STEPS_PER_TICK steps; drop the backlog.
+            _move_step_accum = 0.0
+        if steps:
+            _move_time_accum += steps * step
+            if MOVE_TICK_BACKEND == "numpy" and np is not None:
+                writes, skipped = _move_tick_numpy(step, steps)
             else:
-                loc += vel_mut * delta_seconds
-
-                if abs(loc.x) > _MOVE_BOUNDS.x:
-                    vel_mut.x *= -1.0
-                    loc.x = max(min(loc.x, _MOVE_BOUNDS.x), -_MOVE_BOUNDS.x)
-                if abs(loc.y) > _MOVE_BOUNDS.y:
-                    vel_mut.y *= -1.0
-                    loc.y = max(min(loc.y, _MOVE_BOUNDS.y), -_MOVE_BOUNDS.y)
-                if loc.z < _MOVE_Z_MIN or loc.z > _MOVE_BOUNDS.z:
-                    vel_mut.z *= -1.0
-                    loc.z = min(max(loc.z, _MOVE_Z_MIN), _MOVE_BOUNDS.z)
-
-                if random.random() < 0.02:
-                    vel_mut.x += random.uniform(-30.0, 30.0)
-                    vel_mut.y += random.uniform(-30.0, 30.0)
-                    vel_mut.z += random.uniform(-15.0, 15.0)
+                writes, skipped = _move_tick_python(step, steps)
+            if _traffic is not None:
+                traffic_writes, traffic_skipped = _traffic_step(steps * step)
+                writes += traffic_writes
+                skipped += traffic_skipped
+            _move_stats["steps"] += steps
+            _move_stats["writes"] += writes
+            _move_stats["skipped"] += skipped
+        _log_move_stats()
+        if not _moving_actors and _traffic is None:
+            _stop_move_tick()
+    except Exception as exc:
+        log(f"Move tick suppressed error: {exc}")
 
+def _fold_bounce(p, v, elapsed, lo, hi):
+    """(position, velocity) after elapsed seconds bouncing between lo and hi, exact for any elapsed."""
+    span = max(hi - lo, 1.0)
+    unfolded = p - lo + v * elapsed
+    laps = math.floor(unfolded / span)
+    folded = unfolded - laps * span
+    if laps % 2:
+        return lo + span - folded, -v
+    return lo + folded, v
+
+def _advance_mover(m, x, y, z, elapsed):
+    """Position of m after elapsed seconds in one step (sliced mode); updates its velocity/angle."""
+    if m.kind & MOVE_ORBIT:
+        m.angle = (m.angle + m.speed * elapsed) % (math.pi * 2.0)
+        return m.center_x + math.cos(m.angle) * m.radius, m.center_y + math.sin(m.angle) * m.radius, m.height
+    if not m.kind & MOVE_LINEAR:
+        return x, y, z
+    x, m.vx = _fold_bounce(x, m.vx, elapsed, -_MOVE_BOUNDS.x, _MOVE_BOUNDS.x)
+    y, m.vy = _fold_bounce(y, m.vy, elapsed, -_MOVE_BOUNDS.y, _MOVE_BOUNDS.y)
+    z, m.vz = _fold_bounce(z, m.vz, elapsed, _MOVE_Z_MIN, _MOVE_BOUNDS.z)
+    # Same odds as one MOVE_JITTER_CHANCE roll per skipped sim step.
+    if random.random() < 1.0 - (1.0 - MOVE_JITTER_CHANCE) ** (elapsed * MOVE_SIM_HZ):
+        m.vx += random.uniform(-30.0, 30.0)
+        m.vy += random.uniform(-30.0, 30.0)
+        m.vz += random.uniform(-15.0, 15.0)
+    return x, y, z
+
+def _move_tick_python(step, steps):
+    global _moving_actors
+    movers = _moving_actors
+    count = len(movers)
+    start, size = _next_move_slice(count, steps)
+    sliced = size < count
+    batch = [movers[(start + i) % count] for i in range(size)] if sliced else movers
+    dead = set()
+    writes = skipped = 0
+    bx, by, bz = _MOVE_BOUNDS.x, _MOVE_BOUNDS.y, _MOVE_BOUNDS.z
+    check_hidden = _hidden_check_due()
+    for m in batch:
+        actor = m.actor
+        if actor is None:
+            dead.add(id(m))
+            continue
+        try:
+            x, y, z = _mover_position(m)
+        except Exception:
+            dead.add(id(m))
+            continue
+        if sliced:
+            elapsed = 0.0 if m.updated is None else _move_time_accum - m.updated
+            x, y, z = _advance_mover(m, x, y, z, elapsed)
+        else:
+            for _ in range(steps):
+                if m.kind & MOVE_ORBIT:
+                    m.angle = (m.angle + m.speed * step) % (math.pi * 2.0)
+                    x = m.center_x + math.cos(m.angle) * m.radius
+                    y = m.center_y + math.sin(m.angle) * m.radius
+                    z = m.height
+                    continue
+                if not m.kind & MOVE_LINEAR:
+                    break
+                x += m.vx * step
+                y += m.vy * step
+                z += m.vz * step
+
+                if abs(x) > bx:
+                    m.vx = -m.vx
+                    x = max(min(x, bx), -bx)
+                if abs(y) > by:
+                    m.vy = -m.vy
+                    y = max(min(y, by), -by)
+                if z < _MOVE_Z_MIN or z > bz:
+                    m.vz = -m.vz
+                    z = min(max(z, _MOVE_Z_MIN), bz)
+
+                if random.random() < MOVE_JITTER_CHANCE:
+                    m.vx += random.uniform(-30.0, 30.0)
+                    m.vy += random.uniform(-30.0, 30.0)
+                    m.vz += random.uniform(-15.0, 15.0)
+        m.pos = (x, y, z)
+        m.updated = _move_time_accum
+
+        if check_hidden:
+            m.hidden = _actor_hidden(actor)
+        wx, wy, wz = m.written
+        if m.hidden or max(abs(x - wx), abs(y - wy), abs(z - wz)) <= MOVE_WRITE_EPSILON_CM:
+            skipped += 1
+        else:
             try:
-                actor.set_actor_location(loc, sweep=False, teleport=True)
+                actor.set_actor_location(unreal.Vector(x, y, z), sweep=False, teleport=True)
             except Exception:
+                dead.add(id(m))
                 continue
-
-            if meta:
-                lcomp = meta.get("light_comp")
-                owner_valid = False
-                if lcomp:
-                    try:
-                        owner = lcomp.get_owner()
-                        owner_valid = owner is not None
-                    except Exception:
-                        owner_valid = False
-                if lcomp and owner_valid:
-                    base_intensity = meta.get("base_intensity", lcomp.get_editor_property("intensity"))
-                    phase = meta.get("phase", 0.0)
-                    hue_speed = meta.get("hue_speed", 0.5)
-                    t = _move_time_accum + phase
-                    osc = 0.65 + 0.45 * math.sin(t * 1.35)
-                    try:
-                        lcomp.set_editor_property("intensity", base_intensity * osc)
-                    except Exception:
-                        pass
-                    color_a = meta.get("color_a")
-                    color_b = meta.get("color_b", color_a)
-                    if color_a and color_b:
-                        blend = 0.5 + 0.5 * math.sin(t * hue_speed)
-                        new_color = unreal.LinearColor(
-                            color_a.r * (1.0 - blend) + color_b.r * blend,
-                            color_a.g * (1.0 - blend) + color_b.g * blend,
-                            color_a.b * (1.0 - blend) + color_b.b * blend,
-                            1.0
-                        )
-                        set_light_color_safe(lcomp, new_color)
-
-            alive.append((actor, vel_mut, meta))
-        _moving_actors = alive
-        if _move_debug_counter % 120 == 0:
-            log(f"Move tick active: {len(_moving_actors)} actors")
-        if not _moving_actors:
-            _stop_move_tick()
-    except Exception as exc:
-        log(f"Move tick suppressed error: {exc}")
+            m.written = m.pos
+            writes += 1
+    if dead:
+        _moving_actors = [m for m in movers if id(m) not in dead]
+    return writes, skipped
 
 # ============================================================
 # MATERIALS (STABLE UE5 IMPLEMENTATION)
 # ============================================================
-def ensure_material(name, color):
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    mat_path = f"{MATERIAL_PATH}/{name}"
+# Generated materials are content-addressed: the asset name is derived from a
+# canonical hash of the parameters that shape the graph, and the human-readable
+# names used by builders are aliases recorded in Saved/Automation.
+_material_cache = {}
+_material_index = None
+
+def _material_index_path():
+    return os.path.join(automation_dir(), MATERIAL_INDEX_NAME)
+
+def _load_material_index():
+    global _material_index
+    if _material_index is not None:
+        return _material_index
+    _material_index = {"aliases": {}, "materials": {}}
+    path = _material_index_path()
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _material_index["aliases"].update(data.get("aliases", {}))
+            _material_index["materials"].update(data.get("materials", {}))
+        except Exception as exc:
+            unreal.log_warning(f"[UAT] Failed to read material index: {exc}")
+    return _material_index
+
+def _save_material_index():
+    try:
+        with open(_material_index_path(), "w", encoding="utf-8") as f:
+            json.dump(_load_material_index(), f, indent=2, sort_keys=True)
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Failed to write material index: {exc}")
+
+def _quantize_channel(value):
+    return int(round(float(value) * MATERIAL_COLOR_STEPS))
+
+def material_key(kind, color=None, emissive_boost=None, opacity=None, **extra):
+    """Return (digest, params) for a generated material; equal params share one asset."""
+    params = {"kind": kind, "graph": MATERIAL_GRAPH_VERSION}
+    if color is not None:
+        params["color"] = [_quantize_channel(color.r), _quantize_channel(color.g), _quantize_channel(color.b)]
+    if emissive_boost is not None:
+        params["boost"] = round(float(emissive_boost), 2)
+    if opacity is not None:
+        params["opacity"] = _quantize_channel(opacity)
+    for key, value in extra.items():
+        params[key] = round(float(value), 4) if isinstance(value, float) else value
+    blob = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha1(blob.encode("utf-8")).hexdigest()[:MATERIAL_HASH_LEN]
+    return digest, params
+
+def _register_material_alias(alias, mat_path, digest, params):
+    index = _load_material_index()
+    changed = False
+    if digest not in index["materials"]:
+        index["materials"][digest] = dict(params, path=mat_path)
+        changed = True
+    if alias:
+        previous = index["aliases"].get(alias)
+        if previous != mat_path:
+            if previous:
+                log(f"Material alias {alias} re-pointed: {previous} -> {mat_path}")
+            index["aliases"][alias] = mat_path
+            changed = True
+    if changed:
+        _save_material_index()
+
+def _ensure_hashed_material(alias, kind, build_fn, color=None, emissive_boost=None, opacity=None, **extra):
+    digest, params = material_key(kind, color=color, emissive_boost=emissive_boost, opacity=opacity, **extra)
+    asset_name = f"M_UAT_{kind.title()}_{digest}"
+    mat_path = f"{MATERIAL_PATH}/{asset_name}"
+    _register_material_alias(alias, mat_path, digest, params)
+
+    material = _material_cache.get(mat_path)
+    if material is not None:
+        return material
 
     if unreal.EditorAssetLibrary.does_asset_exist(mat_path):
-        return unreal.EditorAssetLibrary.load_asset(mat_path)
+        material = unreal.EditorAssetLibrary.load_asset(mat_path)
+    else:
+        unreal.EditorAssetLibrary.make_directory(MATERIAL_PATH)
+        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+        material = asset_tools.create_asset(
+            asset_name=asset_name,
+            package_path=MATERIAL_PATH,
+            asset_class=unreal.Material,
+            factory=unreal.MaterialFactoryNew()
+        )
+        build_fn(material)
+        unreal.MaterialEditingLibrary.recompile_material(material)
+        unreal.EditorAssetLibrary.save_asset(mat_path)
+        log(f"Created {kind} material {mat_path}" + (f" (alias {alias})" if alias else ""))
 
-    unreal.EditorAssetLibrary.make_directory(MATERIAL_PATH)
+    if material:
+        _material_cache[mat_path] = material
+    return material
 
-    material = asset_tools.create_asset(
-        asset_name=name,
-        package_path=MATERIAL_PATH,
-        asset_class=unreal.Material,
-        factory=unreal.MaterialFactoryNew()
-    )
+def find_material(alias):
+    """Load the material an alias currently points at, or None."""
+    mat_path = _load_material_index()["aliases"].get(alias)
+    if not mat_path:
+        return None
+    material = _material_cache.get(mat_path)
+    if material is None and unreal.EditorAssetLibrary.does_asset_exist(mat_path):
+        material = unreal.EditorAssetLibrary.load_asset(mat_path)
+        _material_cache[mat_path] = material
+    return material
 
+def material_aliases(material):
+    """Return the asset name plus every alias that points at the material."""
+    if not material:
+        return []
+    names = [material.get_name()]
+    mat_path = material.get_path_name().split(".")[0]
+    for alias, target in _load_material_index()["aliases"].items():
+        if target == mat_path:
+            names.append(alias)
+    return names
+
+def _build_lit_graph(material, color):
     # Constant color node (safe across UE 5.x)
     expr = unreal.MaterialEditingLibrary.create_material_expression(
         material,
@@ -2006,28 +4265,7 @@ def ensure_material(name, color):
         unreal.MaterialProperty.MP_BASE_COLOR
     )
 
-    unreal.MaterialEditingLibrary.recompile_material(material)
-    unreal.EditorAssetLibrary.save_asset(mat_path)
-
-    log(f"Created material {mat_path}")
-    return material
-
-def ensure_emissive_material(name, color, emissive_boost=5.0):
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    mat_path = f"{MATERIAL_PATH}/{name}"
-
-    if unreal.EditorAssetLibrary.does_asset_exist(mat_path):
-        return unreal.EditorAssetLibrary.load_asset(mat_path)
-
-    unreal.EditorAssetLibrary.make_directory(MATERIAL_PATH)
-
-    material = asset_tools.create_asset(
-        asset_name=name,
-        package_path=MATERIAL_PATH,
-        asset_class=unreal.Material,
-        factory=unreal.MaterialFactoryNew()
-    )
-
+def _build_emissive_graph(material, color, emissive_boost):
     base = unreal.MaterialEditingLibrary.create_material_expression(
         material,
         unreal.MaterialExpressionConstant3Vector
@@ -2057,33 +4295,15 @@ def ensure_emissive_material(name, color, emissive_boost=5.0):
         emissive, "", unreal.MaterialProperty.MP_EMISSIVE_COLOR
     )
 
-    unreal.MaterialEditingLibrary.recompile_material(material)
-    unreal.EditorAssetLibrary.save_asset(mat_path)
-    log(f"Created emissive material {mat_path}")
-    return material
-
-def ensure_fog_sheet_material(name="M_UAT_FogSheet", color=None, opacity=0.2):
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    mat_path = f"{MATERIAL_PATH}/{name}"
-    if unreal.EditorAssetLibrary.does_asset_exist(mat_path):
-        return unreal.EditorAssetLibrary.load_asset(mat_path)
-
-    unreal.EditorAssetLibrary.make_directory(MATERIAL_PATH)
-    material = asset_tools.create_asset(
-        asset_name=name,
-        package_path=MATERIAL_PATH,
-        asset_class=unreal.Material,
-        factory=unreal.MaterialFactoryNew()
-    )
+def _build_fog_sheet_graph(material, color, opacity, fade_distance):
     material.set_editor_property("blend_mode", unreal.BlendMode.BLEND_TRANSLUCENT)
     material.set_editor_property("two_sided", True)
 
-    fog_color = color or unreal.LinearColor(0.2, 0.35, 0.5, 1.0)
     base = unreal.MaterialEditingLibrary.create_material_expression(
         material,
         unreal.MaterialExpressionConstant3Vector
     )
-    base.constant = fog_color
+    base.constant = color
     unreal.MaterialEditingLibrary.connect_material_property(
         base, "", unreal.MaterialProperty.MP_BASE_COLOR
     )
@@ -2097,32 +4317,122 @@ def ensure_fog_sheet_material(name="M_UAT_FogSheet", color=None, opacity=0.2):
         material,
         unreal.MaterialExpressionDepthFade
     )
-    depth_fade.set_editor_property("fade_distance", 1200.0)
+    depth_fade.set_editor_property("fade_distance", fade_distance)
     unreal.MaterialEditingLibrary.connect_material_expressions(opacity_expr, "", depth_fade, "InOpacity")
     unreal.MaterialEditingLibrary.connect_material_property(
         depth_fade, "", unreal.MaterialProperty.MP_OPACITY
     )
 
-    unreal.MaterialEditingLibrary.recompile_material(material)
-    unreal.EditorAssetLibrary.save_asset(mat_path)
-    log(f"Created fog sheet material {mat_path}")
-    return material
+def ensure_material(name, color):
+    return _ensure_hashed_material(
+        name, "lit",
+        lambda m: _build_lit_graph(m, color),
+        color=color
+    )
+
+def ensure_emissive_material(name, color, emissive_boost=5.0):
+    return _ensure_hashed_material(
+        name, "emissive",
+        lambda m: _build_emissive_graph(m, color, emissive_boost),
+        color=color,
+        emissive_boost=emissive_boost
+    )
+
+def ensure_fog_sheet_material(name="M_UAT_FogSheet", color=None, opacity=0.2):
+    fog_color = color or unreal.LinearColor(0.2, 0.35, 0.5, 1.0)
+    fade_distance = 1200.0
+    return _ensure_hashed_material(
+        name, "fog",
+        lambda m: _build_fog_sheet_graph(m, fog_color, opacity, fade_distance),
+        color=fog_color,
+        opacity=opacity,
+        fade=fade_distance
+    )
 
 def ensure_lifelike_grass_material(name="M_UAT_Grass_Lifelike"):
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-    mat_path = f"{MATERIAL_PATH}/{name}"
+    return _ensure_hashed_material(
+        name, "grass",
+        _build_lifelike_grass_graph,
+        wind_speed=LIFELIKE_GRASS_WIND_SPEED,
+        wind_strength=LIFELIKE_GRASS_WIND_STRENGTH
+    )
 
-    if unreal.EditorAssetLibrary.does_asset_exist(mat_path):
-        return unreal.EditorAssetLibrary.load_asset(mat_path)
+def _build_custom_data_graph(material, per_instance):
+    if per_instance:
+        material.set_editor_property("used_with_instanced_static_meshes", True)
+        color = unreal.MaterialEditingLibrary.create_material_expression(
+            material,
+            unreal.MaterialExpressionPerInstanceCustomData3Vector
+        )
+        color.set_editor_property("data_index", CUSTOM_DATA_COLOR_INDEX)
+        strength = unreal.MaterialEditingLibrary.create_material_expression(
+            material,
+            unreal.MaterialExpressionPerInstanceCustomData
+        )
+        strength.set_editor_property("data_index", CUSTOM_DATA_EMISSIVE_INDEX)
+    else:
+        material.set_editor_property("used_with_skeletal_mesh", True)
+        color = unreal.MaterialEditingLibrary.create_material_expression(
+            material,
+            unreal.MaterialExpressionVectorParameter
+        )
+        color.set_editor_property("parameter_name", "Color")
+        color.set_editor_property("use_custom_primitive_data", True)
+        color.set_editor_property("primitive_data_index", CUSTOM_DATA_COLOR_INDEX)
+        strength = unreal.MaterialEditingLibrary.create_material_expression(
+            material,
+            unreal.MaterialExpressionScalarParameter
+        )
+        strength.set_editor_property("parameter_name", "EmissiveStrength")
+        strength.set_editor_property("use_custom_primitive_data", True)
+        strength.set_editor_property("primitive_data_index", CUSTOM_DATA_EMISSIVE_INDEX)
 
-    unreal.EditorAssetLibrary.make_directory(MATERIAL_PATH)
+    unreal.MaterialEditingLibrary.connect_material_property(
+        color, "", unreal.MaterialProperty.MP_BASE_COLOR
+    )
+    emissive = unreal.MaterialEditingLibrary.create_material_expression(
+        material,
+        unreal.MaterialExpressionMultiply
+    )
+    unreal.MaterialEditingLibrary.connect_material_expressions(color, "", emissive, "A")
+    unreal.MaterialEditingLibrary.connect_material_expressions(strength, "", emissive, "B")
+    unreal.MaterialEditingLibrary.connect_material_property(
+        emissive, "", unreal.MaterialProperty.MP_EMISSIVE_COLOR
+    )
 
-    material = asset_tools.create_asset(
-        asset_name=name,
-        package_path=MATERIAL_PATH,
-        asset_class=unreal.Material,
-        factory=unreal.MaterialFactoryNew()
+def ensure_custom_data_material(per_instance=False):
+    """Shared emissive material whose colour comes from custom primitive or per-instance data."""
+    source = "instance" if per_instance else "primitive"
+    return _ensure_hashed_material(
+        f"M_UAT_CustomData_{source.title()}", "customdata",
+        lambda m: _build_custom_data_graph(m, per_instance),
+        source=source
     )
+
+def set_custom_color(comp, color, emissive_strength, instance_index=None):
+    """Write colour + emissive strength for ensure_custom_data_material to read."""
+    values = [color.r, color.g, color.b]
+    try:
+        if instance_index is None:
+            for i, value in enumerate(values):
+                comp.set_custom_primitive_data_float(CUSTOM_DATA_COLOR_INDEX + i, value)
+            comp.set_custom_primitive_data_float(CUSTOM_DATA_EMISSIVE_INDEX, emissive_strength)
+            return
+        if comp.get_editor_property("num_custom_data_floats") < CUSTOM_DATA_FLOATS:
+            comp.set_num_custom_data_floats(CUSTOM_DATA_FLOATS)
+        for i, value in enumerate(values):
+            comp.set_custom_data_value(instance_index, CUSTOM_DATA_COLOR_INDEX + i, value, False)
+        comp.set_custom_data_value(instance_index, CUSTOM_DATA_EMISSIVE_INDEX, emissive_strength, True)
+    except Exception as exc:
+        unreal.log_warning(f"[UAT] Failed to write custom colour data: {exc}")
+
+def _accent(material, color, emissive_strength, shared=None):
+    """Return (material, custom_color) for an accent: its own material, or custom data on a shared one."""
+    if shared:
+        return shared, (color, emissive_strength)
+    return material, None
+
+def _build_lifelike_grass_graph(material):
     material.set_editor_property("two_sided", True)
 
     color_a = unreal.MaterialEditingLibrary.create_material_expression(
@@ -2209,10 +4519,109 @@ def ensure_lifelike_grass_material(name="M_UAT_Grass_Lifelike"):
         unreal.MaterialProperty.MP_WORLD_POSITION_OFFSET
     )
 
-    unreal.MaterialEditingLibrary.recompile_material(material)
-    unreal.EditorAssetLibrary.save_asset(mat_path)
-    log(f"Created lifelike grass material {mat_path}")
-    return material
+def _materials_on_level_actors():
+    """Material packages used by actors in the loaded level, saved or not."""
+    used = set()
+    for actor in unreal.EditorLevelLibrary.get_all_level_actors() or []:
+        if not actor:
+            continue
+        for comp in actor.get_components_by_class(unreal.MeshComponent) or []:
+            for mat in comp.get_materials() or []:
+                if mat:
+                    used.add(mat.get_path_name().split(".")[0])
+    return used
+
+def _unreachable_materials(graph, roots):
+    """Generated packages in graph ({package: [referencers]}) not reachable from a root.
+
+    Roots are the given packages plus any package referenced from outside the
+    graph (maps, hand-made assets). Marking follows references from live
+    packages only, so cycles between dead materials (MI parent loops) are
+    still collected.
+    """
+    uses = {package: [] for package in graph}
+    live = set()
+    for package, referencers in graph.items():
+        if package in roots:
+            live.add(package)
+        for referencer in referencers:
+            if referencer in graph:
+                uses[referencer].append(package)
+            else:
+                live.add(package)
+    pending = list(live)
+    while pending:
+        for package in uses[pending.pop()]:
+            if package not in live:
+                live.add(package)
+                pending.append(package)
+    return set(graph) - live
+
+def collect_unused_materials(dry_run=True):
+    """Find generated materials unreachable from the level or other assets; delete them unless dry_run.
+
+    Roots are the current level's actors and referencers outside MATERIAL_PATH
+    (saved maps, hand-made assets). Alias index entries are not roots: nearly
+    every generated material has one and nothing else retires them, so they
+    would keep deleted levels' palettes alive. Aliases pointing at collected
+    or already missing materials are dropped from the index.
+    """
+    if not unreal.EditorAssetLibrary.does_directory_exist(MATERIAL_PATH):
+        log(f"Material GC: {MATERIAL_PATH} missing; nothing to do.")
+        return {"unreferenced": [], "deleted": []}
+
+    registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    if registry.is_loading_assets():
+        registry.search_all_assets(True)
+
+    packages = sorted({a.split(".")[0] for a in unreal.EditorAssetLibrary.list_assets(MATERIAL_PATH, recursive=True, include_folder=False)})
+    graph = {}
+    for package in packages:
+        refs = unreal.EditorAssetLibrary.find_package_referencers_for_asset(package, False) or []
+        graph[package] = sorted(str(r) for r in refs if str(r) != package)
+
+    index = _load_material_index()
+    unreferenced = _unreachable_materials(graph, _materials_on_level_actors())
+    stale_aliases = sorted(
+        alias for alias, path in index["aliases"].items()
+        if path in unreferenced or (path.startswith(MATERIAL_PATH + "/") and path not in graph)
+    )
+
+    deleted = []
+    if not dry_run:
+        for alias in stale_aliases:
+            path = index["aliases"][alias]
+            if path not in unreferenced:
+                index["aliases"].pop(alias)
+                index["materials"] = {k: v for k, v in index["materials"].items() if v.get("path") != path}
+        for package in sorted(unreferenced):
+            if not unreal.EditorAssetLibrary.delete_asset(package):
+                unreal.log_warning(f"[UAT] Material GC could not delete {package}")
+                continue
+            deleted.append(package)
+            _material_cache.pop(package, None)
+            index["aliases"] = {k: v for k, v in index["aliases"].items() if v != package}
+            index["materials"] = {k: v for k, v in index["materials"].items() if v.get("path") != package}
+        if deleted or stale_aliases:
+            _save_material_index()
+
+    report = {
+        "timestamp": ts(),
+        "dry_run": dry_run,
+        "scanned": len(packages),
+        "graph": graph,
+        "unreferenced": sorted(unreferenced),
+        "stale_aliases": stale_aliases,
+        "deleted": deleted,
+    }
+    out_path = os.path.join(automation_dir(), f"material_gc_{report['timestamp']}.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    log(
+        f"Material GC: scanned={len(packages)} unreferenced={len(unreferenced)} stale_aliases={len(stale_aliases)} "
+        f"deleted={len(deleted)} dry_run={dry_run} report={out_path}"
+    )
+    return report
 
 def set_actor_material(actor, material):
     for comp in actor.get_components_by_class(unreal.MeshComponent):
@@ -2252,7 +4661,7 @@ def spawn_triangle(location, size_cm, material=None):
     return actor
 
 def spawn_grass_field(center, material=None):
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     if not plane:
         unreal.log_error(f"[UAT] Plane mesh not found: {PLANE_MESH_PATH}")
         return
@@ -2279,7 +4688,7 @@ def spawn_grass_field(center, material=None):
             actor.set_actor_scale3d(unreal.Vector(GRASS_BLADE_SCALE, GRASS_BLADE_SCALE, GRASS_BLADE_SCALE))
 
 def spawn_grass_field_instanced(center, material=None, rows=12, cols=12, spacing_cm=80.0):
-    plane = unreal.EditorAssetLibrary.load_asset(PLANE_MESH_PATH)
+    plane = load_asset_cached(PLANE_MESH_PATH)
     if not plane:
         unreal.log_error(f"[UAT] Plane mesh not found: {PLANE_MESH_PATH}")
         return
@@ -2306,9 +4715,10 @@ def spawn_grass_field_instanced(center, material=None, rows=12, cols=12, spacing
             rot = unreal.Rotator(pitch, yaw, 0.0)
             scl = unreal.Vector(scale, scale, scale)
             comp.add_instance(unreal.Transform(loc, rot, scl))
+    return actor
 
 def spawn_blue_sphere(center, radius_scale=1.0):
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     if not sphere:
         unreal.log_error(f"[UAT] Sphere mesh not found: {SPHERE_MESH_PATH}")
         return
@@ -2357,7 +4767,7 @@ def focus_view_on_origin(origin):
         unreal.log_warning(f"[UAT] Failed to set viewport camera: {exc}")
 
 def spawn_colored_sphere(center, radius_scale, color, label=None):
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     if not sphere:
         unreal.log_error(f"[UAT] Sphere mesh not found: {SPHERE_MESH_PATH}")
         return None
@@ -2396,7 +4806,7 @@ def write_log_paths():
         unreal.log_warning(f"[UAT] Failed to write log paths: {exc}")
 
 def spawn_sphere_circle(center):
-    sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+    sphere = load_asset_cached(SPHERE_MESH_PATH)
     if not sphere:
         unreal.log_error(f"[UAT] Sphere mesh not found: {SPHERE_MESH_PATH}")
         return
@@ -2415,8 +4825,8 @@ def spawn_sphere_circle(center):
         actor.set_actor_scale3d(unreal.Vector(SPHERE_SCALE, SPHERE_SCALE, SPHERE_SCALE))
 
 def spawn_rotating_cube(center):
-    global _rotating_cubes, _rotate_tick_handle
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
+    global _rotating_cubes
+    cube = load_asset_cached(CUBE_MESH_PATH)
     if not cube:
         unreal.log_error(f"[UAT] Cube mesh not found: {CUBE_MESH_PATH}")
         return
@@ -2428,18 +4838,17 @@ def spawn_rotating_cube(center):
 
     _rotating_cubes.append(actor)
 
-    if CUBE_ROTATE_IN_EDITOR and _rotate_tick_handle is None:
-        _rotate_tick_handle = unreal.register_slate_post_tick_callback(_rotate_tick)
+    _ensure_rotate_tick()
 
 def spawn_rotating_test_cube(location=None, scale=unreal.Vector(8.0, 8.0, 8.0)):
     """Spawn a large red cube and register it for rotation."""
-    global _rotating_cubes, _rotate_tick_handle
+    global _rotating_cubes
     loc = location or unreal.Vector(0.0, 0.0, 1800.0)
-    cube = unreal.EditorAssetLibrary.load_asset(CUBE_MESH_PATH)
+    cube = load_asset_cached(CUBE_MESH_PATH)
     if not cube:
         unreal.log_error(f"[UAT] Cube mesh not found: {CUBE_MESH_PATH}")
         return None
-    mat = ensure_emissive_material("M_UAT_Test_Red", unreal.LinearColor(1.0, 0.05, 0.05, 1.0), emissive_boost=6.0)
+    mat = ensure_emissive_material("M_UAT_Test_Red_Cube", unreal.LinearColor(1.0, 0.05, 0.05, 1.0), emissive_boost=6.0)
     actor = unreal.EditorLevelLibrary.spawn_actor_from_class(unreal.StaticMeshActor, loc)
     comp = actor.get_component_by_class(unreal.StaticMeshComponent)
     comp.set_static_mesh(cube)
@@ -2448,12 +4857,11 @@ def spawn_rotating_test_cube(location=None, scale=unreal.Vector(8.0, 8.0, 8.0)):
         comp.set_material(0, mat)
     actor.set_actor_label("Test_Rotating_RedCube")
     _rotating_cubes.append(actor)
-    if CUBE_ROTATE_IN_EDITOR and _rotate_tick_handle is None:
-        _rotate_tick_handle = unreal.register_slate_post_tick_callback(_rotate_tick)
+    _ensure_rotate_tick()
     return actor
 
 def spawn_three_cones(center, spacing_cm=200.0):
-    cone = unreal.EditorAssetLibrary.load_asset("/Engine/BasicShapes/Cone.Cone")
+    cone = load_asset_cached(CONE_MESH_PATH)
     if not cone:
         unreal.log_error("[UAT] Cone mesh not found: /Engine/BasicShapes/Cone.Cone")
         return
@@ -2480,7 +4888,7 @@ def spawn_primitive_row(center, spacing_cm=250.0):
 
     start_x = center.x - ((len(assets) - 1) * spacing_cm * 0.5)
     for i, (path, label) in enumerate(assets):
-        mesh = unreal.EditorAssetLibrary.load_asset(path)
+        mesh = load_asset_cached(path)
         if not mesh:
             unreal.log_error(f"[UAT] Missing primitive mesh: {path}")
             continue
@@ -2592,23 +5000,51 @@ def main():
 
     if COMMAND == "build_codex_levels":
         write_log_marker("build_codex_levels start")
-        create_level_with_builder("Codex_Desert", build_desert_level)
-        create_level_with_builder("Codex_Forest", build_forest_level)
-        create_level_with_builder("Codex_Neon", build_neon_level)
-        create_level_with_builder("Codex_Snow", build_snow_level)
-        create_level_with_builder("Codex_Volcano", build_volcano_level)
-        create_level_with_builder("Codex_CityGrid", build_city_grid_level)
-        create_level_with_builder("Codex_Canyon", build_canyon_level)
-        create_level_with_builder("Codex_SkyIslands", build_sky_islands_level)
-        create_level_with_builder("Codex_Checker", build_checker_level)
-        create_level_with_builder("Codex_Ruins", build_ruins_level)
-        create_level_with_builder("Codex_Chromatic", build_chromatic_level)
-        create_level_with_builder("Codex_Crystal", build_crystal_level)
-        create_level_with_builder("Codex_Industrial", build_industrial_level)
+        build_codex_levels()
         log("Built Codex levels in /Game/Codex_levels")
         snapshot_log_to_file()
         return
 
+    if COMMAND == "cancel_builds":
+        cancel_builds()
+        return
+
+    if COMMAND == "rebuild_codex_levels":
+        write_log_marker("rebuild_codex_levels start")
+        build_codex_levels(force=True)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "update_codex_levels":
+        write_log_marker("update_codex_levels start")
+        build_codex_levels(incremental=True)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "update_scene_spec":
+        if not SCENE_SPEC:
+            unreal.log_error("[UAT] Set SCENE_SPEC to a spec name or path under uat_specs/")
+            return
+        write_log_marker(f"update_scene_spec start ({SCENE_SPEC})")
+        try:
+            build_level_from_spec(SCENE_SPEC, incremental=True)
+        except (OSError, ValueError) as exc:
+            unreal.log_error(f"[UAT] update_scene_spec failed: {exc}")
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "build_scene_spec":
+        if not SCENE_SPEC:
+            unreal.log_error("[UAT] Set SCENE_SPEC to a spec name or path under uat_specs/")
+            return
+        write_log_marker(f"build_scene_spec start ({SCENE_SPEC})")
+        try:
+            build_level_from_spec(SCENE_SPEC)
+        except (OSError, ValueError) as exc:
+            unreal.log_error(f"[UAT] build_scene_spec failed: {exc}")
+        snapshot_log_to_file()
+        return
+
     if COMMAND == "build_codex_scifi_landscape":
         write_log_marker("build_codex_scifi_landscape start")
         delete_codex_levels()
@@ -2617,21 +5053,75 @@ def main():
         snapshot_log_to_file()
         return
 
+    if COMMAND == "build_codex_scifi_landscape_instanced":
+        write_log_marker("build_codex_scifi_landscape_instanced start")
+        delete_codex_levels()
+        create_level_with_builder("Codex_Scifi_Landscape", build_scifi_landscape_level_instanced)
+        log("Built instanced Codex_Scifi_Landscape in /Game/Codex_levels")
+        snapshot_log_to_file()
+        return
+
     if COMMAND == "build_scifi_variants_20":
         write_log_marker("build_scifi_variants_20 start")
         build_scifi_variants_20()
         snapshot_log_to_file()
         return
 
+    if COMMAND == "build_scifi_city_tiled":
+        write_log_marker("build_scifi_city_tiled start")
+        build_scifi_city_tiled()
+        return
+
+    if COMMAND == "build_scifi_variants_20_background":
+        write_log_marker("build_scifi_variants_20_background start")
+        build_scifi_variants_20_background()
+        return
+
     if COMMAND == "delete_scifi_variants":
         write_log_marker("delete_scifi_variants start")
         delete_scifi_variants()
         snapshot_log_to_file()
         return
 
+    if COMMAND == "gc_materials_dry_run":
+        collect_unused_materials(dry_run=True)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "gc_materials":
+        collect_unused_materials(dry_run=False)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "merge_to_instances":
+        merge_to_instances()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "optimize_render_cost_dry_run":
+        optimize_render_cost(dry_run=True)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "optimize_render_cost":
+        optimize_render_cost()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "explode_instances":
+        explode_instances()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "tick_stats":
+        uat_scheduler.log_stats()
+        snapshot_log_to_file()
+        return
+
     if COMMAND == "debug_move_tick":
-        log(f"Move debug: handle={'set' if _move_tick_handle else 'none'}, actors={len(_moving_actors)}")
-        if _moving_actors and _move_tick_handle is None:
+        registered = uat_scheduler.is_registered("motion")
+        log(f"Move debug: handle={'set' if registered else 'none'}, actors={len(_moving_actors)}")
+        if _moving_actors and not registered:
             _ensure_move_tick()
             log("Move tick re-registered")
         snapshot_log_to_file()
@@ -2662,6 +5152,36 @@ def main():
         snapshot_log_to_file()
         return
 
+    if COMMAND == "optimize_light_budget":
+        optimize_light_budget()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "restore_light_budget":
+        restore_light_budget()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "scene_cost_report":
+        scene_cost_report()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "scene_cost_report_all":
+        scene_cost_report(all_levels=True)
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "build_traffic_lanes":
+        build_traffic_lanes()
+        snapshot_log_to_file()
+        return
+
+    if COMMAND == "bake_motion":
+        bake_motion()
+        snapshot_log_to_file()
+        return
+
     if COMMAND == "lights_keep_three":
         lights_keep_three()
         snapshot_log_to_file()
@@ -2727,6 +5247,11 @@ def main():
         snapshot_log_to_file()
         return
 
+    if COMMAND == "spawn_crowd_custom_data":
+        spawn_crowd(color_mode="custom_data")
+        snapshot_log_to_file()
+        return
+
     if COMMAND == "spawn_car_placeholders":
         spawn_car_placeholders()
         snapshot_log_to_file()
@@ -2756,7 +5281,7 @@ def main():
         return
 
     if selected and CONVERT_TO_SPHERE:
-        sphere = unreal.EditorAssetLibrary.load_asset(SPHERE_MESH_PATH)
+        sphere = load_asset_cached(SPHERE_MESH_PATH)
         if not sphere:
             unreal.log_error(f"[UAT] Sphere mesh not found: {SPHERE_MESH_PATH}")
             return
@@ -0,0 +1,15 @@
+"""Entry module for the plan-compile worker processes.
+
+Spawned workers import the parent's __main__ before they run anything. In the
+editor that is whatever script imported `unreal`, which the bundled standalone
+interpreter cannot import, so every worker died and compile_plans quietly fell
+back to compiling serially. uat_scene_spec.compile_plans presents this module
+as __main__ while the pool starts, so workers only import uat_scene_spec.
+
+Like uat_scene_spec.py this module must never import `unreal`.
+"""
+import uat_scene_spec
+
+
+def compile_plan(spec, backend=None):
+    return uat_scene_spec.compile_spec(spec, backend)
@@ -0,0 +1,1026 @@
+"""Declarative scene specs for the Codex/scifi builders.
+
+A spec is plain data (JSON, or TOML where tomllib is available):
+
+    name        level name
+    seed        root seed; every generator gets its own derived stream
+    vars        values available to label templates ({label} ...)
+    palette     key -> {"alias", "kind": lit|emissive|fog|grass, "color", "boost", "opacity"}
+    lighting    {"sun_color", "sun_intensity", "sky_intensity"}
+    ground      {"material", "scale"}
+    fog         list of {"density", "falloff"} extra height-fog actors
+    generators  list of generator blocks (see GENERATORS)
+    tiles       optional {"size", "stream_distance"}: split the level into
+                grid-tile streaming sub-levels (see plan_tiles)
+
+compile_spec() turns a spec into a spawn plan: a list of JSON-safe item dicts
+with stable ids. With the numpy backend, scatter/ring/tower generators emit
+columnar "batch" records instead; iter_items() expands them into the same item
+dicts at apply time. This module has no `unreal` dependency so plans can be
+built, hashed and cached outside the editor.
+"""
+import concurrent.futures
+import concurrent.futures.process
+import contextlib
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uat_specs")
+
+MESH_PATHS = {
+    "plane": "/Engine/BasicShapes/Plane.Plane",
+    "cube": "/Engine/BasicShapes/Cube.Cube",
+    "sphere": "/Engine/BasicShapes/Sphere.Sphere",
+    "cylinder": "/Engine/BasicShapes/Cylinder.Cylinder",
+    "cone": "/Engine/BasicShapes/Cone.Cone",
+}
+
+MATERIAL_KINDS = ("lit", "emissive", "fog", "grass")
+
+# "numpy" samples scatter/ring/tower generators as arrays from a seeded
+# numpy Generator; "python" is the per-element random.Random path. The two
+# backends draw different (but each reproducible) layouts for the same seed.
+DEFAULT_BACKEND = "numpy" if np is not None else "python"
+
+# Tiled plans keep environment, moving and tile-spanning items (ground, water)
+# in the persistent level; everything else goes to the tile holding its origin.
+PERSISTENT_TILE = "persistent"
+PERSISTENT_ITEM_TYPES = ("sun", "skylight", "fog", "mover", "moving_light", "grass")
+SHAPE_SIZE_CM = 100.0
+
+# ============================================================
+# LOADING / HASHING
+# ============================================================
+def load_spec(name_or_path):
+    """Load a spec by file path or by name inside SPEC_DIR (".json" / ".toml" optional)."""
+    candidates = [name_or_path]
+    if not os.path.isabs(name_or_path):
+        candidates += [
+            os.path.join(SPEC_DIR, name_or_path),
+            os.path.join(SPEC_DIR, f"{name_or_path}.json"),
+            os.path.join(SPEC_DIR, f"{name_or_path}.toml"),
+        ]
+    for path in candidates:
+        if not os.path.isfile(path):
+            continue
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ValueError(f"TOML spec needs Python 3.11+: {path}")
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    raise FileNotFoundError(f"Scene spec not found: {name_or_path}")
+
+def canonical_json(data):
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+def spec_hash(spec):
+    return hashlib.sha1(canonical_json(spec).encode("utf-8")).hexdigest()
+
+def derive_seed(seed, *parts):
+    """Independent, order-free seed for a sub-stream (generator name, index ...)."""
+    blob = ":".join(str(p) for p in (seed,) + parts)
+    return int(hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16], 16)
+
+# ============================================================
+# VALIDATION
+# ============================================================
+def validate_spec(spec):
+    """Return a list of problems; an empty list means the spec compiles."""
+    errors = []
+    if not spec.get("name"):
+        errors.append("spec.name is required")
+    palette = spec.get("palette", {})
+    for key, entry in palette.items():
+        kind = entry.get("kind", "lit")
+        if kind not in MATERIAL_KINDS:
+            errors.append(f"palette.{key}: unknown kind {kind!r}")
+        if kind in ("lit", "emissive") and len(entry.get("color", [])) != 3:
+            errors.append(f"palette.{key}: color must be [r, g, b]")
+
+    def check_material(where, key):
+        if key is not None and key not in palette:
+            errors.append(f"{where}: material {key!r} not in palette")
+
+    ground = spec.get("ground")
+    if ground:
+        check_material("ground", ground.get("material"))
+
+    names = set()
+    for idx, gen in enumerate(spec.get("generators", [])):
+        where = f"generators[{idx}]"
+        gtype = gen.get("type")
+        if gtype not in GENERATORS:
+            errors.append(f"{where}: unknown type {gtype!r}")
+            continue
+        name = gen.get("name", f"{gtype}{idx}")
+        if name in names:
+            errors.append(f"{where}: duplicate name {name!r}")
+        names.add(name)
+        for part in _parts(gen):
+            if part.get("kind", "mesh") == "light":
+                continue
+            if part.get("mesh") not in MESH_PATHS:
+                errors.append(f"{where}: unknown mesh {part.get('mesh')!r}")
+            for key in part.get("materials") or [part.get("material")]:
+                check_material(where, key)
+        for key in ("material", "strip_materials"):
+            values = gen.get(key)
+            for value in (values if isinstance(values, list) else [values]):
+                check_material(where, value)
+        if gtype == "traffic" and gen.get("mesh") and gen["mesh"] not in MESH_PATHS:
+            errors.append(f"{where}: unknown mesh {gen['mesh']!r}")
+    tiles = spec.get("tiles")
+    if tiles is not None:
+        if not isinstance(tiles.get("size"), (int, float)) or tiles["size"] <= 0:
+            errors.append("tiles.size must be a positive number (cm)")
+        if tiles.get("stream_distance", 0.0) < 0:
+            errors.append("tiles.stream_distance must not be negative")
+    return errors
+
+# ============================================================
+# SAMPLING
+# ============================================================
+def _sample(value, rng, env=None, integer=False):
+    """number -> itself, [lo, hi] -> uniform (randint if integer), "$name" -> env lookup."""
+    if isinstance(value, str) and value.startswith("$"):
+        return (env or {})[value[1:]]
+    if isinstance(value, (list, tuple)):
+        lo, hi = value[0], value[1]
+        return rng.randint(int(lo), int(hi)) if integer else rng.uniform(float(lo), float(hi))
+    return value
+
+def _sample_vec(values, rng, env=None, default=(0.0, 0.0, 0.0)):
+    if values is None:
+        return list(default)
+    return [float(_sample(v, rng, env)) for v in values]
+
+def _sample_scale(spec, rng, env=None):
+    if spec is None:
+        return [1.0, 1.0, 1.0]
+    if isinstance(spec, dict):
+        if "uniform" in spec:
+            s = float(_sample(spec["uniform"], rng, env))
+            mul = spec.get("mul", [1.0, 1.0, 1.0])
+            return [s * mul[0], s * mul[1], s * mul[2]]
+        return [float(_sample(spec.get(axis, 1.0), rng, env)) for axis in ("x", "y", "z")]
+    return _sample_vec(spec, rng, env)
+
+def _sample_rotation(spec, rng, env=None):
+    spec = spec or {}
+    return [float(_sample(spec.get(axis, 0.0), rng, env)) for axis in ("pitch", "yaw", "roll")]
+
+def _parts(gen):
+    if "parts" in gen:
+        return gen["parts"]
+    if gen.get("type") in ("towers", "traffic", "grass"):
+        return []
+    return [gen]
+
+def _format_label(template, env):
+    if not template:
+        return None
+    return template.format(**env)
+
+def _add(a, b):
+    return [a[0] + b[0], a[1] + b[1], a[2] + b[2]]
+
+def _rotate_yaw(offset, yaw_deg):
+    rad = math.radians(yaw_deg)
+    c, s = math.cos(rad), math.sin(rad)
+    return [offset[0] * c - offset[1] * s, offset[0] * s + offset[1] * c, offset[2]]
+
+# ============================================================
+# GENERATORS
+# ============================================================
+def _part_item(gen, part, pid, loc, rot, scale, intensity, attenuation, index, env):
+    """Build one plan item for a part from already-sampled values."""
+    label = _format_label(part.get("label"), env)
+    if part.get("kind") == "light":
+        item = {"id": pid, "type": "light", "loc": loc, "intensity": intensity, "label": label}
+        if part.get("color") is not None:
+            item["color"] = list(part["color"])
+        if attenuation is not None:
+            item["attenuation"] = attenuation
+    else:
+        materials = part.get("materials")
+        item = {
+            "id": pid,
+            "type": "mesh",
+            "mesh": part["mesh"],
+            "material": materials[index % len(materials)] if materials else part.get("material"),
+            "loc": loc,
+            "rot": rot,
+            "scale": scale,
+            "label": label,
+        }
+        if gen.get("instance"):
+            item["instance"] = True
+        if part.get("accent"):
+            item["accent"] = True
+    if gen.get("folder"):
+        item["folder"] = gen["folder"]
+    return item
+
+def _emit_parts(ctx, gen, item_id, loc, rot, index, env):
+    """Emit every part of a placement; parts share the placement transform."""
+    rng = ctx["rng"]
+    local = dict(env)
+    for key, value in (gen.get("vars") or {}).items():
+        local[key] = _sample(value, rng, local)
+    items = []
+    for p_idx, part in enumerate(_parts(gen)):
+        offset = _sample_vec(part.get("offset"), rng, local)
+        part_loc = _add(loc, _rotate_yaw(offset, rot[1]))
+        part_rot = _add(rot, _sample_rotation(part.get("rotation"), rng, local))
+        scale = intensity = attenuation = None
+        if part.get("kind") == "light":
+            intensity = float(_sample(part.get("intensity", 5000.0), rng, local))
+            if part.get("attenuation") is not None:
+                attenuation = float(_sample(part["attenuation"], rng, local))
+        else:
+            scale = _sample_scale(part.get("scale"), rng, local)
+        pid = item_id if p_idx == 0 else f"{item_id}/p{p_idx}"
+        items.append(_part_item(gen, part, pid, part_loc, part_rot, scale, intensity, attenuation, index, local))
+    return items
+
+def _gen_points(ctx, gen):
+    items = []
+    for i, point in enumerate(gen.get("points", [])):
+        loc = _sample_vec(point, ctx["rng"], ctx["env"])
+        rot = _sample_rotation(gen.get("rotation"), ctx["rng"], ctx["env"])
+        env = dict(ctx["env"], i=i, x=loc[0], y=loc[1])
+        items += _emit_parts(ctx, gen, f"{ctx['name']}/{i:04d}", loc, rot, i, env)
+    return items
+
+def _gen_scatter(ctx, gen):
+    rng = ctx["rng"]
+    count = int(_sample(gen.get("count", 1), rng, ctx["env"], integer=True))
+    extent = gen.get("extent", [1000.0, 1000.0])
+    center = gen.get("center", [0.0, 0.0, 0.0])
+    items = []
+    for i in range(count):
+        loc = [
+            center[0] + rng.uniform(-extent[0], extent[0]),
+            center[1] + rng.uniform(-extent[1], extent[1]),
+            center[2] + float(_sample(gen.get("z", 0.0), rng, ctx["env"])),
+        ]
+        rot = _sample_rotation(gen.get("rotation"), rng, ctx["env"])
+        env = dict(ctx["env"], i=i, x=loc[0], y=loc[1])
+        items += _emit_parts(ctx, gen, f"{ctx['name']}/{i:04d}", loc, rot, i, env)
+    return items
+
+def _gen_grid(ctx, gen):
+    rng = ctx["rng"]
+    range_x = gen.get("range_x", [0, 0])
+    range_y = gen.get("range_y", [0, 0])
+    spacing = float(_sample(gen.get("spacing", 100.0), rng, ctx["env"]))
+    origin = gen.get("origin", [0.0, 0.0, 0.0])
+    skip = gen.get("skip_center")
+    items = []
+    i = 0
+    for gx in range(int(range_x[0]), int(range_x[1]) + 1):
+        for gy in range(int(range_y[0]), int(range_y[1]) + 1):
+            if skip is not None and abs(gx) <= skip and abs(gy) <= skip:
+                continue
+            loc = [origin[0] + gx * spacing, origin[1] + gy * spacing, origin[2]]
+            rot = _sample_rotation(gen.get("rotation"), rng, ctx["env"])
+            env = dict(ctx["env"], i=i, gx=gx, gy=gy, x=loc[0], y=loc[1])
+            pattern_index = (gx + gy) if gen.get("pattern") == "checker" else i
+            items += _emit_parts(ctx, gen, f"{ctx['name']}/{gx}_{gy}", loc, rot, pattern_index, env)
+            i += 1
+    return items
+
+def _gen_ring(ctx, gen):
+    rng = ctx["rng"]
+    env = ctx["env"]
+    count = int(_sample(gen.get("count", 8), rng, env, integer=True))
+    radius = float(_sample(gen.get("radius", 1000.0), rng, env))
+    height = float(_sample(gen.get("height", 0.0), rng, env))
+    start = float(gen.get("angle_start", 0.0))
+    step = float(gen.get("angle_step", 360.0 / max(count, 1)))
+    items = []
+    for i in range(count):
+        ang = start + step * i
+        rad = math.radians(ang)
+        z = height + float(_sample(gen.get("z_jitter", 0.0), rng, env))
+        loc = [math.cos(rad) * radius, math.sin(rad) * radius, z]
+        rot = [0.0, ang + 90.0 if gen.get("face_tangent") else 0.0, 0.0]
+        local = dict(env, i=i, x=loc[0], y=loc[1], angle=ang)
+        items += _emit_parts(ctx, gen, f"{ctx['name']}/{i:04d}", loc, rot, i, local)
+    return items
+
+def _tower_items(ctx, gen, item_id, loc, footprint, height, strips, env):
+    label = _format_label(gen.get("label"), env)
+    tower = {
+        "id": item_id,
+        "type": "mesh",
+        "mesh": "cube",
+        "material": gen.get("material"),
+        "loc": loc,
+        "rot": [0.0, 0.0, 0.0],
+        "scale": [footprint[0], footprint[1], height],
+        "label": label,
+    }
+    items = [tower]
+    strip_materials = gen.get("strip_materials") or [gen.get("material")]
+    strip_spacing = float(gen.get("strip_spacing", 50.0))
+    for s in range(strips):
+        offset = (s - strips // 2) * footprint[0] * strip_spacing
+        items.append({
+            "id": f"{item_id}/strip{s}",
+            "type": "mesh",
+            "mesh": "cube",
+            "material": strip_materials[s % len(strip_materials)],
+            "loc": [loc[0] + offset, loc[1] + footprint[1] * 80.0, loc[2] + height * 50.0],
+            "rot": [0.0, 0.0, 0.0],
+            "scale": [0.1, 0.4, height * 2.0],
+            "label": f"{label}_Strip_{s}" if label else None,
+            "accent": True,
+        })
+    for item in items:
+        if gen.get("instance"):
+            item["instance"] = True
+        if gen.get("folder"):
+            item["folder"] = gen["folder"]
+    return items
+
+def _sample_strips(spec, rng):
+    """int -> fixed count; [lo, hi, p_hi] -> hi with probability p_hi else lo."""
+    if isinstance(spec, (list, tuple)):
+        lo, hi, p_hi = spec
+        return int(hi) if rng.random() > 1.0 - p_hi else int(lo)
+    return int(spec)
+
+def _gen_towers(ctx, gen):
+    rng = ctx["rng"]
+    env = ctx["env"]
+    items = []
+    if gen.get("layout", "grid") == "grid":
+        grid_range = int(_sample(gen.get("range", 4), rng, env, integer=True))
+        spacing = float(_sample(gen.get("spacing", 520.0), rng, env))
+        skip = gen.get("skip_center", 1)
+        for gx in range(-grid_range, grid_range + 1):
+            for gy in range(-grid_range, grid_range + 1):
+                if skip is not None and abs(gx) <= skip and abs(gy) <= skip:
+                    continue
+                loc = [gx * spacing, gy * spacing, 0.0]
+                height = rng.uniform(*gen["height"])
+                footprint = [rng.uniform(*gen["footprint"]), rng.uniform(*gen["footprint"])]
+                strips = _sample_strips(gen.get("strips", 2), rng)
+                local = dict(env, gx=gx, gy=gy, x=loc[0], y=loc[1])
+                items += _tower_items(ctx, gen, f"{ctx['name']}/{gx}_{gy}", loc, footprint, height, strips, local)
+    else:
+        count = int(_sample(gen.get("count", 10), rng, env, integer=True))
+        extent = gen.get("extent", [3000.0, 3000.0])
+        for i in range(count):
+            loc = [rng.uniform(-extent[0], extent[0]), rng.uniform(-extent[1], extent[1]), 0.0]
+            height = rng.uniform(*gen["height"])
+            footprint = [rng.uniform(*gen["footprint"]), rng.uniform(*gen["footprint"])]
+            strips = _sample_strips(gen.get("strips", 2), rng)
+            local = dict(env, i=i, x=loc[0], y=loc[1])
+            items += _tower_items(ctx, gen, f"{ctx['name']}/{i:04d}", loc, footprint, height, strips, local)
+    return items
+
+def _gen_traffic(ctx, gen):
+    """Moving meshes (cars/drones) and/or moving lights with bounded random velocity."""
+    rng = ctx["rng"]
+    env = ctx["env"]
+    count = int(_sample(gen.get("count", 10), rng, env, integer=True))
+    start = gen.get("start", {})
+    velocity = gen.get("velocity", {})
+    light = gen.get("light")
+    items = []
+    for i in range(count):
+        loc = [float(_sample(start.get(axis, 0.0), rng, env)) for axis in ("x", "y", "z")]
+        vel = [float(_sample(velocity.get(axis, 0.0), rng, env)) for axis in ("x", "y", "z")]
+        local = dict(env, i=i)
+        item_id = f"{ctx['name']}/{i:04d}"
+        if gen.get("mesh"):
+            items.append({
+                "id": item_id,
+                "type": "mover",
+                "mesh": gen["mesh"],
+                "material": gen.get("material"),
+                "loc": loc,
+                "scale": _sample_scale(gen.get("scale"), rng, local),
+                "velocity": vel,
+                "label": _format_label(gen.get("label"), local),
+            })
+        if light:
+            items.append({
+                "id": f"{item_id}/light" if gen.get("mesh") else item_id,
+                "type": "moving_light",
+                "loc": _add(loc, light.get("offset", [0.0, 0.0, 0.0])),
+                "velocity": vel,
+                "intensity": float(_sample(light.get("intensity", 5000.0), rng, local)),
+                "color_a": list(light["color_a"]),
+                "color_b": list(light.get("color_b", light["color_a"])),
+                "hue_speed": float(light.get("hue_speed", 0.5)),
+                "attenuation": float(light.get("attenuation", 1800.0)),
+                "label": _format_label(light.get("label"), local),
+            })
+    for item in items:
+        if gen.get("folder"):
+            item["folder"] = gen["folder"]
+    return items
+
+def _gen_grass(ctx, gen):
+    return [{
+        "id": f"{ctx['name']}/0000",
+        "type": "grass",
+        "loc": list(gen.get("center", [0.0, 0.0, 0.0])),
+        "material": gen.get("material"),
+        "rows": int(gen.get("rows", 12)),
+        "cols": int(gen.get("cols", 12)),
+        "spacing": float(gen.get("spacing", 80.0)),
+    }]
+
+GENERATORS = {
+    "points": _gen_points,
+    "scatter": _gen_scatter,
+    "grid": _gen_grid,
+    "ring": _gen_ring,
+    "towers": _gen_towers,
+    "traffic": _gen_traffic,
+    "grass": _gen_grass,
+}
+
+# ============================================================
+# NUMPY BACKEND
+# ============================================================
+def _np_scalar(value, rng, n, env=None, integer=False):
+    """Array version of _sample: one value per placement."""
+    if isinstance(value, str) and value.startswith("$"):
+        return np.broadcast_to(np.asarray(env[value[1:]], dtype=float), (n,))
+    if isinstance(value, (list, tuple)):
+        lo, hi = value[0], value[1]
+        if integer:
+            return rng.integers(int(lo), int(hi) + 1, size=n)
+        return rng.uniform(float(lo), float(hi), size=n)
+    return np.full(n, value if integer else float(value))
+
+def _np_one(value, rng, env=None, integer=False):
+    return _np_scalar(value, rng, 1, env, integer=integer)[0].item()
+
+def _np_vec(values, rng, n, env=None):
+    if values is None:
+        return np.zeros((n, 3))
+    return np.stack([_np_scalar(v, rng, n, env) for v in values], axis=1)
+
+def _np_scale(spec, rng, n, env=None):
+    if spec is None:
+        return np.ones((n, 3))
+    if isinstance(spec, dict):
+        if "uniform" in spec:
+            s = _np_scalar(spec["uniform"], rng, n, env)
+            return s[:, None] * np.asarray(spec.get("mul", [1.0, 1.0, 1.0]), dtype=float)
+        return np.stack([_np_scalar(spec.get(axis, 1.0), rng, n, env) for axis in ("x", "y", "z")], axis=1)
+    return _np_vec(spec, rng, n, env)
+
+def _np_rotation(spec, rng, n, env=None):
+    spec = spec or {}
+    return np.stack([_np_scalar(spec.get(axis, 0.0), rng, n, env) for axis in ("pitch", "yaw", "roll")], axis=1)
+
+def _np_rotate_yaw(offsets, yaw_deg):
+    rad = np.radians(yaw_deg)
+    c, s = np.cos(rad), np.sin(rad)
+    return np.stack([offsets[:, 0] * c - offsets[:, 1] * s, offsets[:, 0] * s + offsets[:, 1] * c, offsets[:, 2]], axis=1)
+
+def _parts_batch(ctx, gen, n, locs, rots, id_format, env_columns):
+    """Columnar record for n placements; every part field is sampled as one array."""
+    rng = ctx["rng"]
+    # Same lookup order as _emit_parts: spec vars, placement columns, generator vars.
+    local = dict(ctx["env"], **env_columns)
+    var_arrays = {}
+    for key, value in (gen.get("vars") or {}).items():
+        var_arrays[key] = local[key] = _np_scalar(value, rng, n, local)
+    columns = []
+    for part in _parts(gen):
+        offsets = _np_vec(part.get("offset"), rng, n, local)
+        col = {
+            "loc": locs + _np_rotate_yaw(offsets, rots[:, 1]),
+            "rot": rots + _np_rotation(part.get("rotation"), rng, n, local),
+        }
+        if part.get("kind") == "light":
+            col["intensity"] = _np_scalar(part.get("intensity", 5000.0), rng, n, local)
+            if part.get("attenuation") is not None:
+                col["attenuation"] = _np_scalar(part["attenuation"], rng, n, local)
+        else:
+            col["scale"] = _np_scale(part.get("scale"), rng, n, local)
+        columns.append(col)
+    env_columns = dict(env_columns, **var_arrays)
+    return {
+        "id": f"{ctx['name']}/*",
+        "type": "batch",
+        "expand": "parts",
+        "count": n * len(columns),
+        "gen": gen,
+        "env": ctx["env"],
+        "id_format": id_format,
+        "env_columns": env_columns,
+        "columns": columns,
+    }
+
+def _expand_parts(batch):
+    gen = batch["gen"]
+    parts = _parts(gen)
+    env_columns = {key: values.tolist() for key, values in batch["env_columns"].items()}
+    columns = [{key: values.tolist() for key, values in col.items()} for col in batch["columns"]]
+    n = len(env_columns["i"])
+    for i in range(n):
+        env = dict(batch["env"])
+        for key, values in env_columns.items():
+            env[key] = values[i]
+        item_id = batch["id_format"].format(**env)
+        for p_idx, (part, col) in enumerate(zip(parts, columns)):
+            pid = item_id if p_idx == 0 else f"{item_id}/p{p_idx}"
+            yield _part_item(
+                gen, part, pid, col["loc"][i], col["rot"][i], col.get("scale", [None] * n)[i],
+                col.get("intensity", [None] * n)[i], col.get("attenuation", [None] * n)[i],
+                env["i"], env
+            )
+
+def _gen_scatter_np(ctx, gen):
+    rng = ctx["rng"]
+    env = ctx["env"]
+    n = int(_np_one(gen.get("count", 1), rng, env, integer=True))
+    extent = np.asarray(gen.get("extent", [1000.0, 1000.0]), dtype=float)
+    center = np.asarray(gen.get("center", [0.0, 0.0, 0.0]), dtype=float)
+    locs = np.empty((n, 3))
+    locs[:, :2] = center[:2] + rng.uniform(-1.0, 1.0, size=(n, 2)) * extent
+    locs[:, 2] = center[2] + _np_scalar(gen.get("z", 0.0), rng, n, env)
+    rots = _np_rotation(gen.get("rotation"), rng, n, env)
+    env_columns = {"i": np.arange(n), "x": locs[:, 0], "y": locs[:, 1]}
+    return [_parts_batch(ctx, gen, n, locs, rots, ctx["name"] + "/{i:04d}", env_columns)]
+
+def _gen_ring_np(ctx, gen):
+    rng = ctx["rng"]
+    env = ctx["env"]
+    n = int(_np_one(gen.get("count", 8), rng, env, integer=True))
+    radius = float(_np_one(gen.get("radius", 1000.0), rng, env))
+    height = float(_np_one(gen.get("height", 0.0), rng, env))
+    step = float(gen.get("angle_step", 360.0 / max(n, 1)))
+    angles = float(gen.get("angle_start", 0.0)) + step * np.arange(n)
+    rad = np.radians(angles)
+    locs = np.stack([np.cos(rad) * radius, np.sin(rad) * radius, height + _np_scalar(gen.get("z_jitter", 0.0), rng, n, env)], axis=1)
+    rots = np.zeros((n, 3))
+    if gen.get("face_tangent"):
+        rots[:, 1] = angles + 90.0
+    env_columns = {"i": np.arange(n), "x": locs[:, 0], "y": locs[:, 1], "angle": angles}
+    return [_parts_batch(ctx, gen, n, locs, rots, ctx["name"] + "/{i:04d}", env_columns)]
+
+def _np_strips(spec, rng, n):
+    if isinstance(spec, (list, tuple)):
+        lo, hi, p_hi = spec
+        return np.where(rng.random(n) > 1.0 - p_hi, int(hi), int(lo))
+    return np.full(n, int(spec))
+
+def _gen_towers_np(ctx, gen):
+    rng = ctx["rng"]
+    if gen.get("layout", "grid") == "grid":
+        grid_range = int(_np_one(gen.get("range", 4), rng, ctx["env"], integer=True))
+        spacing = float(_np_one(gen.get("spacing", 520.0), rng, ctx["env"]))
+        axis = np.arange(-grid_range, grid_range + 1)
+        gx, gy = (a.ravel() for a in np.meshgrid(axis, axis, indexing="ij"))
+        skip = gen.get("skip_center", 1)
+        if skip is not None:
+            keep = (np.abs(gx) > skip) | (np.abs(gy) > skip)
+            gx, gy = gx[keep], gy[keep]
+        n = len(gx)
+        env_columns = {"gx": gx, "gy": gy, "x": gx * spacing, "y": gy * spacing}
+        id_format = ctx["name"] + "/{gx}_{gy}"
+    else:
+        n = int(_np_one(gen.get("count", 10), rng, ctx["env"], integer=True))
+        xy = rng.uniform(-1.0, 1.0, size=(n, 2)) * np.asarray(gen.get("extent", [3000.0, 3000.0]), dtype=float)
+        env_columns = {"i": np.arange(n), "x": xy[:, 0], "y": xy[:, 1]}
+        id_format = ctx["name"] + "/{i:04d}"
+    strips = _np_strips(gen.get("strips", 2), rng, n)
+    return [{
+        "id": f"{ctx['name']}/*",
+        "type": "batch",
+        "expand": "towers",
+        "count": int(n + strips.sum()),
+        "gen": gen,
+        "name": ctx["name"],
+        "env": ctx["env"],
+        "id_format": id_format,
+        "env_columns": env_columns,
+        "heights": rng.uniform(*gen["height"], size=n),
+        "footprints": rng.uniform(*gen["footprint"], size=(n, 2)),
+        "strips": strips,
+    }]
+
+def _expand_towers(batch):
+    env_columns = {key: values.tolist() for key, values in batch["env_columns"].items()}
+    heights = batch["heights"].tolist()
+    footprints = batch["footprints"].tolist()
+    strips = batch["strips"].tolist()
+    ctx = {"name": batch["name"], "env": batch["env"]}
+    for i in range(len(heights)):
+        env = dict(batch["env"])
+        for key, values in env_columns.items():
+            env[key] = values[i]
+        item_id = batch["id_format"].format(**env)
+        loc = [env["x"], env["y"], 0.0]
+        yield from _tower_items(ctx, batch["gen"], item_id, loc, footprints[i], heights[i], strips[i], env)
+
+BATCH_EXPANDERS = {
+    "parts": _expand_parts,
+    "towers": _expand_towers,
+}
+
+NUMPY_GENERATORS = {
+    "scatter": _gen_scatter_np,
+    "ring": _gen_ring_np,
+    "towers": _gen_towers_np,
+}
+
+# ============================================================
+# COMPILER
+# ============================================================
+def _environment_items(spec):
+    items = []
+    lighting = spec.get("lighting")
+    if lighting:
+        items.append({
+            "id": "env/sun",
+            "type": "sun",
+            "loc": [0.0, 0.0, 400.0],
+            "rot": [-45.0, 35.0, 0.0],
+            "color": list(lighting.get("sun_color", [1.0, 1.0, 1.0])),
+            "intensity": float(lighting.get("sun_intensity", 7.0)),
+        })
+        items.append({"id": "env/sky", "type": "skylight", "intensity": float(lighting.get("sky_intensity", 1.0))})
+        items.append({"id": "env/fog", "type": "fog"})
+    for idx, fog in enumerate(spec.get("fog", [])):
+        items.append({
+            "id": f"env/fog{idx + 1}",
+            "type": "fog",
+            "density": float(fog["density"]),
+            "falloff": float(fog["falloff"]),
+        })
+    ground = spec.get("ground")
+    if ground:
+        scale = float(ground.get("scale", 20.0))
+        items.append({
+            "id": "env/ground",
+            "type": "mesh",
+            "mesh": "plane",
+            "material": ground.get("material"),
+            "loc": list(ground.get("location", [0.0, 0.0, 0.0])),
+            "rot": [0.0, 0.0, 0.0],
+            "scale": [scale, scale, 1.0],
+            "label": ground.get("label"),
+        })
+    return items
+
+def compile_spec(spec, backend=None):
+    """Compile a spec into a spawn plan {name, seed, backend, spec_hash, palette, items[, tiles]}."""
+    backend = backend or DEFAULT_BACKEND
+    if backend == "numpy" and np is None:
+        raise ValueError("numpy backend requested but numpy is not installed")
+    errors = validate_spec(spec)
+    if errors:
+        raise ValueError(f"Invalid scene spec {spec.get('name')!r}: " + "; ".join(errors))
+    seed = spec.get("seed", 0)
+    env = dict(spec.get("vars") or {}, name=spec["name"])
+    items = _environment_items(spec)
+    for idx, gen in enumerate(spec.get("generators", [])):
+        name = gen.get("name", f"{gen['type']}{idx}")
+        np_fn = NUMPY_GENERATORS.get(gen["type"]) if backend == "numpy" else None
+        if np_fn:
+            ctx = {"name": name, "rng": np.random.default_rng(derive_seed(seed, name)), "env": env}
+            items += np_fn(ctx, gen)
+        else:
+            ctx = {"name": name, "rng": random.Random(derive_seed(seed, name)), "env": env}
+            items += GENERATORS[gen["type"]](ctx, gen)
+    plan = {
+        "name": spec["name"],
+        "seed": seed,
+        "backend": backend,
+        "spec_hash": spec_hash(spec),
+        "palette": spec.get("palette", {}),
+        "items": items,
+    }
+    if spec.get("tiles"):
+        plan["tiles"] = {
+            "size": float(spec["tiles"]["size"]),
+            "stream_distance": float(spec["tiles"].get("stream_distance", spec["tiles"]["size"])),
+        }
+    return plan
+
+def iter_items(plan):
+    """Yield plan items one by one, expanding numpy batch records lazily."""
+    for item in plan["items"]:
+        if item["type"] == "batch":
+            yield from BATCH_EXPANDERS[item["expand"]](item)
+        else:
+            yield item
+
+def item_count(plan):
+    return sum(item["count"] if item["type"] == "batch" else 1 for item in plan["items"])
+
+def _chunk_key(item_id):
+    parts = item_id.split("/")
+    if parts[0] == "env":
+        return "ground" if parts[-1] == "ground" else "lighting"
+    if len(parts) > 1 and "_" in parts[1]:
+        return f"{parts[0]} row {parts[1].split('_')[0]}"
+    return parts[0]
+
+def plan_chunks(plan, max_items=64):
+    """Yield (label, items) build phases: ground, lighting, each generator, tower grids by row.
+
+    Phases longer than max_items are split so a builder can report progress
+    and check for cancellation at least that often.
+    """
+    label = None
+    chunk = []
+    for item in iter_items(plan):
+        key = _chunk_key(item["id"])
+        if chunk and (key != label or len(chunk) >= max_items):
+            yield label, chunk
+            chunk = []
+        label = key
+        chunk.append(item)
+    if chunk:
+        yield label, chunk
+
+def tile_key(tx, ty):
+    """Asset-name-safe key for tile (tx, ty): (-1, 2) -> "m1_2"."""
+    return f"{'m' if tx < 0 else ''}{abs(tx)}_{'m' if ty < 0 else ''}{abs(ty)}"
+
+def _item_tile(item, size):
+    if item["type"] in PERSISTENT_ITEM_TYPES or item["id"].startswith("env/"):
+        return None
+    scale = item.get("scale") or [1.0, 1.0, 1.0]
+    if max(abs(scale[0]), abs(scale[1])) * SHAPE_SIZE_CM > size:
+        return None
+    loc = item.get("loc", [0.0, 0.0, 0.0])
+    return math.floor(loc[0] / size), math.floor(loc[1] / size)
+
+def plan_tiles(plan):
+    """Split a plan with a tiles section into [{"key", "items", "bounds"}].
+
+    The persistent entry comes first (bounds None), then one entry per
+    occupied tile in grid order with "coords" [tx, ty] and bounds
+    [[x0, y0, z0], [x1, y1, z1]]: the tile square plus the vertical extent of
+    its items. Each entry's items can be applied as their own plan.
+    """
+    size = plan["tiles"]["size"]
+    persistent = []
+    tiles = {}
+    for item in iter_items(plan):
+        coords = _item_tile(item, size)
+        if coords is None:
+            persistent.append(item)
+        else:
+            tiles.setdefault(coords, []).append(item)
+    result = [{"key": PERSISTENT_TILE, "items": persistent, "bounds": None}]
+    for (tx, ty), items in sorted(tiles.items()):
+        z_min = min(item["loc"][2] - abs(item.get("scale", [1.0, 1.0, 1.0])[2]) * SHAPE_SIZE_CM * 0.5 for item in items)
+        z_max = max(item["loc"][2] + abs(item.get("scale", [1.0, 1.0, 1.0])[2]) * SHAPE_SIZE_CM * 0.5 for item in items)
+        result.append({
+            "key": tile_key(tx, ty),
+            "coords": [tx, ty],
+            "items": items,
+            "bounds": [[tx * size, ty * size, z_min], [(tx + 1) * size, (ty + 1) * size, z_max]],
+        })
+    return result
+
+def item_hash(item, palette=None):
+    """Short content hash of an item (and its palette entry) for diffing against a level."""
+    data = {key: value for key, value in item.items() if key != "id"}
+    if palette and item.get("material") in palette:
+        data["palette"] = palette[item["material"]]
+    return hashlib.sha1(canonical_json(data).encode("utf-8")).hexdigest()[:12]
+
+# Pool start-up failures that mean "compile serially" rather than a bad spec
+# (spawn bootstrap errors and BrokenProcessPool are RuntimeErrors).
+_POOL_ERRORS = (OSError, ValueError, ImportError, RuntimeError)
+
+def _log_stderr(msg):
+    print(msg, file=sys.stderr)
+
+def _pool_error(exc):
+    cause = exc.__cause__ or exc.__context__
+    text = f"{type(exc).__name__}: {exc}"
+    return f"{text} (caused by {type(cause).__name__}: {cause})" if cause else text
+
+@contextlib.contextmanager
+def _worker_main():
+    """Present uat_plan_worker as __main__ while spawn workers start.
+
+    Spawned children re-import the parent's __main__ first; in the editor that
+    is a script importing `unreal`, which the standalone interpreter lacks.
+    """
+    import uat_plan_worker
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = uat_plan_worker
+    try:
+        yield uat_plan_worker
+    finally:
+        if main is None:
+            sys.modules.pop("__main__", None)
+        else:
+            sys.modules["__main__"] = main
+
+def _start_pool(specs, workers, executable, backend):
+    """Start a spawn pool and submit every spec; returns (pool, futures)."""
+    ctx = multiprocessing.get_context("spawn")
+    if executable:
+        ctx.set_executable(executable)
+    pool = concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(specs)), mp_context=ctx)
+    try:
+        # Spawn pools start their workers from submit(), so every submit runs
+        # with the worker entry module as __main__.
+        with _worker_main() as worker:
+            futures = [pool.submit(worker.compile_plan, spec, backend) for spec in specs]
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    return pool, futures
+
+def compile_plans(specs, workers=0, executable=None, backend=None, poll=None, log=None):
+    """Yield (index, plan) in submission order, compiling in a process pool when workers > 0.
+
+    Plans are yielded as soon as the next one in order is ready, so the caller
+    can apply it while later specs are still compiling. Seeds derive from each
+    spec, never from process state, so pooled and serial plans are identical.
+    `executable` is the Python interpreter for the spawned workers (inside the
+    editor sys.executable is the editor itself). With `poll` (seconds) the
+    generator yields None whenever the next plan is not ready within that wait,
+    so a build job can keep the editor responsive instead of blocking on a
+    worker. If the pool cannot start or its workers die, `log` (default stderr)
+    gets the reason and the remaining specs compile serially; errors raised by
+    compile_spec itself propagate as they would serially.
+    """
+    specs = list(specs)
+    log = log or _log_stderr
+    pool = None
+    futures = []
+    if workers and len(specs) > 1:
+        try:
+            pool, futures = _start_pool(specs, workers, executable, backend)
+        except _POOL_ERRORS as exc:
+            log(f"Plan worker pool failed to start ({_pool_error(exc)}); compiling {len(specs)} spec(s) serially")
+            pool = None
+    if pool is None:
+        for idx, spec in enumerate(specs):
+            yield idx, compile_spec(spec, backend)
+        return
+    serial_from = len(specs)
+    try:
+        for idx, future in enumerate(futures):
+            if poll is not None:
+                while not concurrent.futures.wait([future], timeout=poll).done:
+                    yield None
+            try:
+                plan = future.result()
+            except concurrent.futures.process.BrokenProcessPool as exc:
+                log(f"Plan workers died ({_pool_error(exc)}); compiling the last {len(specs) - idx} spec(s) serially")
+                serial_from = idx
+                break
+            yield idx, plan
+    finally:
+        pool.shutdown(wait=serial_from == len(specs), cancel_futures=True)
+    for idx in range(serial_from, len(specs)):
+        yield idx, compile_spec(specs[idx], backend)
+
+# ============================================================
+# SCIFI VARIANTS
+# ============================================================
+def scifi_variant_styles():
+    return load_spec("scifi_variant_styles")["styles"]
+
+def _span(value, k):
+    """Scale a distance (number, [lo, hi] or {"x", "y", ...} axes) by k."""
+    if isinstance(value, dict):
+        return {axis: _span(v, k) if axis in ("x", "y") else v for axis, v in value.items()}
+    if isinstance(value, list):
+        return [v * k for v in value]
+    return value * k
+
+def _many(value, k):
+    """Scale a count (int or [lo, hi]) by k, keeping ints."""
+    if isinstance(value, list):
+        return [max(1, int(round(v * k))) for v in value]
+    return max(1, int(round(value * k)))
+
+def scifi_variant_spec(style, name=None, area_scale=1.0, tiles=None):
+    """Spec for one Codex_Scifi_Variant level from a style row (palette + seed).
+
+    area_scale grows the city footprint (extents and radii by its square root,
+    scattered counts by the full factor); tiles adds a tiles section so large
+    cities stream as grid sub-levels.
+    """
+    lin = math.sqrt(area_scale)
+    a = list(style["a"])
+    b = list(style["b"])
+    sid = style["id"]
+    spec = {
+        "name": name or f"Codex_Scifi_{style['label']}",
+        "seed": style["seed"],
+        "vars": {"label": style["label"]},
+        "palette": {
+            "base": {"alias": f"M_UAT_Scifi_Base_{sid}", "kind": "lit", "color": list(style["base"])},
+            "accent_a": {"alias": f"M_UAT_Scifi_A_{sid}", "kind": "emissive", "color": a, "boost": 10.0},
+            "accent_b": {"alias": f"M_UAT_Scifi_B_{sid}", "kind": "emissive", "color": b, "boost": 12.0},
+            "water": {"alias": f"M_UAT_Scifi_Water_{sid}", "kind": "emissive", "color": list(style["water"]), "boost": 2.2},
+            "car": {"alias": f"M_UAT_Scifi_Car_{sid}", "kind": "emissive", "color": a, "boost": 12.0},
+            "drone": {"alias": f"M_UAT_Scifi_Drone_{sid}", "kind": "emissive", "color": b, "boost": 10.0},
+        },
+        "lighting": {"sun_color": list(style["sun"]), "sun_intensity": style["sun_i"], "sky_intensity": style["sky_i"]},
+        "ground": {"material": "base", "scale": 90.0 * lin},
+        "fog": [{"density": style["fog_d"], "falloff": style["fog_f"]}],
+        "generators": [
+            {
+                "type": "points", "name": "water",
+                "points": [[0.0, 0.0, -12.0]],
+                "parts": [{"mesh": "plane", "material": "water", "scale": [82.0 * lin, 82.0 * lin, 1.0], "label": "WaterPlane"}],
+            },
+            {
+                "type": "towers", "name": "grid_towers", "layout": "grid", "instance": True,
+                "range": _many([4, 6], lin), "spacing": [480.0, 620.0], "skip_center": 1,
+                "height": [5.0, 14.0], "footprint": [0.6, 1.7], "strips": [1, 2, 0.65], "strip_spacing": 55.0,
+                "material": "base", "strip_materials": ["accent_a", "accent_b"],
+                "label": "{label}_Tower_{x}_{y}",
+            },
+            {
+                "type": "towers", "name": "extra_towers", "layout": "scatter", "instance": True,
+                "count": _many([18, 40], area_scale), "extent": _span([3000.0, 3000.0], lin),
+                "height": [6.0, 18.0], "footprint": [0.5, 1.5], "strips": 2, "strip_spacing": 55.0,
+                "material": "base", "strip_materials": ["accent_a", "accent_b"],
+                "label": "{label}_Tower_{x}_{y}",
+            },
+            {
+                "type": "ring", "name": "horizon_lights",
+                "count": _many([12, 20], lin), "radius": _span([2800.0, 3400.0], lin), "height": [560.0, 820.0],
+                "parts": [{"kind": "light", "intensity": [8000.0, 14000.0], "color": a}],
+            },
+            {
+                "type": "scatter", "name": "bridges", "instance": True,
+                "count": _many([3, 6], area_scale), "extent": _span([900.0, 900.0], lin), "z": [480.0, 720.0],
+                "rotation": {"yaw": [-30.0, 30.0]}, "vars": {"length": [14.0, 24.0]},
+                "parts": [
+                    {"mesh": "plane", "material": "base", "scale": ["$length", 0.8, 0.25], "label": "{label}_Bridge_{i}"},
+                    {"mesh": "plane", "material": "accent_a", "offset": [0.0, 0.0, 50.0], "scale": ["$length", 0.08, 0.1], "label": "{label}_Bridge_{i}_Rail"},
+                ],
+            },
+            {
+                "type": "scatter", "name": "highways", "instance": True,
+                "count": _many([3, 5], area_scale), "extent": _span([1400.0, 1400.0], lin), "z": [420.0, 620.0],
+                "rotation": {"yaw": [-35.0, 35.0]},
+                "parts": [{"mesh": "plane", "materials": ["accent_b", "accent_a"], "scale": [[18.0, 32.0], 0.9, 0.25], "label": "{label}_Highway_{i}"}],
+            },
+            {
+                "type": "ring", "name": "signs", "face_tangent": True,
+                "count": _many([12, 22], lin), "radius": _span([1700.0, 2400.0], lin), "height": [620.0, 780.0], "z_jitter": [-140.0, 140.0],
+                "parts": [
+                    {"mesh": "plane", "materials": ["accent_b", "accent_a"], "scale": [[1.4, 3.2], 0.35, 1.0], "rotation": {"roll": [-6.0, 6.0]}, "label": "{label}_Sign_{i}"},
+                    {"kind": "light", "offset": [0.0, 0.0, 150.0], "intensity": [8000.0, 11000.0], "color": b},
+                ],
+            },
+            {
+                "type": "traffic", "name": "moving_lights",
+                "count": _many([12, 22], area_scale),
+                "start": _span({"x": [-1800.0, 1800.0], "y": [-1800.0, 1800.0], "z": [260.0, 980.0]}, lin),
+                "velocity": {"x": [-260.0, 260.0], "y": [-260.0, 260.0], "z": [-120.0, 120.0]},
+                "light": {"intensity": [5500.0, 9800.0], "color_a": a, "color_b": b, "hue_speed": 0.6, "attenuation": 1600.0, "label": "{label}_MovingLight_{i}"},
+            },
+            {
+                "type": "traffic", "name": "cars",
+                "count": _many([18, 35], area_scale), "mesh": "plane", "material": "car", "scale": [0.9, 2.6, 0.35],
+                "start": _span({"x": -3600.0, "y": [-1800.0, 1800.0], "z": [320.0, 1200.0]}, lin),
+                "velocity": {"x": [650.0, 1150.0], "y": [-180.0, 180.0], "z": [-80.0, 80.0]},
+                "label": "{label}_Car_{i}",
+            },
+            {
+                "type": "traffic", "name": "drones",
+                "count": _many([12, 26], area_scale), "mesh": "sphere", "material": "drone", "scale": [0.5, 0.5, 0.5],
+                "start": _span({"x": [-2200.0, 2200.0], "y": [-2200.0, 2200.0], "z": [520.0, 1400.0]}, lin),
+                "velocity": {"x": [-260.0, 260.0], "y": [-260.0, 260.0], "z": [-90.0, 90.0]},
+                "label": "{label}_Drone_{i}",
+            },
+        ],
+    }
+    if tiles:
+        spec["tiles"] = dict(tiles)
+    return spec
@@ -0,0 +1,208 @@
+"""One Slate post-tick callback that runs every UAT tick system.
+
+Systems (listener drain, build jobs, motion, lights, rotation, ...) register
+by name with a priority, a time budget and an optional rate. Each editor
+frame the scheduler runs them in priority order; once FRAME_BUDGET_MS is
+spent, the remaining systems wait for the next frame and keep their elapsed
+time, so a system always receives the real time since it last ran.
+
+Registering a name again replaces its callback, so re-executing a script
+that registers its ticks does not stack callbacks. Long-running systems can
+poll time_left() to stop inside their own budget.
+"""
+import collections
+import time
+
+import unreal
+
+# Python time per editor frame before lower-priority systems are deferred.
+FRAME_BUDGET_MS = 8.0
+# A deferred system runs anyway after this many frames in a row.
+MAX_DEFER_FRAMES = 4
+# A system is disabled after this many consecutive exceptions.
+MAX_CONSECUTIVE_ERRORS = 10
+# Rolling window (runs) for per-system timing stats.
+STATS_WINDOW = 240
+
+
+class _System:
+    __slots__ = (
+        "name", "fn", "priority", "budget_ms", "hz", "enabled",
+        "pending", "defer_run", "failures",
+        "runs", "deferred", "over_budget", "errors", "samples",
+    )
+
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.priority = 100
+        self.budget_ms = 2.0
+        self.hz = 0.0
+        self.enabled = True
+        self.pending = 0.0
+        self.defer_run = 0
+        self.failures = 0
+        self.runs = 0
+        self.deferred = 0
+        self.over_budget = 0
+        self.errors = 0
+        self.samples = collections.deque(maxlen=STATS_WINDOW)
+
+
+# importlib.reload re-runs this file in the same module dict; keep the live
+# registry and Slate handle so a reload cannot leave an orphaned callback.
+_systems = globals().get("_systems") or {}
+_order = globals().get("_order") or []
+_tick_handle = globals().get("_tick_handle")
+_frame_samples = globals().get("_frame_samples") or collections.deque(maxlen=STATS_WINDOW)
+_deadline = None
+
+
+def _log(msg):
+    unreal.log(f"[UAT] {msg}")
+
+
+def register(name, fn, priority=100, budget_ms=2.0, hz=0.0, enabled=True):
+    """Add or replace tick system name; fn(delta_seconds) runs once per frame, or at hz when hz > 0."""
+    global _tick_handle, _order
+    system = _systems.get(name)
+    if system is None:
+        system = _systems[name] = _System(name, fn)
+    system.fn = fn
+    system.priority = priority
+    system.budget_ms = float(budget_ms)
+    system.hz = float(hz or 0.0)
+    system.enabled = enabled
+    _order = sorted(_systems.values(), key=lambda s: (s.priority, s.name))
+    if _tick_handle is None:
+        _tick_handle = unreal.register_slate_post_tick_callback(_tick)
+    return system
+
+
+def unregister(name):
+    """Remove tick system name; the Slate callback goes away with the last system."""
+    global _tick_handle, _order
+    if _systems.pop(name, None) is None:
+        return False
+    _order = [s for s in _order if s.name != name]
+    if not _systems and _tick_handle is not None:
+        unreal.unregister_slate_post_tick_callback(_tick_handle)
+        _tick_handle = None
+    return True
+
+
+def is_registered(name):
+    return name in _systems
+
+
+def set_enabled(name, enabled):
+    """Pause or resume a system; a paused system drops the time that passes meanwhile."""
+    system = _systems.get(name)
+    if system is None:
+        return False
+    system.enabled = bool(enabled)
+    system.pending = 0.0
+    system.failures = 0
+    return True
+
+
+def time_left():
+    """Seconds left in the running system's budget (inf outside the scheduler)."""
+    if _deadline is None:
+        return float("inf")
+    return _deadline - time.perf_counter()
+
+
+def _tick(delta_seconds):
+    global _deadline
+    frame_start = time.perf_counter()
+    frame_end = frame_start + FRAME_BUDGET_MS / 1000.0
+    ran = False
+    for system in _order:
+        if _systems.get(system.name) is not system:
+            # Unregistered by a system that ran earlier this frame.
+            continue
+        if not system.enabled:
+            continue
+        system.pending += delta_seconds
+        if system.hz > 0.0 and system.pending < 1.0 / system.hz:
+            continue
+        start = time.perf_counter()
+        if ran and start >= frame_end and system.defer_run < MAX_DEFER_FRAMES:
+            system.deferred += 1
+            system.defer_run += 1
+            continue
+        elapsed = system.pending
+        system.pending = 0.0
+        system.defer_run = 0
+        _deadline = start + system.budget_ms / 1000.0
+        try:
+            system.fn(elapsed)
+            system.failures = 0
+        except Exception as exc:
+            system.errors += 1
+            system.failures += 1
+            unreal.log_error(f"[UAT] Tick system {system.name} failed: {exc}")
+            if system.failures >= MAX_CONSECUTIVE_ERRORS:
+                system.enabled = False
+                _log(f"Tick system {system.name} disabled after {system.failures} consecutive errors")
+        finally:
+            _deadline = None
+        ms = (time.perf_counter() - start) * 1000.0
+        system.runs += 1
+        system.samples.append(ms)
+        if ms > system.budget_ms:
+            system.over_budget += 1
+        ran = True
+    if ran:
+        _frame_samples.append((time.perf_counter() - frame_start) * 1000.0)
+
+
+def _timing(samples):
+    if not samples:
+        return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    return {
+        "avg_ms": round(sum(ordered) / len(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def stats():
+    """Per-system config, counters and rolling timings, plus whole-frame timings."""
+    systems = {}
+    for system in _order:
+        entry = {
+            "priority": system.priority,
+            "enabled": system.enabled,
+            "hz": system.hz,
+            "budget_ms": system.budget_ms,
+            "runs": system.runs,
+            "deferred": system.deferred,
+            "over_budget": system.over_budget,
+            "errors": system.errors,
+        }
+        entry.update(_timing(system.samples))
+        systems[system.name] = entry
+    frame = {"budget_ms": FRAME_BUDGET_MS, "frames": len(_frame_samples)}
+    frame.update(_timing(_frame_samples))
+    return {"registered": _tick_handle is not None, "frame": frame, "systems": systems}
+
+
+def log_stats():
+    data = stats()
+    frame = data["frame"]
+    _log(
+        f"Tick scheduler: {len(data['systems'])} systems, frame avg {frame['avg_ms']:.2f} ms, "
+        f"p95 {frame['p95_ms']:.2f} ms, max {frame['max_ms']:.2f} ms (budget {frame['budget_ms']:.1f} ms)"
+    )
+    for name, entry in data["systems"].items():
+        rate = f"{entry['hz']:.0f} Hz" if entry["hz"] else "every frame"
+        state = "" if entry["enabled"] else " [disabled]"
+        _log(
+            f"  {name}{state}: prio {entry['priority']}, {rate}, avg {entry['avg_ms']:.2f} ms, "
+            f"p95 {entry['p95_ms']:.2f} ms, max {entry['max_ms']:.2f} ms / budget {entry['budget_ms']:.1f} ms, "
+            f"runs {entry['runs']}, over budget {entry['over_budget']}, deferred {entry['deferred']}, errors {entry['errors']}"
+        )
+    return data
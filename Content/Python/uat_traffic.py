@@ -0,0 +1,216 @@
+"""Lane-based traffic for the scifi city builders.
+
+A lane is a closed Catmull-Rom spline through a list of (x, y, z) points,
+resampled at a fixed arc-length step so position_at(distance) is one index
+and one lerp. Vehicles are (distance, speed) pairs kept sorted per lane;
+spacing is enforced by walking that order once per step, so each vehicle
+costs the same no matter how many share the lane.
+
+Like uat_scene_spec.py this module has no `unreal` dependency: the editor
+side (uat_one_click.build_traffic_lanes) turns highway/bridge actors into
+lane points and pushes the returned transforms to actors.
+"""
+import bisect
+import math
+
+# ============================================================
+# SPLINES
+# ============================================================
+def _catmull_rom(p0, p1, p2, p3, t):
+    t2 = t * t
+    t3 = t2 * t
+    return tuple(
+        0.5 * (
+            2.0 * p1[i]
+            + (p2[i] - p0[i]) * t
+            + (2.0 * p0[i] - 5.0 * p1[i] + 4.0 * p2[i] - p3[i]) * t2
+            + (3.0 * p1[i] - p0[i] - 3.0 * p2[i] + p3[i]) * t3
+        )
+        for i in range(3)
+    )
+
+def catmull_rom_loop(points, samples_per_segment=16):
+    """Dense polyline of the closed Catmull-Rom spline through points (first point repeated at the end)."""
+    n = len(points)
+    dense = []
+    for i in range(n):
+        p0, p1, p2, p3 = points[i - 1], points[i], points[(i + 1) % n], points[(i + 2) % n]
+        for k in range(samples_per_segment):
+            dense.append(_catmull_rom(p0, p1, p2, p3, k / samples_per_segment))
+    dense.append(dense[0])
+    return dense
+
+def loop_points(start, end, offset, samples=4):
+    """Points of an out-and-back loop: start -> end on one side of the axis, back on the other.
+
+    offset is the lateral (x, y, z) shift of each carriageway from the axis.
+    Intermediate points keep the Catmull-Rom curve straight between the ends.
+    """
+    out = []
+    back = []
+    for k in range(samples + 1):
+        t = k / samples
+        mid = tuple(start[i] + (end[i] - start[i]) * t for i in range(3))
+        out.append(tuple(mid[i] + offset[i] for i in range(3)))
+        back.append(tuple(mid[i] - offset[i] for i in range(3)))
+    return out + back[::-1]
+
+# ============================================================
+# LANES
+# ============================================================
+class Lane:
+    """Closed lane with a uniform arc-length lookup table."""
+
+    __slots__ = ("name", "length", "step", "samples", "yaws")
+
+    def __init__(self, name, points, sample_cm=25.0, samples_per_segment=16):
+        self.name = name
+        dense = catmull_rom_loop(points, samples_per_segment)
+        cumulative = [0.0]
+        for a, b in zip(dense, dense[1:]):
+            cumulative.append(cumulative[-1] + math.dist(a, b))
+        self.length = cumulative[-1]
+        count = max(2, int(self.length / sample_cm))
+        self.step = self.length / count
+        # Resample so sample k sits at arc length k * step.
+        self.samples = []
+        j = 0
+        for k in range(count + 1):
+            s = min(k * self.step, self.length)
+            while j < len(cumulative) - 2 and cumulative[j + 1] < s:
+                j += 1
+            span = cumulative[j + 1] - cumulative[j]
+            t = (s - cumulative[j]) / span if span > 0.0 else 0.0
+            a, b = dense[j], dense[j + 1]
+            self.samples.append(tuple(a[i] + (b[i] - a[i]) * t for i in range(3)))
+        self.yaws = [
+            math.degrees(math.atan2(b[1] - a[1], b[0] - a[0]))
+            for a, b in zip(self.samples, self.samples[1:])
+        ]
+        self.yaws.append(self.yaws[0])
+
+    def position_at(self, distance):
+        """(x, y, z, yaw_deg) at arc length distance (wrapped onto the loop)."""
+        s = distance % self.length
+        k = int(s / self.step)
+        if k >= len(self.yaws) - 1:
+            k = len(self.yaws) - 2
+        t = s / self.step - k
+        a = self.samples[k]
+        b = self.samples[k + 1]
+        return (
+            a[0] + (b[0] - a[0]) * t,
+            a[1] + (b[1] - a[1]) * t,
+            a[2] + (b[2] - a[2]) * t,
+            self.yaws[k],
+        )
+
+    def loop_path(self, start, count, height=0.0):
+        """count + 1 (x, y, z, yaw_deg) keys at equal arc length once around the loop from start.
+
+        The last key is back on the first position. Yaw is unwrapped (each key
+        within 180 degrees of the previous one), so linear interpolation
+        between keys turns the short way and a full lap ends 360 degrees on.
+        """
+        path = []
+        previous = None
+        for k in range(count + 1):
+            x, y, z, yaw = self.position_at(start + self.length * k / count)
+            if previous is not None:
+                yaw = previous + (yaw - previous + 180.0) % 360.0 - 180.0
+            path.append((x, y, z + height, yaw))
+            previous = yaw
+        return path
+
+# ============================================================
+# TRAFFIC
+# ============================================================
+class Vehicle:
+    __slots__ = ("key", "distance", "speed", "height")
+
+    def __init__(self, key, distance, speed, height=0.0):
+        self.key = key
+        self.distance = distance
+        self.speed = speed
+        self.height = height
+
+class Traffic:
+    """Vehicles on lanes, kept sorted by distance per lane."""
+
+    def __init__(self, min_gap_cm=400.0):
+        self.min_gap = min_gap_cm
+        self.lanes = []
+        self.vehicles = []
+
+    def add_lane(self, lane):
+        self.lanes.append(lane)
+        self.vehicles.append([])
+        return len(self.lanes) - 1
+
+    def add_vehicle(self, lane_index, key, distance, speed, height=0.0):
+        lane = self.lanes[lane_index]
+        queue = self.vehicles[lane_index]
+        vehicle = Vehicle(key, distance % lane.length, speed, height)
+        bisect.insort(queue, vehicle, key=lambda v: v.distance)
+        return vehicle
+
+    def remove(self, keys):
+        keys = set(keys)
+        for index, queue in enumerate(self.vehicles):
+            self.vehicles[index] = [v for v in queue if v.key not in keys]
+
+    def lap_seconds(self, lane_index):
+        """Time for one lap at the mean speed of the lane's vehicles (0.0 for an empty lane).
+
+        Baked movement cannot hold gaps, so a baked lane runs every vehicle at
+        this shared speed and keeps the current spacing.
+        """
+        queue = self.vehicles[lane_index]
+        if not queue:
+            return 0.0
+        speed = sum(v.speed for v in queue) / len(queue)
+        return self.lanes[lane_index].length / speed if speed > 0.0 else 0.0
+
+    def vehicle_count(self):
+        return sum(len(queue) for queue in self.vehicles)
+
+    def step(self, delta_seconds):
+        """Advance every vehicle and return [(key, x, y, z, yaw_deg)].
+
+        Vehicles move at their own speed but never closer than min_gap to the
+        one ahead on the loop, so overtaking is impossible and the per-lane
+        order only changes when a vehicle wraps past the lane start.
+        """
+        out = []
+        for lane, queue in zip(self.lanes, self.vehicles):
+            if not queue:
+                continue
+            length = lane.length
+            gap = min(self.min_gap, length / (len(queue) + 1))
+            # Front to back; the leader is limited by the last vehicle one lap ahead.
+            limit = queue[0].distance + length - gap
+            for vehicle in reversed(queue):
+                vehicle.distance = min(vehicle.distance + vehicle.speed * delta_seconds, limit)
+                limit = vehicle.distance - gap
+            # Keep distances on [0, length): leaders past the end wrap to the
+            # front, followers held back behind the start wrap to the back.
+            wrapped = 0
+            while wrapped < len(queue) and queue[-1 - wrapped].distance >= length:
+                wrapped += 1
+            if wrapped:
+                moved = queue[len(queue) - wrapped:]
+                for vehicle in moved:
+                    vehicle.distance -= length
+                queue[:] = moved + queue[:len(queue) - wrapped]
+            held = 0
+            while held < len(queue) and queue[held].distance < 0.0:
+                held += 1
+            if held:
+                moved = queue[:held]
+                for vehicle in moved:
+                    vehicle.distance += length
+                queue[:] = queue[held:] + moved
+            for vehicle in queue:
+                x, y, z, yaw = lane.position_at(vehicle.distance)
+                out.append((vehicle.key, x, y, z + vehicle.height, yaw))
+        return out